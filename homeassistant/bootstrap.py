@@ -250,6 +250,7 @@ async def load_registries(hass: core.HomeAssistant) -> None:
         issue_registry.async_load(hass),
         hass.async_add_executor_job(_cache_uname_processor),
         template.async_load_custom_templates(hass),
+        template.async_load_code_cache(hass),
         restore_state.async_load(hass),
     )
 
@@ -583,6 +584,12 @@ async def _async_set_up_integrations(
 
     _LOGGER.info("Domains to be set up: %s", domains_to_setup)
 
+    # Import the integrations in the background while they are set up
+    hass.async_create_task(
+        loader.async_preimport_integrations(hass, integration_cache),
+        "preimport integrations",
+    )
+
     # Initialize recorder
     if "recorder" in domains_to_setup:
         recorder.async_initialize_recorder(hass)
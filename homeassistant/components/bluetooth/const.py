@@ -40,6 +40,13 @@ FALLBACK_MAXIMUM_STALE_ADVERTISEMENT_SECONDS: Final = 60 * 15
 # than BlueZ's.
 CONNECTABLE_FALLBACK_MAXIMUM_STALE_ADVERTISEMENT_SECONDS: Final = 195
 
+# The time an advertisement which was rejected in favor of the advertisement
+# from a different source is remembered. Unchanged advertisements from the
+# rejected source are dropped without comparing them again as long as the
+# preferred source keeps advertising, so a better source may take up to this
+# long to be switched to.
+DUPLICATE_ADVERTISEMENT_WINDOW_SECONDS: Final = 5
+
 
 # We must recover before we hit the 180s mark
 # where the device is removed from the stack
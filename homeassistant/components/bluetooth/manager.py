@@ -35,6 +35,7 @@ from .advertisement_tracker import (
 )
 from .base_scanner import BaseHaScanner, BluetoothScannerDevice
 from .const import (
+    DUPLICATE_ADVERTISEMENT_WINDOW_SECONDS,
     FALLBACK_MAXIMUM_STALE_ADVERTISEMENT_SECONDS,
     UNAVAILABLE_TRACK_SECONDS,
 )
@@ -114,6 +115,9 @@ class BluetoothManager:
         "_bleak_callbacks",
         "_all_history",
         "_connectable_history",
+        "_rejected_advertisements",
+        "_duplicate_advertisements",
+        "_forwarded_advertisements",
         "_non_connectable_scanners",
         "_connectable_scanners",
         "_adapters",
@@ -153,6 +157,12 @@ class BluetoothManager:
         ] = []
         self._all_history: dict[str, BluetoothServiceInfoBleak] = {}
         self._connectable_history: dict[str, BluetoothServiceInfoBleak] = {}
+        # The times advertisements of an address were rejected per source
+        self._rejected_advertisements: dict[str, dict[str, float]] = {}
+        # The advertisements dropped as duplicates and forwarded to the
+        # matchers and callbacks per source
+        self._duplicate_advertisements: dict[str, int] = {}
+        self._forwarded_advertisements: dict[str, int] = {}
         self._non_connectable_scanners: list[BaseHaScanner] = []
         self._connectable_scanners: list[BaseHaScanner] = []
         self._adapters: dict[str, AdapterDetails] = {}
@@ -195,6 +205,15 @@ class BluetoothManager:
                 service_info.as_dict() for service_info in self._all_history.values()
             ],
             "advertisement_tracker": self._advertisement_tracker.async_diagnostics(),
+            "advertisement_deduplication": {
+                source: {
+                    "duplicate": self._duplicate_advertisements.get(source, 0),
+                    "forwarded": self._forwarded_advertisements.get(source, 0),
+                }
+                for source in itertools.chain(
+                    self._duplicate_advertisements, self._forwarded_advertisements
+                )
+            },
         }
 
     def _find_adapter_by_address(self, address: str) -> str | None:
@@ -356,6 +375,7 @@ class BluetoothManager:
                     # the device from all the interval tracking since it is no longer
                     # available for both connectable and non-connectable
                     tracker.async_remove_address(address)
+                    self._rejected_advertisements.pop(address, None)
                     self._integration_matcher.async_clear_address(address)
                     self._async_dismiss_discoveries(address)
 
@@ -466,8 +486,30 @@ class BluetoothManager:
         #                       scanners with the best advertisement from each
         #                       connectable scanner
         #
+        old_service_info = all_history.get(address)
+        if (
+            old_service_info
+            and source != old_service_info.source
+            and (rejected := self._rejected_advertisements.get(address))
+            and (rejected_time := rejected.get(source))
+            # The preferred source kept advertising since the rejection
+            and old_service_info.time >= rejected_time
+            and service_info.time - rejected_time
+            < DUPLICATE_ADVERTISEMENT_WINDOW_SECONDS
+            and service_info.manufacturer_data == old_service_info.manufacturer_data
+            and service_info.service_data == old_service_info.service_data
+            and service_info.service_uuids == old_service_info.service_uuids
+            and service_info.name == old_service_info.name
+        ):
+            # Fast path for the unchanged advertisements of a device heard
+            # by multiple scanners, the advertisement from this source was
+            # rejected a moment ago and would be rejected again
+            duplicates = self._duplicate_advertisements
+            duplicates[source] = duplicates.get(source, 0) + 1
+            return
+
         if (
-            (old_service_info := all_history.get(address))
+            old_service_info
             and source != old_service_info.source
             and (scanner := self._sources.get(old_service_info.source))
             and scanner.scanning
@@ -500,10 +542,13 @@ class BluetoothManager:
                         )
                     )
                 ):
+                    self._async_reject_advertisement(service_info)
                     return
 
                 connectable_history[address] = service_info
+                return
 
+            self._async_reject_advertisement(service_info)
             return
 
         if connectable:
@@ -536,8 +581,13 @@ class BluetoothManager:
                 or service_info.name != old_service_info.name
             )
         ):
+            duplicates = self._duplicate_advertisements
+            duplicates[source] = duplicates.get(source, 0) + 1
             return
 
+        forwarded = self._forwarded_advertisements
+        forwarded[source] = forwarded.get(source, 0) + 1
+
         if not connectable and old_connectable_service_info:
             # Since we have a connectable path and our BleakClient will
             # route any connection attempts to the connectable path, we
@@ -591,6 +641,16 @@ class BluetoothManager:
                 service_info,
             )
 
+    @hass_callback
+    def _async_reject_advertisement(
+        self, service_info: BluetoothServiceInfoBleak
+    ) -> None:
+        """Remember an advertisement was rejected for a different source."""
+        address = service_info.address
+        if (rejected := self._rejected_advertisements.get(address)) is None:
+            rejected = self._rejected_advertisements[address] = {}
+        rejected[service_info.source] = service_info.time
+
     @hass_callback
     def _async_describe_source(self, service_info: BluetoothServiceInfoBleak) -> str:
         """Describe a source."""
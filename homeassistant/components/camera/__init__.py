@@ -74,7 +74,7 @@ from .const import (  # noqa: F401
     STREAM_TYPE_WEB_RTC,
     StreamType,
 )
-from .img_util import scale_jpeg_camera_image
+from .img_util import async_scale_jpeg_camera_image
 from .prefs import CameraPreferences, DynamicStreamSettings  # noqa: F401
 
 _LOGGER = logging.getLogger(__name__)
@@ -186,7 +186,10 @@ async def _async_get_image(
                     assert width is not None
                     assert height is not None
                     return Image(
-                        content_type, scale_jpeg_camera_image(image, width, height)
+                        content_type,
+                        await async_scale_jpeg_camera_image(
+                            camera.hass, image, width, height
+                        ),
                     )
 
                 return image
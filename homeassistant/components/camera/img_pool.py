@@ -0,0 +1,140 @@
+"""Process pool for the CPU heavy work on camera images."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import importlib
+import logging
+import multiprocessing
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Final, TypeVar
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+DATA_IMAGE_POOL: Final = "camera_image_pool"
+
+# Number of processes which decode, scale and encode images and run image
+# processing, the jobs run in the executor when this is 0
+IMAGE_POOL_WORKERS: Final = 0
+
+
+def _run_image_job(
+    name: str, size: int, job: Callable[..., _T], args: tuple[Any, ...]
+) -> _T:
+    """Run a job on an image in shared memory, called in a pool process."""
+    shared_memory = SharedMemory(name=name)
+    try:
+        with shared_memory.buf[:size] as image:
+            return job(image, *args)
+    finally:
+        shared_memory.close()
+
+
+class ImagePool:
+    """Run the CPU heavy work on images in a pool of processes.
+
+    Running the work in processes keeps it from holding the GIL, which
+    would starve the event loop and the executor when many cameras are
+    fetched at once. The images are passed to the processes in shared
+    memory so they are not pickled.
+    """
+
+    def __init__(self, hass: HomeAssistant, max_workers: int) -> None:
+        """Initialize the image pool."""
+        self.hass = hass
+        self.max_workers = max_workers
+        self._executor: ProcessPoolExecutor | None = None
+
+    async def async_run_job(
+        self, job: Callable[..., _T], image: bytes, *args: Any
+    ) -> _T:
+        """Run a job on an image in a pool process."""
+        if not self.max_workers:
+            return await self.hass.async_add_executor_job(job, memoryview(image), *args)
+        if (executor := self._executor) is None:
+            # Processes forked from Home Assistant would inherit the state of
+            # its threads, so the pool spawns fresh interpreters. The jobs
+            # import the camera integration when they are passed to them,
+            # which needs persistent_notification to be imported first to
+            # resolve the import cycle of websocket_api and http.
+            executor = self._executor = ProcessPoolExecutor(
+                self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=importlib.import_module,
+                initargs=("homeassistant.components.persistent_notification",),
+            )
+        shared_memory = SharedMemory(create=True, size=max(len(image), 1))
+        try:
+            shared_memory.buf[: len(image)] = image
+            return await self.hass.loop.run_in_executor(
+                executor,
+                _run_image_job,
+                shared_memory.name,
+                len(image),
+                job,
+                args,
+            )
+        except BrokenProcessPool as err:
+            _LOGGER.error("A process of the image pool stopped unexpectedly")
+            # Start new processes for the next jobs
+            executor.shutdown(wait=False)
+            if self._executor is executor:
+                self._executor = None
+            raise HomeAssistantError("Image pool is broken") from err
+        finally:
+            shared_memory.close()
+            shared_memory.unlink()
+
+    @callback
+    def async_set_max_workers(self, max_workers: int) -> None:
+        """Set the number of pool processes."""
+        self.max_workers = max_workers
+        if (executor := self._executor) is not None:
+            # The running jobs finish in the old processes
+            self._executor = None
+            executor.shutdown(wait=False)
+
+    async def async_shutdown(self, event: Event | None = None) -> None:
+        """Stop the processes of the pool."""
+        if (executor := self._executor) is None:
+            return
+        self._executor = None
+        await self.hass.async_add_executor_job(
+            lambda: executor.shutdown(cancel_futures=True)
+        )
+
+
+@callback
+def _async_get_image_pool(hass: HomeAssistant) -> ImagePool:
+    """Return the image pool, creating it on first use."""
+    if (image_pool := hass.data.get(DATA_IMAGE_POOL)) is None:
+        image_pool = hass.data[DATA_IMAGE_POOL] = ImagePool(hass, IMAGE_POOL_WORKERS)
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, image_pool.async_shutdown)
+    return image_pool
+
+
+@callback
+def async_set_image_pool_workers(hass: HomeAssistant, max_workers: int) -> None:
+    """Start at least max_workers image pool processes."""
+    image_pool = _async_get_image_pool(hass)
+    if max_workers > image_pool.max_workers:
+        image_pool.async_set_max_workers(max_workers)
+
+
+async def async_run_image_job(
+    hass: HomeAssistant, job: Callable[..., _T], image: bytes, *args: Any
+) -> _T:
+    """Run a job on an image in the image pool.
+
+    The job is called with a memoryview of the image and args. It must be
+    a module level function so it can be passed to the pool processes, and
+    must not keep a reference to the image.
+    """
+    return await _async_get_image_pool(hass).async_run_job(job, image, *args)
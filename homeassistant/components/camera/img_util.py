@@ -4,6 +4,10 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING, Literal, cast
 
+from homeassistant.core import HomeAssistant
+
+from .img_pool import async_run_image_job
+
 SUPPORTED_SCALING_FACTORS = [(7, 8), (3, 4), (5, 8), (1, 2), (3, 8), (1, 4), (1, 8)]
 
 _LOGGER = logging.getLogger(__name__)
@@ -42,27 +46,42 @@ def scale_jpeg_camera_image(cam_image: Image, width: int, height: int) -> bytes:
 
     Scale as close as possible to one of the supported scaling factors.
     """
+    return _scale_jpeg(cam_image.content, width, height) or cam_image.content
+
+
+async def async_scale_jpeg_camera_image(
+    hass: HomeAssistant, cam_image: Image, width: int, height: int
+) -> bytes:
+    """Scale a camera image in the image pool."""
+    if not TurboJPEGSingleton.instance():
+        return cam_image.content
+    return (
+        await async_run_image_job(hass, _scale_jpeg, cam_image.content, width, height)
+        or cam_image.content
+    )
+
+
+def _scale_jpeg(content: bytes | memoryview, width: int, height: int) -> bytes | None:
+    """Scale a jpeg, returns None if it is not scaled."""
     turbo_jpeg = TurboJPEGSingleton.instance()
     if not turbo_jpeg:
-        return cam_image.content
+        return None
 
     try:
-        (current_width, current_height, _, _) = turbo_jpeg.decode_header(
-            cam_image.content
-        )
+        (current_width, current_height, _, _) = turbo_jpeg.decode_header(content)
     except OSError:
-        return cam_image.content
+        return None
 
     scaling_factor = find_supported_scaling_factor(
         current_width, current_height, width, height
     )
     if scaling_factor is None:
-        return cam_image.content
+        return None
 
     return cast(
         bytes,
         turbo_jpeg.scale_with_quality(
-            cam_image.content,
+            content,
             scaling_factor=scaling_factor,
             quality=JPEG_QUALITY,
         ),
@@ -77,6 +77,9 @@ IP_ADDRESS: Final = "ip"
 REGISTERED_DEVICES: Final = "registered_devices"
 DHCP_REQUEST = 3
 SCAN_INTERVAL = timedelta(minutes=60)
+# Length of the organizationally unique identifier at the
+# start of a MAC address without separators
+OUI_LENGTH = 6
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -91,6 +94,77 @@ class DhcpServiceInfo(BaseServiceInfo):
     macaddress: str
 
 
+@dataclass(slots=True)
+class _CompiledDHCPMatcher:
+    """A DHCP matcher with its patterns compiled."""
+
+    domain: str
+    matcher: DHCPMatcher
+    registered_devices: bool
+    mac_address: re.Pattern | None
+    hostname: re.Pattern | None
+
+
+class DHCPMatchers:
+    """Index of the DHCP matchers by the OUI of their MAC address pattern.
+
+    Most matchers start with a fixed OUI, so only the matchers of the OUI
+    of a client and the few matchers without a fixed OUI are checked.
+    """
+
+    __slots__ = ("_by_oui", "_without_oui")
+
+    def __init__(self, integration_matchers: list[DHCPMatcher]) -> None:
+        """Index the matchers."""
+        self._by_oui: dict[str, list[_CompiledDHCPMatcher]] = {}
+        self._without_oui: list[_CompiledDHCPMatcher] = []
+        for matcher in integration_matchers:
+            mac_address = matcher.get(MAC_ADDRESS)
+            hostname = matcher.get(HOSTNAME)
+            compiled = _CompiledDHCPMatcher(
+                matcher["domain"],
+                matcher,
+                bool(matcher.get(REGISTERED_DEVICES)),
+                _compile_fnmatch(mac_address) if mac_address is not None else None,
+                _compile_fnmatch(hostname) if hostname is not None else None,
+            )
+            if mac_address is not None and _is_oui_pattern(mac_address):
+                oui = mac_address[:OUI_LENGTH]
+                self._by_oui.setdefault(oui, []).append(compiled)
+            else:
+                self._without_oui.append(compiled)
+
+    @callback
+    def async_matching_domains(
+        self,
+        uppercase_mac: str,
+        lowercase_hostname: str,
+        device_domains: set[str],
+        data: dict[str, str],
+    ) -> set[str]:
+        """Return the domains with a matcher matching a client."""
+        matched_domains: set[str] = set()
+        for matchers in (
+            self._by_oui.get(uppercase_mac[:OUI_LENGTH], ()),
+            self._without_oui,
+        ):
+            for compiled in matchers:
+                domain = compiled.domain
+                if compiled.registered_devices and domain not in device_domains:
+                    continue
+                if (
+                    mac_address := compiled.mac_address
+                ) is not None and not mac_address.match(uppercase_mac):
+                    continue
+                if (hostname := compiled.hostname) is not None and not hostname.match(
+                    lowercase_hostname
+                ):
+                    continue
+                _LOGGER.debug("Matched %s against %s", data, compiled.matcher)
+                matched_domains.add(domain)
+        return matched_domains
+
+
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the dhcp component."""
     watchers: list[WatcherBase] = []
@@ -133,7 +207,7 @@ class WatcherBase(ABC):
         super().__init__()
 
         self.hass = hass
-        self._integration_matchers = integration_matchers
+        self._integration_matchers = DHCPMatchers(integration_matchers)
         self._address_data = address_data
 
     @abstractmethod
@@ -192,7 +266,6 @@ class WatcherBase(ABC):
             lowercase_hostname,
         )
 
-        matched_domains = set()
         device_domains = set()
 
         dev_reg: DeviceRegistry = async_get(self.hass)
@@ -203,26 +276,9 @@ class WatcherBase(ABC):
                 if entry := self.hass.config_entries.async_get_entry(entry_id):
                     device_domains.add(entry.domain)
 
-        for matcher in self._integration_matchers:
-            domain = matcher["domain"]
-
-            if matcher.get(REGISTERED_DEVICES) and domain not in device_domains:
-                continue
-
-            if (
-                matcher_mac := matcher.get(MAC_ADDRESS)
-            ) is not None and not _memorized_fnmatch(uppercase_mac, matcher_mac):
-                continue
-
-            if (
-                matcher_hostname := matcher.get(HOSTNAME)
-            ) is not None and not _memorized_fnmatch(
-                lowercase_hostname, matcher_hostname
-            ):
-                continue
-
-            _LOGGER.debug("Matched %s against %s", data, matcher)
-            matched_domains.add(domain)
+        matched_domains = self._integration_matchers.async_matching_domains(
+            uppercase_mac, lowercase_hostname, device_domains, data
+        )
 
         for domain in matched_domains:
             discovery_flow.async_create_flow(
@@ -534,16 +590,8 @@ def _compile_fnmatch(pattern: str) -> re.Pattern:
     return re.compile(translate(pattern))
 
 
-@lru_cache(maxsize=1024, typed=True)
-def _memorized_fnmatch(name: str, pattern: str) -> bool:
-    """Memorized version of fnmatch that has a larger lru_cache.
-
-    The default version of fnmatch only has a lru_cache of 256 entries.
-    With many devices we quickly reach that limit and end up compiling
-    the same pattern over and over again.
-
-    DHCP has its own memorized fnmatch with its own lru_cache
-    since the data is going to be relatively the same
-    since the devices will not change frequently
-    """
-    return bool(_compile_fnmatch(pattern).match(name))
+def _is_oui_pattern(pattern: str) -> bool:
+    """Return if a MAC address pattern starts with a fixed OUI."""
+    return len(pattern) > OUI_LENGTH and not any(
+        char in pattern[:OUI_LENGTH] for char in "*?["
+    )
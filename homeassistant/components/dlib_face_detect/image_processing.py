@@ -5,6 +5,7 @@ import io
 
 import face_recognition
 
+from homeassistant.components.camera.img_pool import async_run_image_job
 from homeassistant.components.image_processing import ImageProcessingFaceEntity
 from homeassistant.const import ATTR_LOCATION, CONF_ENTITY_ID, CONF_NAME, CONF_SOURCE
 from homeassistant.core import HomeAssistant, split_entity_id
@@ -56,16 +57,21 @@ class DlibFaceDetectEntity(ImageProcessingFaceEntity):
         """Return the name of the entity."""
         return self._name
 
-    def process_image(self, image):
+    async def async_process_image(self, image):
         """Process image."""
+        face_locations = await async_run_image_job(
+            self.hass, _detect_face_locations, image
+        )
+        face_locations = [{ATTR_LOCATION: location} for location in face_locations]
 
-        fak_file = io.BytesIO(image)
-        fak_file.name = "snapshot.jpg"
-        fak_file.seek(0)
+        self.async_process_faces(face_locations, len(face_locations))
 
-        image = face_recognition.load_image_file(fak_file)
-        face_locations = face_recognition.face_locations(image)
 
-        face_locations = [{ATTR_LOCATION: location} for location in face_locations]
+def _detect_face_locations(image):
+    """Return the locations of the faces in an image, runs in the image pool."""
+    fak_file = io.BytesIO(image)
+    fak_file.name = "snapshot.jpg"
+    fak_file.seek(0)
 
-        self.process_faces(face_locations, len(face_locations))
+    image = face_recognition.load_image_file(fak_file)
+    return face_recognition.face_locations(image)
@@ -20,13 +20,33 @@ from homeassistant.helpers.typing import ConfigType
 import homeassistant.util.dt as dt_util
 
 from . import websocket_api
-from .const import DOMAIN
+from .cache import HistoryCache
+from .const import (
+    CONF_CACHE,
+    CONF_CACHE_MAX_STATES,
+    CONF_CACHE_WINDOW,
+    DATA_HISTORY_CACHE,
+    DEFAULT_CACHE_MAX_STATES,
+    DEFAULT_CACHE_WINDOW,
+    DOMAIN,
+)
 from .helpers import entities_may_have_state_changes_after
 
 CONF_ORDER = "use_include_order"
 
 _ONE_DAY = timedelta(days=1)
 
+CACHE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(
+            CONF_CACHE_WINDOW, default=DEFAULT_CACHE_WINDOW
+        ): cv.positive_time_period,
+        vol.Optional(
+            CONF_CACHE_MAX_STATES, default=DEFAULT_CACHE_MAX_STATES
+        ): cv.positive_int,
+    }
+)
+
 CONFIG_SCHEMA = vol.Schema(
     {
         DOMAIN: vol.All(
@@ -34,7 +54,10 @@ CONFIG_SCHEMA = vol.Schema(
             cv.deprecated(CONF_EXCLUDE),
             cv.deprecated(CONF_ORDER),
             INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.extend(
-                {vol.Optional(CONF_ORDER, default=False): cv.boolean}
+                {
+                    vol.Optional(CONF_ORDER, default=False): cv.boolean,
+                    vol.Optional(CONF_CACHE): CACHE_SCHEMA,
+                }
             ),
         )
     },
@@ -47,6 +70,12 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     hass.http.register_view(HistoryPeriodView())
     frontend.async_register_built_in_panel(hass, "history", "history", "hass:chart-box")
     websocket_api.async_setup(hass)
+    if (cache_config := config.get(DOMAIN, {}).get(CONF_CACHE)) is not None:
+        cache = HistoryCache(
+            hass, cache_config[CONF_CACHE_WINDOW], cache_config[CONF_CACHE_MAX_STATES]
+        )
+        cache.async_setup()
+        hass.data[DATA_HISTORY_CACHE] = cache
     return True
 
 
@@ -0,0 +1,299 @@
+"""In-memory cache of recent history for the history integration."""
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import MutableMapping
+from dataclasses import dataclass
+from datetime import datetime as dt, timedelta
+from typing import Any
+
+from homeassistant.components.recorder import get_instance, history
+from homeassistant.components.recorder.const import (
+    ALL_DOMAIN_EXCLUDE_ATTRS,
+    EXCLUDE_ATTRIBUTES,
+)
+from homeassistant.const import (
+    COMPRESSED_STATE_ATTRIBUTES,
+    COMPRESSED_STATE_LAST_CHANGED,
+    COMPRESSED_STATE_LAST_UPDATED,
+    COMPRESSED_STATE_STATE,
+    EVENT_STATE_CHANGED,
+)
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    HomeAssistant,
+    State,
+    callback,
+    split_entity_id,
+)
+from homeassistant.helpers.entity import entity_sources
+from homeassistant.helpers.event import EventStateChangedData
+from homeassistant.helpers.typing import EventType
+import homeassistant.util.dt as dt_util
+
+from .const import DATA_HISTORY_CACHE
+
+
+@callback
+def async_get_history_cache(hass: HomeAssistant) -> HistoryCache | None:
+    """Return the history cache if it is enabled."""
+    cache: HistoryCache | None = hass.data.get(DATA_HISTORY_CACHE)
+    return cache
+
+
+@dataclass(slots=True)
+class CachedHistory:
+    """A snapshot of cached states that can be converted in the executor."""
+
+    states: dict[str, list[State]]
+    exclude_attrs: dict[str, set[str]]
+
+    def compressed_states(
+        self,
+        start_time: dt,
+        end_time: dt | None,
+        include_start_time_state: bool,
+        significant_changes_only: bool,
+        minimal_response: bool,
+        no_attributes: bool,
+    ) -> MutableMapping[str, list[dict[str, Any]]]:
+        """Convert the snapshot to the compressed format of the history queries.
+
+        The result is the same as calling get_significant_states with
+        compressed_state_format for the same period.
+        """
+        start_time_ts = dt_util.utc_to_timestamp(start_time)
+        end_time_ts = dt_util.utc_to_timestamp(end_time) if end_time else None
+        include_last_changed = not significant_changes_only
+        result: dict[str, list[dict[str, Any]]] = {}
+        for entity_id, states in self.states.items():
+            domain = split_entity_id(entity_id)[0]
+            significant_domain = domain in history.SIGNIFICANT_DOMAINS
+            start_state: State | None = None
+            rows: list[tuple[State, float | None]] = []
+            for state in states:
+                last_updated_ts = dt_util.utc_to_timestamp(state.last_updated)
+                if last_updated_ts < start_time_ts:
+                    start_state = state
+                    continue
+                if end_time_ts is not None and last_updated_ts >= end_time_ts:
+                    break
+                if last_updated_ts == start_time_ts or (
+                    significant_changes_only
+                    and not significant_domain
+                    and state.last_changed != state.last_updated
+                ):
+                    continue
+                rows.append((state, last_updated_ts))
+            if include_start_time_state and start_state is not None:
+                # The start time state is reported at the start time
+                # without last_changed like the database query does
+                rows.insert(0, (start_state, None))
+            if not rows:
+                continue
+
+            exclude_attrs = self.exclude_attrs[entity_id]
+            if not minimal_response or domain in history.NEED_ATTRIBUTE_DOMAINS:
+                result[entity_id] = [
+                    _compressed_state(
+                        state,
+                        last_updated_ts,
+                        start_time_ts,
+                        include_last_changed,
+                        exclude_attrs,
+                        False,
+                        no_attributes,
+                    )
+                    for state, last_updated_ts in rows
+                ]
+                continue
+
+            first_state, first_last_updated_ts = rows[0]
+            prev_state = first_state.state
+            ent_results = [
+                _compressed_state(
+                    first_state,
+                    first_last_updated_ts,
+                    start_time_ts,
+                    include_last_changed,
+                    exclude_attrs,
+                    no_attributes,
+                    no_attributes,
+                )
+            ]
+            for state, last_updated_ts in rows[1:]:
+                if state.state != prev_state:
+                    prev_state = state.state
+                    ent_results.append(
+                        {
+                            COMPRESSED_STATE_STATE: prev_state,
+                            COMPRESSED_STATE_LAST_UPDATED: last_updated_ts,
+                        }
+                    )
+            result[entity_id] = ent_results
+        return result
+
+
+def _compressed_state(
+    state: State,
+    last_updated_ts: float | None,
+    start_time_ts: float,
+    include_last_changed: bool,
+    exclude_attrs: set[str],
+    skip_attributes: bool,
+    no_attributes: bool,
+) -> dict[str, Any]:
+    """Convert a cached state to a compressed state like row_to_compressed_state."""
+    comp_state: dict[str, Any] = {COMPRESSED_STATE_STATE: state.state}
+    if not skip_attributes:
+        comp_state[COMPRESSED_STATE_ATTRIBUTES] = (
+            {}
+            if no_attributes
+            else {k: v for k, v in state.attributes.items() if k not in exclude_attrs}
+        )
+    if last_updated_ts is None:
+        comp_state[COMPRESSED_STATE_LAST_UPDATED] = start_time_ts
+        return comp_state
+    comp_state[COMPRESSED_STATE_LAST_UPDATED] = last_updated_ts
+    if include_last_changed and state.last_changed != state.last_updated:
+        comp_state[COMPRESSED_STATE_LAST_CHANGED] = dt_util.utc_to_timestamp(
+            state.last_changed
+        )
+    return comp_state
+
+
+class HistoryCache:
+    """Keep the recent states of recorded entities in memory.
+
+    Each entity has a buffer of the states seen on the event bus ordered
+    by last_updated. Since every later state of the entity is in the
+    buffer as well, a request can be answered from memory as long as the
+    buffer holds the state the entity had at the start of the request.
+    """
+
+    def __init__(self, hass: HomeAssistant, window: timedelta, max_states: int) -> None:
+        """Initialize the history cache."""
+        self.hass = hass
+        self.window = window
+        self.max_states = max_states
+        self.hits = 0
+        self.misses = 0
+        self._states: dict[str, deque[State]] = {}
+        # All cached states in the order they were added, used to evict
+        # the oldest states when the cache is over its budget. States
+        # that were already trimmed are skipped when they come up.
+        self._added: deque[State] = deque()
+        self._count = 0
+
+    @callback
+    def async_setup(self) -> CALLBACK_TYPE:
+        """Start feeding the cache from state_changed events."""
+        return self.hass.bus.async_listen(
+            EVENT_STATE_CHANGED, self._async_state_changed, run_immediately=True
+        )
+
+    @callback
+    def _async_state_changed(self, event: EventType[EventStateChangedData]) -> None:
+        """Add a new state to the cache."""
+        entity_id = event.data["entity_id"]
+        if not get_instance(self.hass).entity_filter(entity_id):
+            return
+        if (new_state := event.data["new_state"]) is None:
+            # The removal is recorded without a state we can reproduce
+            # so the history of the entity is left to the database.
+            if (removed := self._states.pop(entity_id, None)) is not None:
+                self._count -= len(removed)
+            return
+        if (states := self._states.get(entity_id)) is None:
+            states = self._states[entity_id] = deque()
+            # The old state was set before we started listening,
+            # but is still the state the entity had until now.
+            if (old_state := event.data["old_state"]) is not None:
+                self._async_append(states, old_state)
+        self._async_append(states, new_state)
+        cutoff = new_state.last_updated - self.window
+        while len(states) > 1 and states[1].last_updated <= cutoff:
+            states.popleft()
+            self._count -= 1
+        if self._count > self.max_states:
+            self._async_evict()
+        elif len(self._added) > 2 * self.max_states:
+            self._async_compact()
+
+    @callback
+    def _async_append(self, states: deque[State], state: State) -> None:
+        """Append a state to the buffer of an entity."""
+        states.append(state)
+        self._added.append(state)
+        self._count += 1
+
+    @callback
+    def _async_evict(self) -> None:
+        """Evict the oldest states until the cache is within its budget."""
+        cached = self._states
+        added = self._added
+        while self._count > self.max_states:
+            state = added.popleft()
+            entity_id = state.entity_id
+            if not (states := cached.get(entity_id)) or states[0] is not state:
+                continue
+            states.popleft()
+            self._count -= 1
+            if not states:
+                del cached[entity_id]
+
+    @callback
+    def _async_compact(self) -> None:
+        """Drop the states that were trimmed from the eviction order."""
+        cached = self._states
+        self._added = deque(
+            state
+            for state in self._added
+            if (states := cached.get(state.entity_id)) is not None
+            and states[0].last_updated <= state.last_updated
+        )
+
+    @callback
+    def async_get_history(
+        self, start_time: dt, entity_ids: list[str], include_start_time_state: bool
+    ) -> CachedHistory | None:
+        """Return the cached states for a request or None if not covered.
+
+        Without the start time state only the states after the start
+        time are needed, which the buffer has when it starts at or
+        before the start time.
+        """
+        if not entity_ids:
+            return None
+        instance = get_instance(self.hass)
+        entity_filter = instance.entity_filter
+        exclude_attrs_by_domain: dict[str, set[str]] = self.hass.data[
+            EXCLUDE_ATTRIBUTES
+        ]
+        sources = entity_sources(self.hass)
+        states: dict[str, list[State]] = {}
+        exclude_attrs: dict[str, set[str]] = {}
+        for entity_id in entity_ids:
+            if entity_id in states or not entity_filter(entity_id):
+                # Entities that are not recorded have no history
+                continue
+            if not (cached := self._states.get(entity_id)) or (
+                cached[0].last_updated >= start_time
+                if include_start_time_state
+                else cached[0].last_updated > start_time
+            ):
+                self.misses += 1
+                return None
+            states[entity_id] = list(cached)
+            exclude = set(ALL_DOMAIN_EXCLUDE_ATTRS)
+            if domain_attrs := exclude_attrs_by_domain.get(
+                split_entity_id(entity_id)[0]
+            ):
+                exclude |= domain_attrs
+            if (entity_info := sources.get(entity_id)) and (
+                integration_attrs := exclude_attrs_by_domain.get(entity_info["domain"])
+            ):
+                exclude |= integration_attrs
+            exclude_attrs[entity_id] = exclude
+        self.hits += 1
+        return CachedHistory(states, exclude_attrs)
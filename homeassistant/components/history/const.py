@@ -1,7 +1,17 @@
 """History integration constants."""
+from datetime import timedelta
 
 DOMAIN = "history"
 
 EVENT_COALESCE_TIME = 0.35
 
 MAX_PENDING_HISTORY_STATES = 2048
+
+CONF_CACHE = "cache"
+CONF_CACHE_WINDOW = "window"
+CONF_CACHE_MAX_STATES = "max_states"
+
+DEFAULT_CACHE_WINDOW = timedelta(hours=24)
+DEFAULT_CACHE_MAX_STATES = 100000
+
+DATA_HISTORY_CACHE = "history_cache"
@@ -38,6 +38,7 @@ from homeassistant.helpers.json import JSON_DUMP
 from homeassistant.helpers.typing import EventType
 import homeassistant.util.dt as dt_util
 
+from .cache import CachedHistory, async_get_history_cache
 from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
 from .helpers import entities_may_have_state_changes_after
 
@@ -93,6 +94,32 @@ def _ws_get_significant_states(
     )
 
 
+def _ws_get_cached_significant_states(
+    cached: CachedHistory,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt | None,
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+) -> str:
+    """Convert cached states to json in the executor."""
+    return JSON_DUMP(
+        messages.result_message(
+            msg_id,
+            cached.compressed_states(
+                start_time,
+                end_time,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+            ),
+        )
+    )
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "history/history_during_period",
@@ -154,6 +181,26 @@ async def ws_get_history_during_period(
     significant_changes_only = msg["significant_changes_only"]
     minimal_response = msg["minimal_response"]
 
+    if (cache := async_get_history_cache(hass)) and (
+        cached := cache.async_get_history(
+            start_time, entity_ids, include_start_time_state
+        )
+    ):
+        connection.send_message(
+            await hass.async_add_executor_job(
+                _ws_get_cached_significant_states,
+                cached,
+                msg["id"],
+                start_time,
+                end_time,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+            )
+        )
+        return
+
     connection.send_message(
         await get_instance(hass).async_add_executor_job(
             _ws_get_significant_states,
@@ -237,6 +284,44 @@ def _generate_historical_response(
             True,
         ),
     )
+    return _generate_historical_response_from_states(
+        msg_id, start_time, end_time, states, send_empty
+    )
+
+
+def _generate_cached_historical_response(
+    cached: CachedHistory,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt,
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    send_empty: bool,
+) -> tuple[float, dt | None, str | None]:
+    """Generate a historical response from the history cache."""
+    states = cached.compressed_states(
+        start_time,
+        end_time,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+    )
+    return _generate_historical_response_from_states(
+        msg_id, start_time, end_time, states, send_empty
+    )
+
+
+def _generate_historical_response_from_states(
+    msg_id: int,
+    start_time: dt,
+    end_time: dt,
+    states: MutableMapping[str, list[dict[str, Any]]],
+    send_empty: bool,
+) -> tuple[float, dt | None, str | None]:
+    """Generate a historical response from compressed states."""
     last_time_ts = 0.0
     for state_list in states.values():
         if (
@@ -277,6 +362,26 @@ async def _async_send_historical_states(
     send_empty: bool,
 ) -> dt | None:
     """Fetch history significant_states and send them to the client."""
+    if entity_ids and (cache := async_get_history_cache(hass)):
+        if cached := cache.async_get_history(
+            start_time, entity_ids, include_start_time_state
+        ):
+            last_time_ts, last_time_dt, payload = await hass.async_add_executor_job(
+                _generate_cached_historical_response,
+                cached,
+                msg_id,
+                start_time,
+                end_time,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+                send_empty,
+            )
+            if payload:
+                connection.send_message(payload)
+            return last_time_dt if last_time_ts != 0 else None
+
     instance = get_instance(hass)
     last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
         _generate_historical_response,
@@ -11,6 +11,7 @@ from typing import Any, Final, TypedDict, final
 import voluptuous as vol
 
 from homeassistant.components.camera import Image
+from homeassistant.components.camera.img_pool import async_set_image_pool_workers
 from homeassistant.const import (
     ATTR_ENTITY_ID,
     ATTR_NAME,
@@ -20,6 +21,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_per_platform
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.config_validation import make_entity_service_schema
 from homeassistant.helpers.entity import Entity, EntityDescription
@@ -59,6 +61,7 @@ ATTR_MOTION: Final = "motion"
 ATTR_TOTAL_FACES = "total_faces"
 
 CONF_CONFIDENCE = "confidence"
+CONF_IMAGE_POOL_WORKERS = "image_pool_workers"
 
 DEFAULT_TIMEOUT = 10
 DEFAULT_CONFIDENCE = 80
@@ -76,6 +79,7 @@ PLATFORM_SCHEMA = cv.PLATFORM_SCHEMA.extend(
         vol.Optional(CONF_CONFIDENCE, default=DEFAULT_CONFIDENCE): vol.All(
             vol.Coerce(float), vol.Range(min=0, max=100)
         ),
+        vol.Optional(CONF_IMAGE_POOL_WORKERS): cv.positive_int,
     }
 )
 PLATFORM_SCHEMA_BASE = cv.PLATFORM_SCHEMA_BASE.extend(PLATFORM_SCHEMA.schema)
@@ -99,6 +103,15 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         _LOGGER, DOMAIN, hass, SCAN_INTERVAL
     )
 
+    # The camera image pool is shared by all platforms
+    image_pool_workers = [
+        p_config[CONF_IMAGE_POOL_WORKERS]
+        for _, p_config in config_per_platform(config, DOMAIN)
+        if CONF_IMAGE_POOL_WORKERS in p_config
+    ]
+    if image_pool_workers:
+        async_set_image_pool_workers(hass, max(image_pool_workers))
+
     await component.async_setup(config)
 
     async def async_scan_service(service: ServiceCall) -> None:
@@ -32,6 +32,7 @@ from homeassistant.helpers.typing import ConfigType
 from homeassistant.loader import bind_hass
 
 from . import rest_api, websocket_api
+from .cache import LogbookCache
 from .const import (  # noqa: F401
     ATTR_MESSAGE,
     DOMAIN,
@@ -135,7 +136,9 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     external_events: dict[
         str, tuple[str, Callable[[LazyEventPartialState], dict[str, Any]]]
     ] = {}
-    hass.data[DOMAIN] = LogbookConfig(external_events, filters, entities_filter)
+    cache = LogbookCache()
+    cache.async_setup(hass)
+    hass.data[DOMAIN] = LogbookConfig(external_events, filters, entities_filter, cache)
     websocket_api.async_setup(hass)
     rest_api.async_setup(hass, config, filters, entities_filter)
     hass.services.async_register(DOMAIN, "log", log_message, schema=LOG_MESSAGE_SCHEMA)
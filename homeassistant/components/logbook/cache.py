@@ -0,0 +1,123 @@
+"""Cache of humanified logbook entries and recent context rows."""
+from __future__ import annotations
+
+from collections.abc import MutableMapping
+from dataclasses import dataclass
+import math
+from typing import TYPE_CHECKING, Any, Final
+
+from lru import LRU  # pylint: disable=no-name-in-module
+from sqlalchemy.engine.row import Row
+
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
+
+from .const import LOGBOOK_ENTRY_WHEN
+
+if TYPE_CHECKING:
+    from .models import EventAsRow
+
+# Number of requests to keep the humanified entries of
+LOGBOOK_CACHE_REQUESTS: Final = 16
+# Requests with more entries than this are not cached
+LOGBOOK_CACHE_MAX_ENTRIES: Final = 10000
+# Number of context rows kept to augment the entries of later requests
+LOGBOOK_CACHE_CONTEXTS: Final = 4096
+# Seconds on top of the recorder commit interval before events
+# are expected to be in the database
+LOGBOOK_CACHE_SETTLE_TIME: Final = 10
+
+# The event types, entity ids, device ids, whether entity names are
+# included and the start time of a request
+LogbookCacheKey = tuple[
+    tuple[str, ...], tuple[str, ...] | None, tuple[str, ...] | None, bool, float
+]
+
+
+@dataclass(slots=True)
+class CachedEntries:
+    """Humanified entries of a request up to a point in time."""
+
+    end: float
+    entries: list[dict[str, Any]]
+
+
+class LogbookCache:
+    """Keep the humanified entries of recent logbook requests.
+
+    The entries of a request are cached up to a point in time which is far
+    enough in the past to have all its events in the database. A request
+    with the same start only queries and humanifies the events after that
+    point. The cache is cleared when the entity registry changes, since
+    entries include entity names.
+
+    The context rows seen by requests are kept as well, which lets the
+    entries of later requests be augmented with contexts that started
+    before their start time.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the logbook cache."""
+        self.hits = 0
+        self.misses = 0
+        self.contexts: MutableMapping[bytes | None, Row | EventAsRow] = LRU(
+            LOGBOOK_CACHE_CONTEXTS
+        )
+        self._entries: MutableMapping[LogbookCacheKey, CachedEntries] = LRU(
+            LOGBOOK_CACHE_REQUESTS
+        )
+
+    @callback
+    def async_setup(self, hass: HomeAssistant) -> CALLBACK_TYPE:
+        """Start clearing the cache when the entity registry changes."""
+        return hass.bus.async_listen(
+            EVENT_ENTITY_REGISTRY_UPDATED,
+            self._async_entity_registry_updated,
+            run_immediately=True,
+        )
+
+    @callback
+    def _async_entity_registry_updated(self, event: Event) -> None:
+        """Clear the cached entries since entity names may have changed."""
+        self.clear()
+
+    def clear(self) -> None:
+        """Clear the cached entries."""
+        self._entries.clear()
+
+    def get(
+        self, key: LogbookCacheKey, end: float
+    ) -> tuple[list[dict[str, Any]], float] | None:
+        """Return the cached entries before end and the time they are complete to."""
+        if (cached := self._entries.get(key)) is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        if end <= cached.end:
+            return [
+                entry for entry in cached.entries if entry[LOGBOOK_ENTRY_WHEN] < end
+            ], end
+        return list(cached.entries), cached.end
+
+    def store(
+        self,
+        key: LogbookCacheKey,
+        entries: list[dict[str, Any]],
+        query_end: float,
+        settled: float,
+    ) -> None:
+        """Cache the entries of a request which ended at query_end.
+
+        Only the entries up to settled, when all events are expected
+        to be in the database, are kept.
+        """
+        # Whole seconds convert to a datetime and back without loss, and
+        # the entries are complete until just before the end of the query
+        if (end := math.floor(min(query_end, settled))) >= query_end:
+            end -= 1
+        if end <= key[-1]:
+            return
+        cached = [entry for entry in entries if entry[LOGBOOK_ENTRY_WHEN] <= end]
+        if len(cached) > LOGBOOK_CACHE_MAX_ENTRIES:
+            return
+        self._entries[key] = CachedEntries(end, cached)
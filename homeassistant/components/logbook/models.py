@@ -20,6 +20,8 @@ import homeassistant.util.dt as dt_util
 from homeassistant.util.json import json_loads
 from homeassistant.util.ulid import ulid_to_bytes
 
+from .cache import LogbookCache
+
 
 @dataclass(slots=True)
 class LogbookConfig:
@@ -30,6 +32,7 @@ class LogbookConfig:
     ]
     sqlalchemy_filter: Filters | None = None
     entity_filter: Callable[[str], bool] | None = None
+    cache: LogbookCache | None = None
 
 
 class LazyEventPartialState:
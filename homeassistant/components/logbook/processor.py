@@ -1,7 +1,7 @@
 """Event parser and human readable log generator."""
 from __future__ import annotations
 
-from collections.abc import Callable, Generator, Sequence
+from collections.abc import Callable, Generator, MutableMapping, Sequence
 from contextlib import suppress
 from dataclasses import dataclass
 from datetime import datetime as dt
@@ -38,6 +38,7 @@ from homeassistant.core import HomeAssistant, split_entity_id
 from homeassistant.helpers import entity_registry as er
 import homeassistant.util.dt as dt_util
 
+from .cache import LOGBOOK_CACHE_SETTLE_TIME, LogbookCacheKey
 from .const import (
     ATTR_MESSAGE,
     CONTEXT_DOMAIN,
@@ -81,6 +82,8 @@ class LogbookRun:
     include_entity_name: bool
     format_time: Callable[[Row | EventAsRow], Any]
     memoize_new_contexts: bool = True
+    # Context rows shared with other runs
+    recent_contexts: MutableMapping[bytes | None, Row | EventAsRow] | None = None
 
 
 class EventProcessor:
@@ -111,6 +114,9 @@ class EventProcessor:
         format_time = (
             _row_time_fired_timestamp if timestamp else _row_time_fired_isoformat
         )
+        cache = logbook_config.cache
+        # Entries are cached with the timestamp they happened at
+        self.cache = cache if timestamp and not context_id else None
         self.logbook_run = LogbookRun(
             context_lookup={None: None},
             external_events=logbook_config.external_events,
@@ -118,6 +124,7 @@ class EventProcessor:
             entity_name_cache=EntityNameCache(self.hass),
             include_entity_name=include_entity_name,
             format_time=format_time,
+            recent_contexts=cache.contexts if cache else None,
         )
         self.context_augmenter = ContextAugmenter(self.logbook_run)
 
@@ -141,6 +148,42 @@ class EventProcessor:
         end_day: dt,
     ) -> list[dict[str, Any]]:
         """Get events for a period of time."""
+        if (cache := self.cache) is None:
+            return self._get_events(start_day, end_day)
+        end_ts = dt_util.utc_to_timestamp(end_day)
+        key = self._cache_key(start_day)
+        query_start = start_day
+        cached: list[dict[str, Any]] = []
+        if (cached_entries := cache.get(key, end_ts)) is not None:
+            cached, cached_end = cached_entries
+            if cached_end >= end_ts:
+                return cached
+            query_start = dt_util.utc_from_timestamp(cached_end)
+        events = cached + self._get_events(query_start, end_day)
+        instance = get_instance(self.hass)
+        if not instance.backlog:
+            cache.store(
+                key,
+                events,
+                end_ts,
+                dt_util.utc_to_timestamp(dt_util.utcnow())
+                - instance.commit_interval
+                - LOGBOOK_CACHE_SETTLE_TIME,
+            )
+        return events
+
+    def _cache_key(self, start_day: dt) -> LogbookCacheKey:
+        """Return the key of the cached entries of the request."""
+        return (
+            self.event_types,
+            tuple(self.entity_ids) if self.entity_ids else None,
+            tuple(self.device_ids) if self.device_ids else None,
+            self.logbook_run.include_entity_name,
+            dt_util.utc_to_timestamp(start_day),
+        )
+
+    def _get_events(self, start_day: dt, end_day: dt) -> list[dict[str, Any]]:
+        """Query and humanify the events for a period of time."""
         with session_scope(hass=self.hass, read_only=True) as session:
             metadata_ids: list[int] | None = None
             instance = get_instance(self.hass)
@@ -200,12 +243,22 @@ def _humanify(
     format_time = logbook_run.format_time
     memoize_new_contexts = logbook_run.memoize_new_contexts
     memoize_context = context_lookup.setdefault
+    recent_contexts = logbook_run.recent_contexts
 
     # Process rows
     for row in rows:
         context_id_bin: bytes = row.context_id_bin
         if memoize_new_contexts:
             memoize_context(context_id_bin, row)
+            if (
+                recent_contexts is not None
+                and context_id_bin
+                and (
+                    (known_row := recent_contexts.get(context_id_bin)) is None
+                    or row.time_fired_ts < known_row.time_fired_ts
+                )
+            ):
+                recent_contexts[context_id_bin] = row
         if row.context_only:
             continue
         event_type = row.event_type
@@ -277,6 +330,7 @@ class ContextAugmenter:
     def __init__(self, logbook_run: LogbookRun) -> None:
         """Init the augmenter."""
         self.context_lookup = logbook_run.context_lookup
+        self.recent_contexts = logbook_run.recent_contexts
         self.entity_name_cache = logbook_run.entity_name_cache
         self.external_events = logbook_run.external_events
         self.event_cache = logbook_run.event_cache
@@ -286,10 +340,19 @@ class ContextAugmenter:
         self, context_id_bin: bytes | None, row: Row | EventAsRow
     ) -> Row | EventAsRow | None:
         """Get the context row from the id or row context."""
-        if context_id_bin is not None and (
-            context_row := self.context_lookup.get(context_id_bin)
-        ):
-            return context_row
+        if context_id_bin is not None:
+            context_row = self.context_lookup.get(context_id_bin)
+            # The context may have started before the rows of this run
+            if self.recent_contexts is not None and (
+                (recent_row := self.recent_contexts.get(context_id_bin))
+                and (
+                    not context_row
+                    or recent_row.time_fired_ts < context_row.time_fired_ts
+                )
+            ):
+                return recent_row
+            if context_row:
+                return context_row
         if (context := getattr(row, "context", None)) is not None and (
             origin_event := context.origin_event
         ) is not None:
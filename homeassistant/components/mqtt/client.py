@@ -2,8 +2,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Coroutine, Iterable
-from functools import lru_cache
+from collections.abc import Callable, Coroutine, Iterable, Iterator
 from itertools import chain, groupby
 import logging
 from operator import attrgetter
@@ -217,12 +216,112 @@ class Subscription:
     """Class to hold data about an active subscription."""
 
     topic: str = attr.ib()
-    matcher: Any = attr.ib()
     job: HassJob[[ReceiveMessage], Coroutine[Any, Any, None] | None] = attr.ib()
     qos: int = attr.ib(default=0)
     encoding: str | None = attr.ib(default="utf-8")
 
 
+class _SubscriptionTrieNode:
+    """A level in the wildcard subscription trie."""
+
+    __slots__ = ("children", "subscriptions")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _SubscriptionTrieNode] = {}
+        self.subscriptions: list[Subscription] = []
+
+
+class SubscriptionTrie:
+    """Trie of subscriptions keyed by topic level, supporting + and # wildcards.
+
+    Matching a topic costs O(topic depth) instead of O(subscriptions), and the
+    trie is updated in place when subscriptions are added or removed.
+    """
+
+    __slots__ = ("_root", "_count")
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root = _SubscriptionTrieNode()
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Return the number of subscriptions in the trie."""
+        return self._count
+
+    def __iter__(self) -> Iterator[Subscription]:
+        """Iterate over all subscriptions in the trie."""
+        nodes = [self._root]
+        while nodes:
+            node = nodes.pop()
+            yield from node.subscriptions
+            nodes.extend(node.children.values())
+
+    def add(self, subscription: Subscription) -> None:
+        """Add a subscription."""
+        node = self._root
+        for level in subscription.topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _SubscriptionTrieNode()
+            node = child
+        node.subscriptions.append(subscription)
+        self._count += 1
+
+    def remove(self, subscription: Subscription) -> None:
+        """Remove a subscription.
+
+        Raises KeyError or ValueError if the subscription is not in the trie.
+        """
+        path: list[tuple[_SubscriptionTrieNode, str]] = []
+        node = self._root
+        for level in subscription.topic.split("/"):
+            path.append((node, level))
+            node = node.children[level]
+        node.subscriptions.remove(subscription)
+        self._count -= 1
+        # Prune levels that no longer lead to any subscription
+        for parent, level in reversed(path):
+            child = parent.children[level]
+            if child.subscriptions or child.children:
+                break
+            del parent.children[level]
+
+    def has_topic(self, topic: str) -> bool:
+        """Return if there is a subscription for exactly this topic filter."""
+        node = self._root
+        for level in topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                return False
+            node = child
+        return bool(node.subscriptions)
+
+    def match(self, topic: str) -> list[Subscription]:
+        """Return the subscriptions with a topic filter matching a topic."""
+        levels = topic.split("/")
+        depth = len(levels)
+        # Section 4.7.2: topics starting with $ are not matched by
+        # wildcards at the first level
+        wildcard_root = not topic.startswith("$")
+        matches: list[Subscription] = []
+        nodes: list[tuple[_SubscriptionTrieNode, int]] = [(self._root, 0)]
+        while nodes:
+            node, idx = nodes.pop()
+            children = node.children
+            allow_wildcard = wildcard_root or idx > 0
+            if allow_wildcard and (multi := children.get("#")) is not None:
+                # "#" also matches the parent level
+                matches.extend(multi.subscriptions)
+            if idx == depth:
+                matches.extend(node.subscriptions)
+                continue
+            if (child := children.get(levels[idx])) is not None:
+                nodes.append((child, idx + 1))
+            if allow_wildcard and (single := children.get("+")) is not None:
+                nodes.append((single, idx + 1))
+        return matches
+
+
 class MqttClientSetup:
     """Helper class to setup the paho mqtt client from config."""
 
@@ -380,7 +479,7 @@ class MQTT:
         self.conf = conf
 
         self._simple_subscriptions: dict[str, list[Subscription]] = {}
-        self._wildcard_subscriptions: list[Subscription] = []
+        self._wildcard_subscriptions = SubscriptionTrie()
         # _retained_topics prevents a Subscription from receiving a
         # retained message more than once per topic. This prevents flooding
         # already active subscribers when new subscribers subscribe to a topic
@@ -483,8 +582,8 @@ class MQTT:
 
     def _is_active_subscription(self, topic: str) -> bool:
         """Check if a topic has an active subscription."""
-        return topic in self._simple_subscriptions or any(
-            other.topic == topic for other in self._wildcard_subscriptions
+        return topic in self._simple_subscriptions or (
+            self._wildcard_subscriptions.has_topic(topic)
         )
 
     async def async_publish(
@@ -565,30 +664,25 @@ class MQTT:
         """Restore tracked subscriptions after reload."""
         for subscription in subscriptions:
             self._async_track_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
 
     @callback
     def _async_track_subscription(self, subscription: Subscription) -> None:
         """Track a subscription.
 
         This method does not send a SUBSCRIBE message to the broker.
-
-        The caller is responsible clearing the cache of _matching_subscriptions.
         """
         if _is_simple_match(subscription.topic):
             self._simple_subscriptions.setdefault(subscription.topic, []).append(
                 subscription
             )
         else:
-            self._wildcard_subscriptions.append(subscription)
+            self._wildcard_subscriptions.add(subscription)
 
     @callback
     def _async_untrack_subscription(self, subscription: Subscription) -> None:
         """Untrack a subscription.
 
         This method does not send an UNSUBSCRIBE message to the broker.
-
-        The caller is responsible clearing the cache of _matching_subscriptions.
         """
         topic = subscription.topic
         try:
@@ -633,11 +727,8 @@ class MQTT:
         if not isinstance(topic, str):
             raise HomeAssistantError("Topic needs to be a string!")
 
-        subscription = Subscription(
-            topic, _matcher_for_topic(topic), HassJob(msg_callback), qos, encoding
-        )
+        subscription = Subscription(topic, HassJob(msg_callback), qos, encoding)
         self._async_track_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
 
         # Only subscribe if currently connected.
         if self.connected:
@@ -647,7 +738,6 @@ class MQTT:
         def async_remove() -> None:
             """Remove subscription."""
             self._async_untrack_subscription(subscription)
-            self._matching_subscriptions.cache_clear()
             if subscription in self._retained_topics:
                 del self._retained_topics[subscription]
             # Only unsubscribe if currently connected
@@ -808,14 +898,10 @@ class MQTT:
         """Message received callback."""
         self.hass.add_job(self._mqtt_handle_message, msg)
 
-    @lru_cache(None)  # pylint: disable=method-cache-max-size-none
     def _matching_subscriptions(self, topic: str) -> list[Subscription]:
-        subscriptions: list[Subscription] = []
+        subscriptions = self._wildcard_subscriptions.match(topic)
         if topic in self._simple_subscriptions:
-            subscriptions.extend(self._simple_subscriptions[topic])
-        for subscription in self._wildcard_subscriptions:
-            if subscription.matcher(topic):
-                subscriptions.append(subscription)
+            subscriptions[0:0] = self._simple_subscriptions[topic]
         return subscriptions
 
     @callback
@@ -960,13 +1046,3 @@ def _raise_on_error(result_code: int) -> None:
 
     if result_code and (message := mqtt.error_string(result_code)):
         raise HomeAssistantError(f"Error talking to MQTT: {message}")
-
-
-def _matcher_for_topic(subscription: str) -> Any:
-    # pylint: disable-next=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
@@ -14,16 +14,17 @@ from typing import Any, cast
 from lru import LRU  # pylint: disable=no-name-in-module
 import voluptuous as vol
 
-from homeassistant.components import persistent_notification
+from homeassistant.components import persistent_notification, websocket_api
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
+from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE, Platform
 from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.service import async_register_admin_service
 
-from .const import DOMAIN
+from .const import DOMAIN, JOB_TIMER
+from .job_timing import DEFAULT_SAMPLE_INTERVAL, DEFAULT_SLOW_JOB_TIME, JobTimer
 
 SERVICE_START = "start"
 SERVICE_MEMORY = "memory"
@@ -35,6 +36,8 @@ SERVICE_DUMP_LOG_OBJECTS = "dump_log_objects"
 SERVICE_LRU_STATS = "lru_stats"
 SERVICE_LOG_THREAD_FRAMES = "log_thread_frames"
 SERVICE_LOG_EVENT_LOOP_SCHEDULED = "log_event_loop_scheduled"
+SERVICE_START_JOB_TIMING = "start_job_timing"
+SERVICE_STOP_JOB_TIMING = "stop_job_timing"
 
 _LRU_CACHE_WRAPPER_OBJECT = _lru_cache_wrapper.__name__
 _SQLALCHEMY_LRU_OBJECT = "LRUCache"
@@ -57,14 +60,20 @@ SERVICES = (
     SERVICE_LRU_STATS,
     SERVICE_LOG_THREAD_FRAMES,
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
+    SERVICE_START_JOB_TIMING,
+    SERVICE_STOP_JOB_TIMING,
 )
 
+PLATFORMS = [Platform.SENSOR]
+
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
 
 DEFAULT_MAX_OBJECTS = 5
 
 CONF_SECONDS = "seconds"
 CONF_MAX_OBJECTS = "max_objects"
+CONF_SAMPLE_INTERVAL = "sample_interval"
+CONF_SLOW_JOB_TIME = "slow_job_time"
 
 LOG_INTERVAL_SUB = "log_interval_subscription"
 
@@ -77,7 +86,8 @@ async def async_setup_entry(  # noqa: C901
 ) -> bool:
     """Set up Profiler from a config entry."""
     lock = asyncio.Lock()
-    domain_data = hass.data[DOMAIN] = {}
+    job_timer = JobTimer(hass)
+    domain_data = hass.data[DOMAIN] = {JOB_TIMER: job_timer}
 
     async def _async_run_profile(call: ServiceCall) -> None:
         async with lock:
@@ -254,6 +264,20 @@ async def async_setup_entry(  # noqa: C901
             arepr.maxstring = original_maxstring
             arepr.maxother = original_maxother
 
+    @callback
+    def _async_start_job_timing(call: ServiceCall) -> None:
+        if job_timer.running:
+            raise HomeAssistantError("Job timing already started")
+        job_timer.async_start(
+            call.data[CONF_SAMPLE_INTERVAL], call.data[CONF_SLOW_JOB_TIME]
+        )
+
+    @callback
+    def _async_stop_job_timing(call: ServiceCall) -> None:
+        if not job_timer.running:
+            raise HomeAssistantError("Job timing not running")
+        job_timer.async_stop()
+
     async_register_admin_service(
         hass,
         DOMAIN,
@@ -348,19 +372,71 @@ async def async_setup_entry(  # noqa: C901
         _async_dump_scheduled,
     )
 
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_START_JOB_TIMING,
+        _async_start_job_timing,
+        schema=vol.Schema(
+            {
+                vol.Optional(
+                    CONF_SAMPLE_INTERVAL, default=DEFAULT_SAMPLE_INTERVAL
+                ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                vol.Optional(
+                    CONF_SLOW_JOB_TIME, default=DEFAULT_SLOW_JOB_TIME
+                ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+            }
+        ),
+    )
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_STOP_JOB_TIMING,
+        _async_stop_job_timing,
+    )
+
+    websocket_api.async_register_command(hass, websocket_job_timing)
+
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
+    if not await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        return False
     for service in SERVICES:
         hass.services.async_remove(domain=DOMAIN, service=service)
     if LOG_INTERVAL_SUB in hass.data[DOMAIN]:
         hass.data[DOMAIN][LOG_INTERVAL_SUB]()
+    hass.data[DOMAIN][JOB_TIMER].async_stop()
     hass.data.pop(DOMAIN)
     return True
 
 
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "profiler/job_timing",
+        vol.Optional("limit", default=50): vol.All(int, vol.Range(min=1)),
+    }
+)
+@callback
+def websocket_job_timing(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Return the execution times of the jobs that took the most time."""
+    if (domain_data := hass.data.get(DOMAIN)) is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Profiler not loaded"
+        )
+        return
+    job_timer: JobTimer = domain_data[JOB_TIMER]
+    connection.send_result(msg["id"], job_timer.async_as_dict(msg["limit"]))
+
+
 async def _async_generate_profile(hass: HomeAssistant, call: ServiceCall):
     # Imports deferred to avoid loading modules
     # in memory since usually only one part of this
@@ -2,3 +2,5 @@
 
 DOMAIN = "profiler"
 DEFAULT_NAME = "Profiler"
+
+JOB_TIMER = "job_timer"
@@ -0,0 +1,168 @@
+"""Time the callback jobs run in the event loop."""
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass, field
+import functools
+import logging
+import time
+from typing import Any, Final
+
+from homeassistant.core import HassJob, HomeAssistant, callback
+
+_LOGGER = logging.getLogger(__name__)
+
+# Upper bounds in seconds of the buckets of the job time histograms,
+# the last bucket has the jobs that took longer
+JOB_TIME_BUCKETS: Final = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0)
+
+DEFAULT_SAMPLE_INTERVAL: Final = 10
+DEFAULT_SLOW_JOB_TIME: Final = 0.1
+
+
+@dataclass(slots=True)
+class JobTimes:
+    """Execution times of a job."""
+
+    integration: str | None
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+    slow: int = 0
+    histogram: list[int] = field(
+        default_factory=lambda: [0] * (len(JOB_TIME_BUCKETS) + 1)
+    )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the execution times as a dict."""
+        return {
+            "integration": self.integration,
+            "count": self.count,
+            "total": self.total,
+            "max": self.max,
+            "slow": self.slow,
+            "histogram": self.histogram,
+        }
+
+
+def _job_name(target: Any) -> tuple[str, str | None]:
+    """Return the qualified name and integration of a job target."""
+    while isinstance(target, functools.partial):
+        target = target.func
+    module: str = getattr(target, "__module__", None) or type(target).__module__
+    qualname: str = getattr(target, "__qualname__", None) or type(target).__qualname__
+    integration: str | None = None
+    parts = module.split(".")
+    if parts[0] == "custom_components" and len(parts) > 1:
+        integration = parts[1]
+    elif parts[:2] == ["homeassistant", "components"] and len(parts) > 2:
+        integration = parts[2]
+    return f"{module}.{qualname}", integration
+
+
+class JobTimer:
+    """Time the callback jobs run by Home Assistant.
+
+    Every job is timed so slow jobs are always caught, but only one in
+    sample_interval runs is added to the histogram of its job to keep
+    the overhead low.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        sample_interval: int = DEFAULT_SAMPLE_INTERVAL,
+        slow_job_time: float = DEFAULT_SLOW_JOB_TIME,
+    ) -> None:
+        """Initialize the job timer."""
+        self.hass = hass
+        self.sample_interval = sample_interval
+        self.slow_job_time = slow_job_time
+        self.sampled = 0
+        self.slow = 0
+        self.jobs: dict[str, JobTimes] = {}
+        self._runs = 0
+
+    @property
+    def running(self) -> bool:
+        """Return if the jobs are being timed."""
+        return self.hass.job_runner == self.async_run_job
+
+    @callback
+    def async_start(self, sample_interval: int, slow_job_time: float) -> None:
+        """Start timing the jobs."""
+        self.sample_interval = sample_interval
+        self.slow_job_time = slow_job_time
+        self.hass.job_runner = self.async_run_job
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop timing the jobs."""
+        if self.running:
+            self.hass.job_runner = None
+
+    @callback
+    def async_run_job(self, job: HassJob[..., Any], args: tuple[Any, ...]) -> None:
+        """Run a callback job and time it."""
+        start = time.perf_counter()
+        try:
+            job.target(*args)
+        finally:
+            elapsed = time.perf_counter() - start
+            self._runs += 1
+            if (sampled := not self._runs % self.sample_interval) or (
+                elapsed >= self.slow_job_time
+            ):
+                self._async_record(job, elapsed, sampled)
+
+    @callback
+    def _async_record(
+        self, job: HassJob[..., Any], elapsed: float, sampled: bool
+    ) -> None:
+        """Record the execution time of a job."""
+        name, integration = _job_name(job.target)
+        if (times := self.jobs.get(name)) is None:
+            times = self.jobs[name] = JobTimes(integration)
+        if sampled:
+            self.sampled += 1
+            times.count += 1
+            times.total += elapsed
+            times.histogram[bisect_left(JOB_TIME_BUCKETS, elapsed)] += 1
+        if elapsed >= self.slow_job_time:
+            self.slow += 1
+            times.slow += 1
+            if elapsed > times.max:
+                # Only log when a job got slower to not flood the log
+                _LOGGER.warning(
+                    "Job %s from integration %s blocked the event loop for"
+                    " %.3f seconds",
+                    name,
+                    integration or "core",
+                    elapsed,
+                )
+        times.max = max(times.max, elapsed)
+
+    @callback
+    def async_slowest(self) -> tuple[str, JobTimes] | None:
+        """Return the job with the longest execution time."""
+        if not self.jobs:
+            return None
+        return max(self.jobs.items(), key=lambda item: item[1].max)
+
+    @callback
+    def async_as_dict(self, limit: int | None = None) -> dict[str, Any]:
+        """Return the execution times of the jobs with the most total time."""
+        jobs = sorted(
+            self.jobs.items(),
+            key=lambda item: (item[1].total, item[1].max),
+            reverse=True,
+        )
+        return {
+            "running": self.running,
+            "sample_interval": self.sample_interval,
+            "slow_job_time": self.slow_job_time,
+            "sampled": self.sampled,
+            "slow": self.slow,
+            "buckets": JOB_TIME_BUCKETS,
+            "jobs": {name: times.as_dict() for name, times in jobs[:limit]},
+        }
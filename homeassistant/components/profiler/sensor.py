@@ -0,0 +1,112 @@
+"""Sensors for the job timing of the profiler."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DEFAULT_NAME, DOMAIN, JOB_TIMER
+from .job_timing import JobTimer
+
+
+def _slowest_job_time(job_timer: JobTimer) -> float | None:
+    """Return the longest execution time of a job."""
+    if (slowest := job_timer.async_slowest()) is None:
+        return None
+    return slowest[1].max
+
+
+@dataclass
+class ProfilerSensorEntityDescriptionMixin:
+    """Mixin for required keys."""
+
+    value_fn: Callable[[JobTimer], float | int | None]
+
+
+@dataclass
+class ProfilerSensorEntityDescription(
+    SensorEntityDescription, ProfilerSensorEntityDescriptionMixin
+):
+    """Describes a profiler sensor entity."""
+
+
+SENSOR_DESCRIPTIONS = (
+    ProfilerSensorEntityDescription(
+        key="sampled_jobs",
+        translation_key="sampled_jobs",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda job_timer: job_timer.sampled,
+    ),
+    ProfilerSensorEntityDescription(
+        key="slow_jobs",
+        translation_key="slow_jobs",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda job_timer: job_timer.slow,
+    ),
+    ProfilerSensorEntityDescription(
+        key="slowest_job",
+        translation_key="slowest_job",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_display_precision=3,
+        value_fn=_slowest_job_time,
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the profiler sensors."""
+    job_timer: JobTimer = hass.data[DOMAIN][JOB_TIMER]
+    async_add_entities(
+        ProfilerSensor(job_timer, entry, description)
+        for description in SENSOR_DESCRIPTIONS
+    )
+
+
+class ProfilerSensor(SensorEntity):
+    """A sensor for the job timing of the profiler."""
+
+    entity_description: ProfilerSensorEntityDescription
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        job_timer: JobTimer,
+        entry: ConfigEntry,
+        description: ProfilerSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        self.entity_description = description
+        self._job_timer = job_timer
+        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
+        self._attr_device_info = DeviceInfo(
+            entry_type=DeviceEntryType.SERVICE,
+            identifiers={(DOMAIN, entry.entry_id)},
+            name=DEFAULT_NAME,
+        )
+
+    @property
+    def available(self) -> bool:
+        """Return if the jobs are being timed."""
+        return self._job_timer.running
+
+    @property
+    def native_value(self) -> float | int | None:
+        """Return the state of the sensor."""
+        return self.entity_description.value_fn(self._job_timer)
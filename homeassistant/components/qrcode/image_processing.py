@@ -6,6 +6,7 @@ import io
 from PIL import Image
 from pyzbar import pyzbar
 
+from homeassistant.components.camera.img_pool import async_run_image_job
 from homeassistant.components.image_processing import ImageProcessingEntity
 from homeassistant.const import CONF_ENTITY_ID, CONF_NAME, CONF_SOURCE
 from homeassistant.core import HomeAssistant, split_entity_id
@@ -56,13 +57,14 @@ class QrEntity(ImageProcessingEntity):
         """Return the name of the entity."""
         return self._name
 
-    def process_image(self, image):
+    async def async_process_image(self, image):
         """Process image."""
-        stream = io.BytesIO(image)
-        img = Image.open(stream)
+        self._state = await async_run_image_job(self.hass, _decode_qr_code, image)
 
-        barcodes = pyzbar.decode(img)
-        if barcodes:
-            self._state = barcodes[0].data.decode("utf-8")
-        else:
-            self._state = None
+
+def _decode_qr_code(image):
+    """Return the data of the first QR code in an image, runs in the image pool."""
+    barcodes = pyzbar.decode(Image.open(io.BytesIO(image)))
+    if barcodes:
+        return barcodes[0].data.decode("utf-8")
+    return None
@@ -52,12 +52,14 @@ DEFAULT_COMMIT_INTERVAL = 5
 CONF_AUTO_PURGE = "auto_purge"
 CONF_AUTO_REPACK = "auto_repack"
 CONF_DB_URL = "db_url"
+CONF_DB_READ_URL = "db_read_url"
 CONF_DB_MAX_RETRIES = "db_max_retries"
 CONF_DB_RETRY_WAIT = "db_retry_wait"
 CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
 CONF_EVENT_TYPES = "event_types"
 CONF_COMMIT_INTERVAL = "commit_interval"
+CONF_BULK_WRITE = "bulk_write"
 
 
 EXCLUDE_SCHEMA = INCLUDE_EXCLUDE_FILTER_SCHEMA_INNER.extend(
@@ -98,6 +100,7 @@ CONFIG_SCHEMA = vol.Schema(
                     ),
                     vol.Optional(CONF_PURGE_INTERVAL, default=1): cv.positive_int,
                     vol.Optional(CONF_DB_URL): vol.All(cv.string, validate_db_url),
+                    vol.Optional(CONF_DB_READ_URL): vol.All(cv.string, validate_db_url),
                     vol.Optional(
                         CONF_COMMIT_INTERVAL, default=DEFAULT_COMMIT_INTERVAL
                     ): cv.positive_int,
@@ -110,6 +113,7 @@ CONFIG_SCHEMA = vol.Schema(
                     vol.Optional(
                         CONF_DB_INTEGRITY_CHECK, default=DEFAULT_DB_INTEGRITY_CHECK
                     ): cv.boolean,
+                    vol.Optional(CONF_BULK_WRITE, default=False): cv.boolean,
                 }
             ),
         )
@@ -162,7 +166,10 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         entity_filter=entity_filter,
         exclude_event_types=exclude_event_types,
         exclude_attributes_by_domain=exclude_attributes_by_domain,
+        bulk_write=conf[CONF_BULK_WRITE],
+        db_read_url=conf.get(CONF_DB_READ_URL),
     )
+    await instance.purge_scheduler.async_load()
     instance.async_initialize()
     instance.async_register()
     instance.start()
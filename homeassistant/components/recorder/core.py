@@ -7,6 +7,7 @@ from concurrent.futures import CancelledError
 import contextlib
 from datetime import datetime, timedelta
 import logging
+import os
 import queue
 import sqlite3
 import threading
@@ -14,8 +15,8 @@ import time
 from typing import Any, TypeVar, cast
 
 import psutil_home_assistant as ha_psutil
-from sqlalchemy import create_engine, event as sqlalchemy_event, exc, select
-from sqlalchemy.engine import Engine
+from sqlalchemy import create_engine, event as sqlalchemy_event, exc, insert, select
+from sqlalchemy.engine import URL, Engine, make_url
 from sqlalchemy.engine.interfaces import DBAPIConnection
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import scoped_session, sessionmaker
@@ -78,6 +79,7 @@ from .db_schema import (
 from .executor import DBInterruptibleThreadPoolExecutor
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
 from .pool import POOL_SIZE, MutexPool, RecorderPool
+from .purge_scheduler import PurgeScheduler
 from .queries import (
     has_entity_ids_to_migrate,
     has_event_type_to_migrate,
@@ -158,6 +160,14 @@ CONNECTIVITY_ERR = "Error in database connectivity during commit"
 
 # Pool size must accommodate Recorder thread + All db executors
 MAX_DB_EXECUTOR_WORKERS = POOL_SIZE - 1
+# Least number of db executors reading from a read pool
+MIN_READ_POOL_WORKERS = 2
+MAX_READ_POOL_WORKERS = MAX_DB_EXECUTOR_WORKERS * 2
+
+# Columns copied from the ORM States objects when bulk writing states
+_BULK_STATES_COLUMNS = tuple(
+    column.key for column in States.__table__.columns if column.key != "state_id"
+)
 
 
 class Recorder(threading.Thread):
@@ -178,6 +188,8 @@ class Recorder(threading.Thread):
         entity_filter: Callable[[str], bool],
         exclude_event_types: set[str],
         exclude_attributes_by_domain: dict[str, set[str]],
+        bulk_write: bool = False,
+        db_read_url: str | None = None,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -191,6 +203,11 @@ class Recorder(threading.Thread):
         self.commit_interval = commit_interval
         self._queue: queue.SimpleQueue[RecorderTask] = queue.SimpleQueue()
         self.db_url = uri
+        # Reads from outside the recorder thread use a separate pool
+        # on this database, or on the database file itself for SQLite
+        self.db_read_url = db_read_url
+        self.read_engine: Engine | None = None
+        self._get_read_session: Callable[[], Session] | None = None
         self.db_max_retries = db_max_retries
         self.db_retry_wait = db_retry_wait
         self.database_engine: DatabaseEngine | None = None
@@ -215,6 +232,12 @@ class Recorder(threading.Thread):
         self.schema_version = 0
         self._commits_without_expire = 0
         self._event_session_has_pending_writes = False
+        # States are written with multi-row INSERTs at commit time
+        # instead of through the ORM unit of work when bulk_write is
+        # enabled and the database supports INSERT .. RETURNING for many rows
+        self.bulk_write = bulk_write
+        self._bulk_write_active = False
+        self._pending_bulk_states: list[States] = []
 
         self.recorder_runs_manager = RecorderRunsManager()
         self.states_manager = StatesManager()
@@ -225,6 +248,7 @@ class Recorder(threading.Thread):
             self, exclude_attributes_by_domain
         )
         self.statistics_meta_manager = StatisticsMetaManager(self)
+        self.purge_scheduler = PurgeScheduler(hass)
 
         self.event_session: Session | None = None
         self._get_session: Callable[[], Session] | None = None
@@ -273,6 +297,20 @@ class Recorder(threading.Thread):
             raise RuntimeError("The database connection has not been established")
         return self._get_session()
 
+    def get_read_session(self) -> Session:
+        """Get a new sqlalchemy session which is only used for reading.
+
+        In the database executor the session is from the read pool if
+        there is one, so reads do not contend with the writes of the
+        recorder thread. The recorder thread itself needs to see its own
+        writes and always uses the write pool.
+        """
+        if self._get_read_session is None or not (
+            threading.current_thread().name.startswith(DB_WORKER_PREFIX)
+        ):
+            return self.get_session()
+        return self._get_read_session()
+
     def queue_task(self, task: RecorderTask) -> None:
         """Add a task to the recorder queue."""
         self._queue.put(task)
@@ -281,12 +319,30 @@ class Recorder(threading.Thread):
         """Enable or disable recording events and states."""
         self.enabled = enable
 
+    @property
+    def _using_read_pool(self) -> bool:
+        """Return if reads from outside of the recorder thread use a read pool."""
+        return bool(self.db_read_url)
+
+    @property
+    def db_executor_workers(self) -> int:
+        """Return the number of database executor workers.
+
+        With a read pool the reads can run in parallel, one per CPU core
+        with at least MIN_READ_POOL_WORKERS and at most MAX_READ_POOL_WORKERS.
+        """
+        if self._using_read_pool:
+            return min(
+                max(MIN_READ_POOL_WORKERS, os.cpu_count() or 1), MAX_READ_POOL_WORKERS
+            )
+        return MAX_DB_EXECUTOR_WORKERS
+
     @callback
     def async_start_executor(self) -> None:
         """Start the executor."""
         self._db_executor = DBInterruptibleThreadPoolExecutor(
             thread_name_prefix=DB_WORKER_PREFIX,
-            max_workers=MAX_DB_EXECUTOR_WORKERS,
+            max_workers=self.db_executor_workers,
             shutdown_hook=self._shutdown_pool,
         )
 
@@ -671,6 +727,12 @@ class Recorder(threading.Thread):
             self.hass, self._async_five_minute_tasks, minute=range(0, 60, 5), second=10
         )
 
+        # Resume the purge which was in progress when Home Assistant stopped
+        if resume := self.purge_scheduler.resume:
+            self.purge_scheduler.resume = None
+            purge_before, repack, apply_filter = resume
+            self.queue_task(PurgeTask(purge_before, repack, apply_filter))
+
     async def _async_wait_for_started(self) -> object | None:
         """Wait for the hass started future."""
         return await self._hass_started
@@ -1132,8 +1194,57 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbstate_attributes)
             dbstate.state_attributes = dbstate_attributes
 
+        if self._bulk_write_active:
+            self._event_session_has_pending_writes = True
+            self._pending_bulk_states.append(dbstate)
+            return
+
         self._add_to_session(session, dbstate)
 
+    def _flush_bulk_states(self, session: Session) -> None:
+        """Write the pending states with multi-row INSERTs.
+
+        The shared rows (states meta, state attributes, event types and
+        event data) and events are flushed by the ORM first so their ids
+        are known. A state whose old_state is another state in the same
+        batch is inserted in a later round once that state_id is known.
+        """
+        session.flush()
+        pending = self._pending_bulk_states
+        batch = {id(dbstate) for dbstate in pending}
+        state_ids: dict[int, int] = {}
+        stmt = insert(States).returning(States.state_id, sort_by_parameter_order=True)
+        while pending:
+            ready: list[States] = []
+            deferred: list[States] = []
+            rows: list[dict[str, Any]] = []
+            for dbstate in pending:
+                old_state_id = dbstate.old_state_id
+                if (old_state := dbstate.old_state) is not None:
+                    old_state_key = id(old_state)
+                    if old_state_key in batch and old_state_key not in state_ids:
+                        deferred.append(dbstate)
+                        continue
+                    old_state_id = state_ids.get(old_state_key, old_state.state_id)
+                ready.append(dbstate)
+                row = {
+                    column: getattr(dbstate, column) for column in _BULK_STATES_COLUMNS
+                }
+                row["old_state_id"] = old_state_id
+                if (state_attributes := dbstate.state_attributes) is not None:
+                    row["attributes_id"] = state_attributes.attributes_id
+                if (states_meta := dbstate.states_meta_rel) is not None:
+                    row["metadata_id"] = states_meta.metadata_id
+                rows.append(row)
+            for dbstate, state_id in zip(ready, session.execute(stmt, rows).scalars()):
+                state_ids[id(dbstate)] = state_id
+            pending = deferred
+
+        # Set the state_ids only once every round is written so a retried
+        # commit starts from a clean batch
+        for dbstate in self._pending_bulk_states:
+            dbstate.state_id = state_ids[id(dbstate)]
+
     def _handle_database_error(self, err: Exception) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
         if isinstance(err.__cause__, sqlite3.DatabaseError):
@@ -1171,7 +1282,10 @@ class Recorder(threading.Thread):
         session = self.event_session
         self._commits_without_expire += 1
 
+        if self._pending_bulk_states:
+            self._flush_bulk_states(session)
         session.commit()
+        self._pending_bulk_states.clear()
         self._event_session_has_pending_writes = False
         # We just committed the state attributes to the database
         # and we now know the attributes_ids.  We can save
@@ -1209,6 +1323,7 @@ class Recorder(threading.Thread):
         self.event_type_manager.reset()
         self.states_meta_manager.reset()
         self.statistics_meta_manager.reset()
+        self._pending_bulk_states.clear()
 
         if not self.event_session:
             return
@@ -1364,6 +1479,8 @@ class Recorder(threading.Thread):
             kwargs["pool_reset_on_return"] = None
         elif self.db_url.startswith(SQLITE_URL_PREFIX):
             kwargs["poolclass"] = RecorderPool
+            # A connection for the recorder thread and each db executor worker
+            kwargs["pool_size"] = self.db_executor_workers + 1
         elif self.db_url.startswith(
             (
                 MARIADB_URL_PREFIX,
@@ -1394,11 +1511,100 @@ class Recorder(threading.Thread):
         sqlalchemy_event.listen(self.engine, "connect", self._setup_recorder_connection)
 
         Base.metadata.create_all(self.engine)
+        self._bulk_write_active = (
+            self.bulk_write
+            and self.engine.dialect.insert_executemany_returning_sort_by_parameter_order
+        )
+        if self.bulk_write and not self._bulk_write_active:
+            _LOGGER.warning(
+                "Bulk writes are not supported by the %s database, "
+                "states will be written one row at a time",
+                self.engine.dialect.name,
+            )
         self._get_session = scoped_session(sessionmaker(bind=self.engine, future=True))
         _LOGGER.debug("Connected to recorder database")
+        self._setup_read_connection()
+
+    def _setup_read_connection(self) -> None:
+        """Set up the pool for reads from outside of the recorder thread."""
+        if not self._using_read_pool:
+            return
+        kwargs: dict[str, Any] = {
+            "pool_size": self.db_executor_workers,
+            "max_overflow": 0,
+        }
+        assert self.db_read_url is not None
+        read_url = self.db_read_url
+        engine_url: str | URL = read_url
+        if (
+            self._using_file_sqlite
+            and ":memory:" not in self.db_url
+            and read_url == self.db_url
+        ):
+            # SQLite in WAL mode allows reading while the recorder
+            # thread writes, open the database file read-only
+            url = make_url(self.db_url)
+            assert url.database is not None
+            database = url.database
+            if database.startswith("/"):
+                # An authority is not allowed in SQLite URIs
+                database = "/" + database.lstrip("/")
+            engine_url = url.set(
+                database=f"file:{database}",
+                query={**url.query, "mode": "ro", "uri": "true"},
+            )
+            kwargs["connect_args"] = {"check_same_thread": False}
+        elif read_url.startswith(SQLITE_URL_PREFIX):
+            kwargs["connect_args"] = {"check_same_thread": False}
+        elif read_url.startswith(
+            (
+                MARIADB_URL_PREFIX,
+                MARIADB_PYMYSQL_URL_PREFIX,
+                MYSQLDB_URL_PREFIX,
+                MYSQLDB_PYMYSQL_URL_PREFIX,
+            )
+        ):
+            kwargs["connect_args"] = {"charset": "utf8mb4"}
+            if read_url.startswith((MARIADB_URL_PREFIX, MYSQLDB_URL_PREFIX)):
+                with contextlib.suppress(ImportError):
+                    kwargs["connect_args"]["conv"] = build_mysqldb_conv()
+
+        if not read_url.startswith(SQLITE_URL_PREFIX):
+            kwargs["echo"] = False
+        self.read_engine = create_engine(engine_url, **kwargs, future=True)
+        if self.read_engine.dialect.name != self.engine.dialect.name:
+            _LOGGER.error(
+                "The read database is a %s database while the recorder database is"
+                " a %s database, reads will use the recorder database",
+                self.read_engine.dialect.name,
+                self.engine.dialect.name,
+            )
+            self.read_engine.dispose()
+            self.read_engine = None
+            return
+        sqlalchemy_event.listen(
+            self.read_engine, "connect", self._setup_read_recorder_connection
+        )
+        self._get_read_session = scoped_session(
+            sessionmaker(bind=self.read_engine, future=True)
+        )
+        _LOGGER.debug("Connected to recorder read database")
+
+    def _setup_read_recorder_connection(
+        self, dbapi_connection: DBAPIConnection, connection_record: Any
+    ) -> None:
+        """Dbapi specific connection settings for the read pool."""
+        assert self.read_engine is not None
+        setup_connection_for_dialect(
+            self, self.read_engine.dialect.name, dbapi_connection, False
+        )
 
     def _close_connection(self) -> None:
         """Close the connection."""
+        if self.read_engine:
+            self.read_engine.dispose()
+            self.read_engine = None
+        self._get_read_session = None
         if self.engine:
             self.engine.dispose()
             self.engine = None
@@ -41,7 +41,7 @@ class RecorderPool(SingletonThreadPool, NullPool):  # type: ignore[misc]
         self, *args: Any, **kw: Any
     ) -> None:
         """Create the pool."""
-        kw["pool_size"] = POOL_SIZE
+        kw.setdefault("pool_size", POOL_SIZE)
         SingletonThreadPool.__init__(self, *args, **kw)
 
     @property
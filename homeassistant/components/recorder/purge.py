@@ -46,6 +46,7 @@ from .util import chunked, retryable_database_job, session_scope
 
 if TYPE_CHECKING:
     from . import Recorder
+    from .purge_scheduler import PurgeScheduler
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -62,10 +63,12 @@ def purge_old_data(
     apply_filter: bool = False,
     events_batch_size: int = DEFAULT_EVENTS_BATCHES_PER_PURGE,
     states_batch_size: int = DEFAULT_STATES_BATCHES_PER_PURGE,
+    scheduler: PurgeScheduler | None = None,
 ) -> bool:
     """Purge events and states older than purge_before.
 
     Cleans up an timeframe of an hour, based on the oldest record.
+    The purged batches are reported to the scheduler if one is passed.
     """
     _LOGGER.debug(
         "Purging states and events before target %s",
@@ -87,10 +90,10 @@ def purge_old_data(
             )
             # Once we are done purging legacy rows, we use the new method
             has_more_to_purge |= _purge_states_and_attributes_ids(
-                instance, session, states_batch_size, purge_before
+                instance, session, states_batch_size, purge_before, scheduler
             )
             has_more_to_purge |= _purge_events_and_data_ids(
-                instance, session, events_batch_size, purge_before
+                instance, session, events_batch_size, purge_before, scheduler
             )
 
         statistics_runs = _select_statistics_runs_to_purge(session, purge_before)
@@ -176,6 +179,7 @@ def _purge_states_and_attributes_ids(
     session: Session,
     states_batch_size: int,
     purge_before: datetime,
+    scheduler: PurgeScheduler | None = None,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
@@ -190,6 +194,7 @@ def _purge_states_and_attributes_ids(
     # SQLITE_MAX_BIND_VARS
     attributes_ids_batch: set[int] = set()
     for _ in range(states_batch_size):
+        batch_start = time.monotonic()
         state_ids, attributes_ids = _select_state_attributes_ids_to_purge(
             session, purge_before
         )
@@ -197,6 +202,10 @@ def _purge_states_and_attributes_ids(
             has_remaining_state_ids_to_purge = False
             break
         _purge_state_ids(instance, session, state_ids)
+        if scheduler:
+            scheduler.record_batch(
+                "states", len(state_ids), time.monotonic() - batch_start
+            )
         attributes_ids_batch = attributes_ids_batch | attributes_ids
 
     _purge_unused_attributes_ids(instance, session, attributes_ids_batch)
@@ -212,6 +221,7 @@ def _purge_events_and_data_ids(
     session: Session,
     events_batch_size: int,
     purge_before: datetime,
+    scheduler: PurgeScheduler | None = None,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
@@ -224,11 +234,16 @@ def _purge_events_and_data_ids(
     # SQLITE_MAX_BIND_VARS
     data_ids_batch: set[int] = set()
     for _ in range(events_batch_size):
+        batch_start = time.monotonic()
         event_ids, data_ids = _select_event_data_ids_to_purge(session, purge_before)
         if not event_ids:
             has_remaining_event_ids_to_purge = False
             break
         _purge_event_ids(session, event_ids)
+        if scheduler:
+            scheduler.record_batch(
+                "events", len(event_ids), time.monotonic() - batch_start
+            )
         data_ids_batch = data_ids_batch | data_ids
 
     _purge_unused_data_ids(instance, session, data_ids_batch)
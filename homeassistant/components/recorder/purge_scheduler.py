@@ -0,0 +1,165 @@
+"""Size purge batches to a time slice and keep track of the purge progress."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime
+import logging
+import time
+from typing import Any, Final, Literal
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+import homeassistant.util.dt as dt_util
+
+from .const import DOMAIN
+from .purge import DEFAULT_EVENTS_BATCHES_PER_PURGE, DEFAULT_STATES_BATCHES_PER_PURGE
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_KEY: Final = f"{DOMAIN}.purge"
+STORAGE_VERSION: Final = 1
+
+MAX_BATCHES_PER_PURGE: Final = 100
+
+# Seconds a purge pass may keep the recorder thread busy before
+# the queued events are written again
+PURGE_TIME_SLICE: Final = 1.0
+
+PurgeTable = Literal["states", "events"]
+
+
+class PurgeScheduler:
+    """Size the purge batches from their latency and track the progress.
+
+    A purge is done in passes which each delete a number of batches of
+    states and events and are interleaved with the other recorder tasks.
+    The number of batches of each table is adjusted after every pass so
+    a pass takes about the time slice. The purge in progress is saved so
+    it can be resumed after a restart.
+
+    Passes run in the recorder thread, the progress is published in the
+    event loop.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, time_slice: float = PURGE_TIME_SLICE
+    ) -> None:
+        """Initialize the purge scheduler."""
+        self.hass = hass
+        self.time_slice = time_slice
+        self.batches: dict[PurgeTable, int] = {
+            "states": DEFAULT_STATES_BATCHES_PER_PURGE,
+            "events": DEFAULT_EVENTS_BATCHES_PER_PURGE,
+        }
+        # Purge which was in progress when Home Assistant stopped
+        self.resume: tuple[datetime, bool, bool] | None = None
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._batch_seconds: dict[PurgeTable, float | None] = {
+            "states": None,
+            "events": None,
+        }
+        self._progress: dict[str, Any] | None = None
+        self._pass_start = 0.0
+        self._saved: datetime | None = None
+        self._published: dict[str, Any] | None = None
+        self._listeners: list[Callable[[dict[str, Any]], None]] = []
+
+    async def async_load(self) -> None:
+        """Load the purge that was in progress."""
+        if not (data := await self._store.async_load()):
+            return
+        if (purge_before := dt_util.parse_datetime(data["purge_before"])) is None:
+            return
+        self._saved = purge_before
+        self.resume = (purge_before, data["repack"], data["apply_filter"])
+
+    def begin_pass(
+        self, purge_before: datetime, repack: bool, apply_filter: bool
+    ) -> None:
+        """Start a purge pass, called from the recorder thread."""
+        progress = self._progress
+        if progress is None or progress["purge_before"] != purge_before:
+            self._progress = progress = {
+                "purge_before": purge_before,
+                "repack": repack,
+                "apply_filter": apply_filter,
+                "started": dt_util.utcnow(),
+                "passes": 0,
+                "states_purged": 0,
+                "events_purged": 0,
+                "last_pass_seconds": None,
+                "finished": False,
+            }
+        self._pass_start = time.monotonic()
+
+    def record_batch(self, table: PurgeTable, rows: int, seconds: float) -> None:
+        """Record a purged batch, called from the recorder thread."""
+        if (progress := self._progress) is not None:
+            progress[f"{table}_purged"] += rows
+        previous = self._batch_seconds[table]
+        self._batch_seconds[table] = (
+            seconds if previous is None else (previous + seconds) / 2
+        )
+
+    def end_pass(self, finished: bool) -> None:
+        """Finish a purge pass, called from the recorder thread."""
+        if (progress := self._progress) is None:
+            return
+        progress["passes"] += 1
+        progress["last_pass_seconds"] = time.monotonic() - self._pass_start
+        progress["finished"] = finished
+        # Each table gets half of the time slice
+        for table, seconds in self._batch_seconds.items():
+            if seconds:
+                self.batches[table] = max(
+                    1, min(MAX_BATCHES_PER_PURGE, int(self.time_slice / 2 / seconds))
+                )
+        _LOGGER.debug(
+            "Purge pass %s took %.3fs, next pass purges %s states and %s events"
+            " batches",
+            progress["passes"],
+            progress["last_pass_seconds"],
+            self.batches["states"],
+            self.batches["events"],
+        )
+        self.hass.add_job(self._async_publish, {**progress})
+        if finished:
+            self._progress = None
+
+    @callback
+    def _async_publish(self, progress: dict[str, Any]) -> None:
+        """Save the purge in progress and notify the listeners."""
+        purge_before: datetime = progress["purge_before"]
+        if progress["finished"]:
+            if self._saved is not None:
+                self._saved = None
+                self.hass.async_create_task(self._store.async_remove())
+        elif self._saved != purge_before:
+            self._saved = purge_before
+            self._store.async_delay_save(
+                lambda: {
+                    "purge_before": purge_before.isoformat(),
+                    "repack": progress["repack"],
+                    "apply_filter": progress["apply_filter"],
+                }
+            )
+        self._published = progress
+        for listener in tuple(self._listeners):
+            listener(progress)
+
+    @callback
+    def async_progress(self) -> dict[str, Any] | None:
+        """Return the progress of the last purge pass."""
+        return self._published
+
+    @callback
+    def async_listen(self, listener: Callable[[dict[str, Any]], None]) -> CALLBACK_TYPE:
+        """Listen for the progress after every purge pass."""
+        self._listeners.append(listener)
+
+        @callback
+        def _remove_listener() -> None:
+            """Remove the listener."""
+            self._listeners.remove(listener)
+
+        return _remove_listener
@@ -6,7 +6,8 @@ from collections.abc import Callable, Iterable, Sequence
 import contextlib
 import dataclasses
 from datetime import datetime, timedelta
-from functools import lru_cache, partial
+from functools import cache, lru_cache, partial
+from importlib.util import find_spec
 from itertools import chain, groupby
 import logging
 from operator import itemgetter
@@ -76,6 +77,8 @@ from .util import (
 )
 
 if TYPE_CHECKING:
+    import numpy as np
+
     from . import Recorder
 
 QUERY_STATISTICS = (
@@ -144,6 +147,10 @@ STATISTIC_UNIT_TO_UNIT_CONVERTER: dict[str | None, type[BaseUnitConverter]] = {
 
 _LOGGER = logging.getLogger(__name__)
 
+# Below this number of hourly rows the overhead of building the column
+# arrays outweighs the gain of reducing them in batch
+REDUCE_COLUMNAR_MIN_ROWS = 1000
+
 
 class BaseStatisticsRow(TypedDict, total=False):
     """A processed row of statistic data."""
@@ -1016,6 +1023,152 @@ def _reduce_statistics_per_month(
     )
 
 
+def _period_boundaries(
+    first_start: float,
+    last_start: float,
+    period_start_end: Callable[[float], tuple[float, float]],
+) -> list[float]:
+    """Return the boundaries of the periods from first_start to last_start."""
+    start, end = period_start_end(first_start)
+    boundaries = [start, end]
+    while end <= last_start:
+        end = period_start_end(end)[1]
+        boundaries.append(end)
+    return boundaries
+
+
+@cache
+def _has_numpy() -> bool:
+    """Return if numpy is installed to reduce large results in batch."""
+    return find_spec("numpy") is not None
+
+
+def _reduce_sorted_statistics_columnar(
+    hass: HomeAssistant,
+    stats: Sequence[Row[Any]],
+    statistic_ids: set[str] | None,
+    _metadata: dict[str, tuple[int, StatisticMetaData]],
+    units: dict[str, str] | None,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+    period_start_end: Callable[[float], tuple[float, float]],
+) -> dict[str, list[StatisticsRow]]:
+    """Reduce hourly SQL results to daily, weekly or monthly statistics in batch.
+
+    This returns the same as _sorted_statistics_to_dict followed by
+    _reduce_statistics without building a dict for every hourly row.
+
+    The columns are loaded into arrays which are split into segments at every
+    period or statistic boundary, so mean, min and max are reduced for all
+    periods of all statistics at once. Units are converted after reducing,
+    which gives the same result since the unit conversions are linear and
+    preserve order.
+    """
+    # numpy is only imported when large results are reduced since importing
+    # it slows down the start of the recorder
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    assert stats, "stats must not be empty"  # Guard against implementation error
+    result: dict[str, list[StatisticsRow]] = defaultdict(list)
+    metadata = dict(_metadata.values())
+    field_map: dict[str, int] = {key: idx for idx, key in enumerate(stats[0]._fields)}
+    row_count = len(stats)
+
+    def _column(idx: int) -> np.ndarray:
+        """Load a column of the SQL results into an array."""
+        return np.array([db_state[idx] for db_state in stats], dtype=np.float64)
+
+    starts = _column(field_map["start_ts"])
+    metadata_id_idx = field_map["metadata_id"]
+    metadata_ids = np.array([db_state[metadata_id_idx] for db_state in stats])
+    boundaries = np.array(
+        _period_boundaries(starts.min(), starts.max(), period_start_end)
+    )
+    period_idx = np.searchsorted(boundaries, starts, side="right") - 1
+
+    new_segment = np.empty(row_count, dtype=bool)
+    new_segment[0] = True
+    new_segment[1:] = (period_idx[1:] != period_idx[:-1]) | (
+        metadata_ids[1:] != metadata_ids[:-1]
+    )
+    segment_starts = np.flatnonzero(new_segment)
+    segment_periods = period_idx[segment_starts]
+
+    columns: dict[str, list[Any]] = {
+        "start": boundaries[segment_periods].tolist(),
+        "end": boundaries[segment_periods + 1].tolist(),
+    }
+    if "mean" in types:
+        values = _column(field_map["mean"])
+        has_value = ~np.isnan(values)
+        sums = np.add.reduceat(np.where(has_value, values, 0.0), segment_starts)
+        counts = np.add.reduceat(has_value, segment_starts)
+        columns["mean"] = np.where(
+            counts > 0, sums / np.maximum(counts, 1), None  # type: ignore[call-overload]
+        ).tolist()
+    for stat_type, reduce in (("min", np.fmin), ("max", np.fmax)):
+        if stat_type in types:
+            reduced = reduce.reduceat(_column(field_map[stat_type]), segment_starts)
+            columns[stat_type] = np.where(
+                np.isnan(reduced), None, reduced  # type: ignore[call-overload]
+            ).tolist()
+    # last_reset, state and sum are taken from the last row of each segment
+    last_rows = (np.append(segment_starts[1:], row_count) - 1).tolist()
+    for stat_type, column in (
+        ("last_reset", "last_reset_ts"),
+        ("state", "state"),
+        ("sum", "sum"),
+    ):
+        if stat_type in types:
+            idx = field_map[column]
+            columns[stat_type] = [stats[row][idx] for row in last_rows]
+
+    # Set all statistic IDs to empty lists in result set to maintain the order
+    if statistic_ids is not None:
+        seen_statistic_ids = {
+            metadata[meta_id]["statistic_id"]
+            for meta_id in np.unique(metadata_ids).tolist()
+        }
+        for stat_id in statistic_ids:
+            if stat_id in seen_statistic_ids:
+                result[stat_id] = []
+
+    segment_metadata_ids = metadata_ids[segment_starts]
+    statistic_bounds = [
+        0,
+        *(np.flatnonzero(np.diff(segment_metadata_ids)) + 1).tolist(),
+        len(segment_starts),
+    ]
+    keys = list(columns)
+    convert_columns = [
+        idx
+        for idx, key in enumerate(keys)
+        if key in ("mean", "min", "max", "state", "sum")
+    ]
+    for first, last in zip(statistic_bounds, statistic_bounds[1:]):
+        metadata_by_id = metadata[int(segment_metadata_ids[first])]
+        statistic_id = metadata_by_id["statistic_id"]
+        state_unit = unit = metadata_by_id["unit_of_measurement"]
+        if state := hass.states.get(statistic_id):
+            state_unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+        convert = _get_statistic_to_display_unit_converter(unit, state_unit, units)
+        stat_columns = [columns[key][first:last] for key in keys]
+        if convert:
+            for idx in convert_columns:
+                stat_columns[idx] = [convert(value) for value in stat_columns[idx]]
+        result[statistic_id] = [
+            dict(zip(keys, values)) for values in zip(*stat_columns)  # type: ignore[misc]
+        ]
+
+    return result
+
+
+_REDUCE_TS_FACTORIES = {
+    "day": reduce_day_ts_factory,
+    "week": reduce_week_ts_factory,
+    "month": reduce_month_ts_factory,
+}
+
+
 def _generate_statistics_during_period_stmt(
     start_time: datetime,
     end_time: datetime | None,
@@ -1651,27 +1804,37 @@ def _statistics_during_period_with_session(
     if not stats:
         return {}
 
-    result = _sorted_statistics_to_dict(
-        hass,
-        session,
-        stats,
-        statistic_ids,
-        metadata,
-        True,
-        table,
-        start_time,
-        units,
-        types,
-    )
+    if (
+        period in _REDUCE_TS_FACTORIES
+        and len(stats) >= REDUCE_COLUMNAR_MIN_ROWS
+        and _has_numpy()
+    ):
+        _, period_start_end = _REDUCE_TS_FACTORIES[period]()
+        result = _reduce_sorted_statistics_columnar(
+            hass, stats, statistic_ids, metadata, units, types, period_start_end
+        )
+    else:
+        result = _sorted_statistics_to_dict(
+            hass,
+            session,
+            stats,
+            statistic_ids,
+            metadata,
+            True,
+            table,
+            start_time,
+            units,
+            types,
+        )
 
-    if period == "day":
-        result = _reduce_statistics_per_day(result, types)
+        if period == "day":
+            result = _reduce_statistics_per_day(result, types)
 
-    if period == "week":
-        result = _reduce_statistics_per_week(result, types)
+        if period == "week":
+            result = _reduce_statistics_per_week(result, types)
 
-    if period == "month":
-        result = _reduce_statistics_per_month(result, types)
+        if period == "month":
+            result = _reduce_statistics_per_month(result, types)
 
     if "change" in _types:
         _augment_result_with_change(
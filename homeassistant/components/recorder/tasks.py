@@ -110,9 +110,19 @@ class PurgeTask(RecorderTask):
 
     def run(self, instance: Recorder) -> None:
         """Purge the database."""
-        if purge.purge_old_data(
-            instance, self.purge_before, self.repack, self.apply_filter
-        ):
+        scheduler = instance.purge_scheduler
+        scheduler.begin_pass(self.purge_before, self.repack, self.apply_filter)
+        finished = purge.purge_old_data(
+            instance,
+            self.purge_before,
+            self.repack,
+            self.apply_filter,
+            events_batch_size=scheduler.batches["events"],
+            states_batch_size=scheduler.batches["states"],
+            scheduler=scheduler,
+        )
+        scheduler.end_pass(finished)
+        if finished:
             with instance.get_session() as session:
                 instance.recorder_runs_manager.load_from_db(session)
             # We always need to do the db cleanups after a purge
@@ -120,7 +130,8 @@ class PurgeTask(RecorderTask):
             # tasks happen after a vacuum.
             periodic_db_cleanups(instance)
             return
-        # Schedule a new purge task if this one didn't finish
+        # Schedule a new purge task if this one didn't finish, the
+        # events queued in the meantime are written first
         instance.queue_task(
             PurgeTask(self.purge_before, self.repack, self.apply_filter)
         )
@@ -117,10 +117,12 @@ def session_scope(
 
     read_only is used to indicate that the session is only used for reading
     data and that no commit is required. It does not prevent the session
-    from writing and is not a security measure.
+    from writing and is not a security measure. Read only sessions use the
+    read pool of the recorder when there is one.
     """
     if session is None and hass is not None:
-        session = get_instance(hass).get_session()
+        instance = get_instance(hass)
+        session = instance.get_read_session() if read_only else instance.get_session()
 
     if session is None:
         raise RuntimeError("Session required")
@@ -85,6 +85,7 @@ def async_setup(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, ws_list_statistic_ids)
     websocket_api.async_register_command(hass, ws_import_statistics)
     websocket_api.async_register_command(hass, ws_info)
+    websocket_api.async_register_command(hass, ws_subscribe_purge_progress)
     websocket_api.async_register_command(hass, ws_update_statistics_metadata)
     websocket_api.async_register_command(hass, ws_validate_statistics)
 
@@ -512,6 +513,31 @@ def ws_info(
     connection.send_result(msg["id"], recorder_info)
 
 
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "recorder/subscribe_purge_progress",
+    }
+)
+@callback
+def ws_subscribe_purge_progress(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Subscribe to the progress of the database purge."""
+    purge_scheduler = get_instance(hass).purge_scheduler
+
+    @callback
+    def _forward_progress(progress: dict[str, Any]) -> None:
+        """Forward the progress after a purge pass."""
+        connection.send_message(websocket_api.event_message(msg["id"], progress))
+
+    connection.subscriptions[msg["id"]] = purge_scheduler.async_listen(
+        _forward_progress
+    )
+    connection.send_result(msg["id"])
+    if (progress := purge_scheduler.async_progress()) is not None:
+        _forward_progress(progress)
+
+
 @websocket_api.ws_require_user(only_supervisor=True)
 @websocket_api.websocket_command({vol.Required("type"): "backup/start"})
 @websocket_api.async_response
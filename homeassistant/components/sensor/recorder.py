@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from collections import defaultdict
 from collections.abc import Callable, Iterable, MutableMapping
+from dataclasses import dataclass, field
 import datetime
 import itertools
 import logging
@@ -18,6 +19,7 @@ from homeassistant.components.recorder import (
     statistics,
     util as recorder_util,
 )
+from homeassistant.components.recorder.db_schema import StatisticsShortTerm
 from homeassistant.components.recorder.models import (
     StatisticData,
     StatisticMetaData,
@@ -25,14 +27,23 @@ from homeassistant.components.recorder.models import (
 )
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_STATE_CHANGED,
     REVOLUTIONS_PER_MINUTE,
     UnitOfIrradiance,
     UnitOfSoundPressure,
     UnitOfVolume,
 )
-from homeassistant.core import HomeAssistant, State, callback, split_entity_id
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    HomeAssistant,
+    State,
+    callback,
+    split_entity_id,
+)
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import entity_sources
+from homeassistant.helpers.event import EventStateChangedData
+from homeassistant.helpers.typing import EventType
 from homeassistant.util import dt as dt_util
 from homeassistant.util.enum import try_parse_enum
 
@@ -71,6 +82,11 @@ WARN_UNSTABLE_UNIT = "sensor_warn_unstable_unit"
 # Link to dev statistics where issues around LTS can be fixed
 LINK_DEV_STATISTICS = "https://my.home-assistant.io/redirect/developer_statistics"
 
+DATA_STATISTICS_ACCUMULATOR = "sensor_statistics_accumulator"
+# Number of finished periods the accumulator keeps for each sensor, the
+# statistics of a period are compiled shortly after it has ended
+ACCUMULATOR_KEEP_PERIODS = 2
+
 
 def _get_sensor_states(hass: HomeAssistant) -> list[State]:
     """Get the current state of all sensors for which to compile statistics."""
@@ -386,6 +402,221 @@ def _timestamp_to_isoformat_or_none(timestamp: float | None) -> str | None:
     return dt_util.utc_from_timestamp(timestamp).isoformat()
 
 
+def _short_term_period_start(time: datetime.datetime) -> datetime.datetime:
+    """Return the start of the short term statistics period of a point in time."""
+    period_seconds = int(StatisticsShortTerm.duration.total_seconds())
+    seconds = time.minute * 60 + time.second
+    return time.replace(minute=0, second=0, microsecond=0) + datetime.timedelta(
+        seconds=seconds - seconds % period_seconds
+    )
+
+
+@dataclass(slots=True)
+class _MeanAccumulator:
+    """Running time weighted average, min and max of a sensor in a period."""
+
+    unit_state: State | None = None
+    unit_changed: bool = False
+    first_time: datetime.datetime | None = None
+    last_time: datetime.datetime | None = None
+    last_value: float = 0.0
+    accumulated: float = 0.0
+    min: float = 0.0
+    max: float = 0.0
+
+    def add(self, fstate: float, state: State, time: datetime.datetime) -> None:
+        """Add a float state which was set at time."""
+        if self.unit_state is None:
+            self.unit_state = state
+            self.first_time = time
+            self.min = self.max = fstate
+        else:
+            if state.attributes.get(
+                ATTR_UNIT_OF_MEASUREMENT
+            ) != self.unit_state.attributes.get(ATTR_UNIT_OF_MEASUREMENT):
+                self.unit_changed = True
+            assert self.last_time is not None
+            # Same order of operations as _time_weighted_average
+            self.accumulated += (
+                self.last_value * (time - self.last_time).total_seconds()
+            )
+            self.min = min(self.min, fstate)
+            self.max = max(self.max, fstate)
+        self.last_value = fstate
+        self.last_time = time
+
+    def mean(self, end: datetime.datetime) -> float:
+        """Return the time weighted average until end."""
+        assert self.first_time is not None and self.last_time is not None
+        accumulated = (
+            self.accumulated + self.last_value * (end - self.last_time).total_seconds()
+        )
+        if (period_seconds := (end - self.first_time).total_seconds()) == 0:
+            return 0.0
+        return accumulated / period_seconds
+
+
+@dataclass(slots=True)
+class _PeriodAccumulator:
+    """The state changes of a sensor in a short term statistics period.
+
+    Sensors with a sum keep their float states to detect resets, the
+    other sensors are reduced to a running mean, min and max.
+    """
+
+    has_sum: bool
+    # The state of the sensor at the start of the period
+    start_state: State | None
+    fstates: list[tuple[float, State]] = field(default_factory=list)
+    mean: _MeanAccumulator = field(default_factory=_MeanAccumulator)
+    valid: bool = True
+
+    @classmethod
+    def from_start_state(
+        cls, has_sum: bool, start_state: State | None, start: datetime.datetime
+    ) -> _PeriodAccumulator:
+        """Start a period from the state the sensor had at its start."""
+        period = cls(has_sum, start_state)
+        if start_state is not None:
+            period.add(start_state, start)
+        return period
+
+    def add(self, state: State, time: datetime.datetime) -> None:
+        """Add a state like the history queries of the statistics compiler."""
+        if (fstate := _float_or_none(state.state)) is None:
+            return
+        if self.has_sum:
+            self.fstates.append((fstate, state))
+        else:
+            self.mean.add(fstate, state, time)
+
+
+@dataclass(slots=True)
+class _SensorAccumulator:
+    """The periods accumulated for a sensor."""
+
+    # The state changes of the sensor are all known from this point in time
+    since: datetime.datetime
+    last_state: State | None
+    periods: dict[datetime.datetime, _PeriodAccumulator] = field(default_factory=dict)
+
+
+class SensorStatisticsAccumulator:
+    """Accumulate the short term statistics of sensors from state changes.
+
+    The statistics of a period can be compiled from the accumulator
+    instead of reading the history of the period back from the database,
+    as long as every state change of the sensor since the start of the
+    period was seen. Otherwise, like after a restart, the statistics are
+    compiled from the history.
+
+    The accumulator is updated in the event loop and read by the recorder
+    thread. Periods are only read after they have ended, and the periods
+    of a sensor are only ever added or removed as a whole.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the accumulator."""
+        self.hass = hass
+        self._sensors: dict[str, _SensorAccumulator] = {}
+
+    @callback
+    def async_setup(self) -> CALLBACK_TYPE:
+        """Start accumulating from state_changed events."""
+        return self.hass.bus.async_listen(
+            EVENT_STATE_CHANGED, self._async_state_changed, run_immediately=True
+        )
+
+    @callback
+    def _async_state_changed(self, event: EventType[EventStateChangedData]) -> None:
+        """Add a state change to the period it happened in."""
+        entity_id = event.data["entity_id"]
+        if split_entity_id(entity_id)[0] != DOMAIN:
+            return
+        sensors = self._sensors
+        new_state = event.data["new_state"]
+        if (
+            new_state is None
+            or (state_class := new_state.attributes.get(ATTR_STATE_CLASS)) is None
+            or not get_instance(self.hass).entity_filter(entity_id)
+        ):
+            sensors.pop(entity_id, None)
+            return
+        time = new_state.last_updated
+        sensor = sensors.get(entity_id)
+        if sensor is None or (
+            sensor.last_state is not None and time < sensor.last_state.last_updated
+        ):
+            # The earlier state changes were not seen or happened out of order
+            old_state = event.data["old_state"]
+            if old_state is not None and old_state.last_updated > time:
+                old_state = None
+            sensor = sensors[entity_id] = _SensorAccumulator(time, old_state)
+
+        has_sum = state_class in (
+            SensorStateClass.TOTAL,
+            SensorStateClass.TOTAL_INCREASING,
+        )
+        period_start = _short_term_period_start(time)
+        if (period := sensor.periods.get(period_start)) is None:
+            period = _PeriodAccumulator.from_start_state(
+                has_sum, sensor.last_state, period_start
+            )
+            sensor.periods[period_start] = period
+            self._async_trim_periods(sensor, period_start)
+        elif period.has_sum != has_sum:
+            period.valid = False
+        # The statistics of sensors without a sum are compiled from the
+        # significant states only, like the history query does.
+        if has_sum or new_state.last_changed == new_state.last_updated:
+            period.add(new_state, time)
+        sensor.last_state = new_state
+
+    @callback
+    def _async_trim_periods(
+        self, sensor: _SensorAccumulator, period_start: datetime.datetime
+    ) -> None:
+        """Drop the periods which are too old to still be compiled."""
+        duration = StatisticsShortTerm.duration
+        cutoff = period_start - ACCUMULATOR_KEEP_PERIODS * duration
+        periods = sensor.periods
+        for start in [start for start in periods if start < cutoff]:
+            del periods[start]
+            sensor.since = max(sensor.since, start + duration)
+
+    def get_period(
+        self,
+        entity_id: str,
+        has_sum: bool,
+        start: datetime.datetime,
+        end: datetime.datetime,
+    ) -> _PeriodAccumulator | None:
+        """Return the accumulated period or None if it was not fully seen.
+
+        This method is called from the recorder thread.
+        """
+        if (
+            end - start != StatisticsShortTerm.duration
+            or (sensor := self._sensors.get(entity_id)) is None
+            or start < sensor.since
+        ):
+            return None
+        if (period := sensor.periods.get(start)) is None:
+            # The sensor did not change during the period
+            if (
+                last_state := sensor.last_state
+            ) is not None and last_state.last_updated < start:
+                start_state: State | None = last_state
+            elif (next_period := sensor.periods.get(end)) is not None:
+                start_state = next_period.start_state
+            else:
+                return None
+            period = _PeriodAccumulator.from_start_state(has_sum, start_state, start)
+        if not period.valid or period.has_sum != has_sum or period.mean.unit_changed:
+            return None
+        return period
+
+
 def compile_statistics(
     hass: HomeAssistant, start: datetime.datetime, end: datetime.datetime
 ) -> statistics.PlatformCompiledStatistics:
@@ -401,8 +632,15 @@ def compile_statistics(
     # If we ever need to write to the database from this function we
     # will need to refactor the recorder statistics to use a single
     # session.
+    if (accumulator := hass.data.get(DATA_STATISTICS_ACCUMULATOR)) is None:
+        # Later periods can be compiled from the state changes
+        # seen from now on instead of from the history
+        accumulator = hass.data[
+            DATA_STATISTICS_ACCUMULATOR
+        ] = SensorStatisticsAccumulator(hass)
+        hass.loop.call_soon_threadsafe(accumulator.async_setup)
     with recorder_util.session_scope(hass=hass, read_only=True) as session:
-        compiled = _compile_statistics(hass, session, start, end)
+        compiled = _compile_statistics(hass, session, start, end, accumulator)
     return compiled
 
 
@@ -411,15 +649,28 @@ def _compile_statistics(  # noqa: C901
     session: Session,
     start: datetime.datetime,
     end: datetime.datetime,
+    accumulator: SensorStatisticsAccumulator | None = None,
 ) -> statistics.PlatformCompiledStatistics:
     """Compile statistics for all entities during start-end."""
     result: list[StatisticResult] = []
 
     sensor_states = _get_sensor_states(hass)
     wanted_statistics = _wanted_statistics(sensor_states)
+    # Use the accumulated periods, the history is only needed for
+    # the sensors for which not all state changes were seen
+    accumulated: dict[str, _PeriodAccumulator] = {}
+    if accumulator is not None:
+        for _state in sensor_states:
+            entity_id = _state.entity_id
+            if period := accumulator.get_period(
+                entity_id, "sum" in wanted_statistics[entity_id], start, end
+            ):
+                accumulated[entity_id] = period
     # Get history between start and end
     entities_full_history = [
-        i.entity_id for i in sensor_states if "sum" in wanted_statistics[i.entity_id]
+        i.entity_id
+        for i in sensor_states
+        if "sum" in wanted_statistics[i.entity_id] and i.entity_id not in accumulated
     ]
     history_list: MutableMapping[str, list[State]] = {}
     if entities_full_history:
@@ -435,6 +686,7 @@ def _compile_statistics(  # noqa: C901
         i.entity_id
         for i in sensor_states
         if "sum" not in wanted_statistics[i.entity_id]
+        and i.entity_id not in accumulated
     ]
     if entities_significant_history:
         _history_list = history.get_full_significant_states_with_session(
@@ -449,6 +701,21 @@ def _compile_statistics(  # noqa: C901
     entities_with_float_states: dict[str, list[tuple[float, State]]] = {}
     for _state in sensor_states:
         entity_id = _state.entity_id
+        if period := accumulated.get(entity_id):
+            if period.has_sum:
+                float_states = period.fstates
+            elif (unit_state := period.mean.unit_state) is not None:
+                # The mean, min and max are normalized like float states
+                float_states = [
+                    (period.mean.mean(end), unit_state),
+                    (period.mean.min, unit_state),
+                    (period.mean.max, unit_state),
+                ]
+            else:
+                continue
+            if float_states:
+                entities_with_float_states[entity_id] = float_states
+            continue
         # If there are no recent state changes, the sensor's state may already be pruned
         # from the recorder. Get the state from the state machine instead.
         if not (entity_history := history_list.get(entity_id, [_state])):
@@ -529,23 +796,32 @@ def _compile_statistics(  # noqa: C901
 
         # Make calculations
         stat: StatisticData = {"start": start}
-        if "max" in wanted_statistics[entity_id]:
-            stat["max"] = max(
-                *itertools.islice(
-                    zip(*valid_float_states),  # type: ignore[typeddict-item]
-                    1,
+        if (period := accumulated.get(entity_id)) and not period.has_sum:
+            # The accumulator already reduced the period to these
+            (mean, _), (min_, _), (max_, _) = valid_float_states
+            if "max" in wanted_statistics[entity_id]:
+                stat["max"] = max_
+            if "min" in wanted_statistics[entity_id]:
+                stat["min"] = min_
+            if "mean" in wanted_statistics[entity_id]:
+                stat["mean"] = mean
+        else:
+            if "max" in wanted_statistics[entity_id]:
+                stat["max"] = max(
+                    *itertools.islice(
+                        zip(*valid_float_states),  # type: ignore[typeddict-item]
+                        1,
+                    )
                 )
-            )
-        if "min" in wanted_statistics[entity_id]:
-            stat["min"] = min(
-                *itertools.islice(
-                    zip(*valid_float_states),  # type: ignore[typeddict-item]
-                    1,
+            if "min" in wanted_statistics[entity_id]:
+                stat["min"] = min(
+                    *itertools.islice(
+                        zip(*valid_float_states),  # type: ignore[typeddict-item]
+                        1,
+                    )
                 )
-            )
-
-        if "mean" in wanted_statistics[entity_id]:
-            stat["mean"] = _time_weighted_average(valid_float_states, start, end)
+            if "mean" in wanted_statistics[entity_id]:
+                stat["mean"] = _time_weighted_average(valid_float_states, start, end)
 
         if "sum" in wanted_statistics[entity_id]:
             last_reset = old_last_reset = None
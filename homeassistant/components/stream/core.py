@@ -76,8 +76,8 @@ class Part:
 
     duration: float = attr.ib()
     has_keyframe: bool = attr.ib()
-    # video data (moof+mdat)
-    data: bytes = attr.ib()
+    # video data (moof+mdat), a view of the segment data once it is complete
+    data: bytes | memoryview = attr.ib()
 
 
 @attr.s(slots=True)
@@ -101,6 +101,8 @@ class Segment:
     hls_num_parts_rendered: int = attr.ib(default=0)
     # Set to true when all the parts are rendered
     hls_playlist_complete: bool = attr.ib(default=False)
+    # Data of all parts once the segment is complete, shared by the parts
+    _data: memoryview | None = attr.ib(default=None, init=False)
 
     def __attrs_post_init__(self) -> None:
         """Run after init."""
@@ -120,6 +122,8 @@ class Segment:
     @property
     def data_size(self) -> int:
         """Return the size of all part data without init in bytes."""
+        if self._data is not None:
+            return len(self._data)
         return sum(len(part.data) for part in self.parts)
 
     @callback
@@ -127,18 +131,30 @@ class Segment:
         self,
         part: Part,
         duration: float,
+        data: bytes | None = None,
     ) -> None:
         """Add a part to the Segment.
 
-        Duration is non zero only for the last part.
+        Duration is non zero only for the last part, which may come with the
+        data of all parts. The parts are then replaced by views of that data
+        so the segment and its parts are served from one immutable buffer.
         """
         self.parts.append(part)
         self.duration = duration
+        if data is not None:
+            self._data = view = memoryview(data)
+            offset = 0
+            for segment_part in self.parts:
+                end = offset + len(segment_part.data)
+                segment_part.data = view[offset:end]
+                offset = end
         for output in self._stream_outputs:
             output.part_put()
 
-    def get_data(self) -> bytes:
-        """Return reconstructed data for all parts as bytes, without init."""
+    def get_data(self) -> bytes | memoryview:
+        """Return data for all parts, without init."""
+        if self._data is not None:
+            return self._data
         return b"".join([part.data for part in self.parts])
 
     def _render_hls_template(self, last_stream_id: int, render_parts: bool) -> str:
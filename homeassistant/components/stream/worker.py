@@ -137,6 +137,7 @@ class StreamMuxer:
         self._segment: Segment | None = None
         # the following 3 member variables are used for Part formation
         self._memory_file_pos: int = cast(int, None)
+        self._segment_data_pos: int = cast(int, None)
         self._part_start_dts: int = cast(int, None)
         self._part_has_keyframe = False
         self._stream_settings = stream_settings
@@ -286,7 +287,7 @@ class StreamMuxer:
             stream_outputs=self._stream_state.outputs,
             start_time=self._start_time,
         )
-        self._memory_file_pos = self._memory_file.tell()
+        self._memory_file_pos = self._segment_data_pos = self._memory_file.tell()
         self._memory_file.seek(0, SEEK_END)
 
     def check_flush_part(self, packet: av.Packet) -> None:
@@ -349,7 +350,19 @@ class StreamMuxer:
         if not self._stream_settings.ll_hls:
             adjusted_dts = packet.dts
         assert self._segment
-        self._memory_file.seek(self._memory_file_pos)
+        segment_data: bytes | None = None
+        part_data: bytes | memoryview
+        if last_part:
+            # Read the data of all the parts once so the segment and its parts
+            # can be served from one buffer
+            self._memory_file.seek(self._segment_data_pos)
+            segment_data = self._memory_file.read()
+            part_data = memoryview(segment_data)[
+                self._memory_file_pos - self._segment_data_pos :
+            ]
+        else:
+            self._memory_file.seek(self._memory_file_pos)
+            part_data = self._memory_file.read()
         self._hass.loop.call_soon_threadsafe(
             self._segment.async_add_part,
             Part(
@@ -357,7 +370,7 @@ class StreamMuxer:
                     (adjusted_dts - self._part_start_dts) * packet.time_base
                 ),
                 has_keyframe=self._part_has_keyframe,
-                data=self._memory_file.read(),
+                data=part_data,
             ),
             (
                 segment_duration := float(
@@ -366,6 +379,7 @@ class StreamMuxer:
             )
             if last_part
             else 0,
+            segment_data,
         )
         if last_part:
             # If we've written the last part, we can close the memory_file.
@@ -0,0 +1,20 @@
+"""Diagnostics support for Template."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.event import async_get_template_render_stats
+from homeassistant.helpers.template import async_get_compile_stats
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    return {
+        "options": dict(entry.options),
+        "template_compile_stats": async_get_compile_stats(hass),
+        "template_render_stats": async_get_template_render_stats(hass),
+    }
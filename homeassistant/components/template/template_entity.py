@@ -451,6 +451,7 @@ class TemplateEntity(Entity):
             template_var_tups,
             self._handle_results,
             has_super_template=has_availability_template,
+            coalesce_renders=True,
         )
         self.async_on_remove(result_info.async_remove)
         self._async_update = result_info.async_refresh
@@ -13,16 +13,26 @@ from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.json import ExtendedJSONEncoder
 from homeassistant.helpers.storage import Store
+from homeassistant.helpers.trace import trace_set_enabled
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.util.limited_size_dict import LimitedSizeDict
 
 from . import websocket_api
 from .const import (
+    CONF_SAMPLE_INTERVAL,
     CONF_STORED_TRACES,
+    CONF_TRACE_MODE,
     DATA_TRACE,
+    DATA_TRACE_RUNS,
     DATA_TRACE_STORE,
     DATA_TRACES_RESTORED,
+    DEFAULT_SAMPLE_INTERVAL,
     DEFAULT_STORED_TRACES,
+    TRACE_MODE_ERRORS,
+    TRACE_MODE_FULL,
+    TRACE_MODE_OFF,
+    TRACE_MODE_SAMPLED,
+    TRACE_MODES,
 )
 from .models import ActionTrace, BaseTrace, RestoredTrace
 
@@ -34,7 +44,11 @@ STORAGE_KEY = "trace.saved_traces"
 STORAGE_VERSION = 1
 
 TRACE_CONFIG_SCHEMA = {
-    vol.Optional(CONF_STORED_TRACES, default=DEFAULT_STORED_TRACES): cv.positive_int
+    vol.Optional(CONF_STORED_TRACES, default=DEFAULT_STORED_TRACES): cv.positive_int,
+    vol.Optional(CONF_TRACE_MODE, default=TRACE_MODE_FULL): vol.In(TRACE_MODES),
+    vol.Optional(CONF_SAMPLE_INTERVAL, default=DEFAULT_SAMPLE_INTERVAL): vol.All(
+        vol.Coerce(int), vol.Range(min=1)
+    ),
 }
 
 CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
@@ -50,6 +64,7 @@ def _get_data(hass: HomeAssistant) -> TraceData:
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Initialize the trace integration."""
     hass.data[DATA_TRACE] = {}
+    hass.data[DATA_TRACE_RUNS] = {}
     websocket_api.async_setup(hass)
     store = Store[dict[str, list]](
         hass, STORAGE_VERSION, STORAGE_KEY, encoder=ExtendedJSONEncoder
@@ -151,6 +166,37 @@ def async_store_trace(
         traces[key][trace.run_id] = trace
 
 
+@callback
+def async_start_trace(
+    hass: HomeAssistant, trace: ActionTrace, trace_config: ConfigType
+) -> None:
+    """Start tracing a run according to the trace mode.
+
+    The steps of runs which are not traced are not recorded. In errors mode
+    the steps are recorded, but the trace is only stored if the run fails.
+    """
+    stored_traces: int = trace_config[CONF_STORED_TRACES]
+    if (mode := trace_config[CONF_TRACE_MODE]) == TRACE_MODE_SAMPLED:
+        runs: dict[str, int] = hass.data[DATA_TRACE_RUNS]
+        run = runs.get(trace.key, 0)
+        runs[trace.key] = run + 1
+        traced = not run % trace_config[CONF_SAMPLE_INTERVAL]
+    else:
+        traced = mode != TRACE_MODE_OFF
+    trace_set_enabled(traced and stored_traces > 0)
+    if traced and mode != TRACE_MODE_ERRORS:
+        async_store_trace(hass, trace, stored_traces)
+
+
+@callback
+def async_finish_trace(
+    hass: HomeAssistant, trace: ActionTrace, trace_config: ConfigType
+) -> None:
+    """Store the trace of a failed run in errors mode."""
+    if trace_config[CONF_TRACE_MODE] == TRACE_MODE_ERRORS and trace.error is not None:
+        async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+
+
 def _async_store_restored_trace(hass: HomeAssistant, trace: RestoredTrace) -> None:
     """Store a restored trace and move it to the end of the LimitedSizeDict."""
     key = trace.key
@@ -71,6 +71,11 @@ class ActionTrace(BaseTrace):
             trace_set_child_id(self.key, self.run_id)
         trace_id_set((self.key, self.run_id))
 
+    @property
+    def error(self) -> Exception | None:
+        """Return the error of the run."""
+        return self._error
+
     def set_trace(self, trace: dict[str, deque[TraceElement]] | None) -> None:
         """Set action trace."""
         self._trace = trace
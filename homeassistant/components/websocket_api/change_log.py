@@ -0,0 +1,78 @@
+"""Sequence-numbered log of recent state changes for resumable subscriptions."""
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable
+from itertools import islice
+from typing import Final
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.singleton import singleton
+from homeassistant.util.ulid import ulid_hex
+
+DATA_STATE_CHANGE_LOG: Final = "websocket_api_state_change_log"
+
+# Number of state changes kept to catch up clients that reconnect
+STATE_CHANGE_LOG_SIZE: Final = 4096
+
+
+@callback
+@singleton(DATA_STATE_CHANGE_LOG)
+def async_get_state_change_log(hass: HomeAssistant) -> StateChangeLog:
+    """Return the state change log, starting it on first use."""
+    change_log = StateChangeLog(STATE_CHANGE_LOG_SIZE)
+    hass.bus.async_listen(
+        EVENT_STATE_CHANGED, change_log.async_add_event, run_immediately=True
+    )
+    return change_log
+
+
+class StateChangeLog:
+    """Keep the most recent state changes with a sequence number.
+
+    Subscribers receive every state change with its sequence number so a
+    client can resume from the last one it has seen. The log id changes on
+    every restart, which makes sequence numbers from before invalid.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        """Initialize the state change log."""
+        self.log_id = ulid_hex()
+        self.seq = 0
+        self._entries: deque[tuple[int, Event]] = deque(maxlen=max_entries)
+        self._listeners: list[Callable[[int, Event], None]] = []
+
+    @callback
+    def async_add_event(self, event: Event) -> None:
+        """Add a state change to the log and forward it to the listeners."""
+        self.seq += 1
+        seq = self.seq
+        self._entries.append((seq, event))
+        for listener in tuple(self._listeners):
+            listener(seq, event)
+
+    @callback
+    def async_listen(self, listener: Callable[[int, Event], None]) -> CALLBACK_TYPE:
+        """Listen for state changes with their sequence number."""
+        self._listeners.append(listener)
+
+        @callback
+        def _remove_listener() -> None:
+            """Remove the listener."""
+            self._listeners.remove(listener)
+
+        return _remove_listener
+
+    @callback
+    def async_changes_since(self, log_id: str, seq: int) -> list[Event] | None:
+        """Return the state changes after seq or None if they are not all known."""
+        if log_id != self.log_id or seq > self.seq:
+            return None
+        missed = self.seq - seq
+        if missed > len(self._entries):
+            return None
+        if not missed:
+            return []
+        entries = self._entries
+        return [event for _, event in islice(entries, len(entries) - missed, None)]
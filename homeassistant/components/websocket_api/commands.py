@@ -40,6 +40,7 @@ from homeassistant.helpers.json import (
 from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.helpers.typing import EventType
 from homeassistant.loader import (
+    DATA_IMPORT_TIME,
     Integration,
     IntegrationNotFound,
     async_get_integration,
@@ -50,6 +51,7 @@ from homeassistant.setup import DATA_SETUP_TIME, async_get_loaded_integrations
 from homeassistant.util.json import format_unserializable_data
 
 from . import const, decorators, messages
+from .change_log import async_get_state_change_log
 from .connection import ActiveConnection
 from .const import ERR_NOT_FOUND
 from .messages import construct_event_message, construct_result_message
@@ -74,6 +76,7 @@ def async_register_commands(
     async_reg(hass, handle_integration_setup_info)
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_ping)
+    async_reg(hass, handle_connection_stats)
     async_reg(hass, handle_render_template)
     async_reg(hass, handle_subscribe_bootstrap_integrations)
     async_reg(hass, handle_subscribe_events)
@@ -301,6 +304,19 @@ def _send_handle_get_states_response(
     connection.send_message(construct_result_message(msg_id, f"[{joined_states}]"))
 
 
+def _entity_change_allowed(entity_ids: set[str], user: User, event: Event) -> bool:
+    """Return if a state change should be forwarded to the user."""
+    entity_id = event.data["entity_id"]
+    if entity_ids and entity_id not in entity_ids:
+        return False
+    # We have to lookup the permissions again because the user might have
+    # changed since the subscription was created.
+    permissions = user.permissions
+    return permissions.access_all_entities(POLICY_READ) or permissions.check_entity(
+        entity_id, POLICY_READ
+    )
+
+
 def _forward_entity_changes(
     send_message: Callable[[str | dict[str, Any] | Callable[[], str]], None],
     entity_ids: set[str],
@@ -309,17 +325,55 @@ def _forward_entity_changes(
     event: Event,
 ) -> None:
     """Forward entity state changed events to websocket."""
-    entity_id = event.data["entity_id"]
-    if entity_ids and entity_id not in entity_ids:
-        return
-    # We have to lookup the permissions again because the user might have
-    # changed since the subscription was created.
-    permissions = user.permissions
-    if not permissions.access_all_entities(
-        POLICY_READ
-    ) and not permissions.check_entity(event.data["entity_id"], POLICY_READ):
-        return
-    send_message(messages.cached_state_diff_message(msg_id, event))
+    if _entity_change_allowed(entity_ids, user, event):
+        send_message(messages.cached_state_diff_message(msg_id, event))
+
+
+def _forward_sequenced_entity_changes(
+    send_message: Callable[[str | dict[str, Any] | Callable[[], str]], None],
+    entity_ids: set[str],
+    user: User,
+    msg_id: int,
+    seq: int,
+    event: Event,
+) -> None:
+    """Forward entity state changed events with their sequence number."""
+    if _entity_change_allowed(entity_ids, user, event):
+        send_message(messages.cached_sequenced_state_diff_message(msg_id, seq, event))
+
+
+class _EntityChangeCoalescer:
+    """Forward entity changes, merging them while a message is queued."""
+
+    __slots__ = ("connection", "entity_ids", "msg_id", "_message")
+
+    def __init__(
+        self, connection: ActiveConnection, entity_ids: set[str], msg_id: int
+    ) -> None:
+        """Initialize the coalescer."""
+        self.connection = connection
+        self.entity_ids = entity_ids
+        self.msg_id = msg_id
+        self._message: messages.CoalescingStateDiffMessage | None = None
+
+    @callback
+    def async_forward(self, event: Event) -> None:
+        """Forward an entity state changed event."""
+        self.async_forward_sequenced(None, event)
+
+    @callback
+    def async_forward_sequenced(self, seq: int | None, event: Event) -> None:
+        """Forward an entity state changed event with its sequence number."""
+        connection = self.connection
+        if not _entity_change_allowed(self.entity_ids, connection.user, event):
+            return
+        if (message := self._message) is not None and not message.sent:
+            if message.add(event, seq):
+                connection.coalesced_messages += 1
+            return
+        message = self._message = messages.CoalescingStateDiffMessage(self.msg_id)
+        message.add(event, seq)
+        connection.send_message(message)
 
 
 @callback
@@ -327,31 +381,131 @@ def _forward_entity_changes(
     {
         vol.Required("type"): "subscribe_entities",
         vol.Optional("entity_ids"): cv.entity_ids,
+        vol.Optional("resumable", default=False): bool,
+        vol.Optional("coalesce", default=False): bool,
+        vol.Inclusive("log", "resume"): str,
+        vol.Inclusive("seq", "resume"): cv.positive_int,
     }
 )
 def handle_subscribe_entities(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
-    """Handle subscribe entities command."""
+    """Handle subscribe entities command.
+
+    Resumable subscriptions number the state changes they send and include
+    the log id and sequence number in the initial message. A client that
+    resubscribes with the log id and the last sequence number it has seen
+    only receives the entities that changed since, unless the changes are
+    no longer in the log.
+
+    Coalescing subscriptions merge the changes that happen while an update
+    is waiting to be sent, so a client that is slow to read gets the newest
+    state of each entity rather than every change.
+    """
     entity_ids = set(msg.get("entity_ids", []))
-    # We must never await between sending the states and listening for
-    # state changed events or we will introduce a race condition
-    # where some states are missed
-    states = _async_get_allowed_states(hass, connection)
-    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        callback(
+    msg_id = msg["id"]
+    coalescer = (
+        _EntityChangeCoalescer(connection, entity_ids, msg_id)
+        if msg["coalesce"]
+        else None
+    )
+    if not msg["resumable"] and "log" not in msg:
+        # We must never await between sending the states and listening for
+        # state changed events or we will introduce a race condition
+        # where some states are missed
+        connection.subscriptions[msg_id] = hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            coalescer.async_forward
+            if coalescer
+            else callback(
+                partial(
+                    _forward_entity_changes,
+                    connection.send_message,
+                    entity_ids,
+                    connection.user,
+                    msg_id,
+                )
+            ),
+            run_immediately=True,
+        )
+        connection.send_result(msg_id)
+        _send_entities_snapshot(hass, connection, msg_id, entity_ids, "")
+        return
+
+    change_log = async_get_state_change_log(hass)
+    changes = (
+        change_log.async_changes_since(msg["log"], msg["seq"]) if "log" in msg else None
+    )
+    connection.subscriptions[msg_id] = change_log.async_listen(
+        coalescer.async_forward_sequenced
+        if coalescer
+        else callback(
             partial(
-                _forward_entity_changes,
+                _forward_sequenced_entity_changes,
                 connection.send_message,
                 entity_ids,
                 connection.user,
-                msg["id"],
+                msg_id,
             )
-        ),
-        run_immediately=True,
+        )
     )
-    connection.send_result(msg["id"])
+    connection.send_result(msg_id)
+    cursor = (
+        f',"{messages.ENTITY_EVENT_LOG_ID}":"{change_log.log_id}"'
+        f',"{messages.ENTITY_EVENT_SEQUENCE}":{change_log.seq}'
+    )
+    if changes is not None and (
+        payload := _resumed_entities_payload(connection, entity_ids, changes, cursor)
+    ):
+        connection.send_message(construct_event_message(msg_id, payload))
+        return
+    _send_entities_snapshot(hass, connection, msg_id, entity_ids, cursor)
+
+
+def _resumed_entities_payload(
+    connection: ActiveConnection,
+    entity_ids: set[str],
+    changes: list[Event],
+    cursor: str,
+) -> str | None:
+    """Return the payload with the entities that changed since a client left off.
+
+    Entities that changed are sent with their latest state, so the
+    client only has to replace them. Returns None if a state cannot be
+    serialized, the full snapshot will log the bad data.
+    """
+    user = connection.user
+    latest_states: dict[str, State | None] = {}
+    for event in changes:
+        if _entity_change_allowed(entity_ids, user, event):
+            latest_states[event.data["entity_id"]] = event.data["new_state"]
+    serialized_states: list[str] = []
+    removed: list[str] = []
+    for entity_id, state in latest_states.items():
+        if state is None:
+            removed.append(entity_id)
+            continue
+        try:
+            serialized_states.append(state.as_compressed_state_json())
+        except (ValueError, TypeError):
+            return None
+    joined_states = ",".join(serialized_states)
+    return (
+        f'{{"{messages.ENTITY_EVENT_ADD}":{{{joined_states}}}'
+        f',"{messages.ENTITY_EVENT_REMOVE}":{JSON_DUMP(removed)}'
+        f',"{messages.ENTITY_EVENT_RESUMED}":true{cursor}}}'
+    )
+
+
+def _send_entities_snapshot(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg_id: int,
+    entity_ids: set[str],
+    cursor: str,
+) -> None:
+    """Send the compressed states of all entities the user may read."""
+    states = _async_get_allowed_states(hass, connection)
 
     # JSON serialize here so we can recover if it blows up due to the
     # state machine containing unserializable data. This command is required
@@ -365,7 +519,9 @@ def handle_subscribe_entities(
     except (ValueError, TypeError):
         pass
     else:
-        _send_handle_entities_init_response(connection, msg["id"], serialized_states)
+        _send_handle_entities_init_response(
+            connection, msg_id, serialized_states, cursor
+        )
         return
 
     serialized_states = []
@@ -380,16 +536,19 @@ def handle_subscribe_entities(
                 ),
             )
 
-    _send_handle_entities_init_response(connection, msg["id"], serialized_states)
+    _send_handle_entities_init_response(connection, msg_id, serialized_states, cursor)
 
 
 def _send_handle_entities_init_response(
-    connection: ActiveConnection, msg_id: int, serialized_states: list[str]
+    connection: ActiveConnection,
+    msg_id: int,
+    serialized_states: list[str],
+    cursor: str,
 ) -> None:
     """Send handle entities init response."""
     joined_states = ",".join(serialized_states)
     connection.send_message(
-        construct_event_message(msg_id, f'{{"a":{{{joined_states}}}}}')
+        construct_event_message(msg_id, f'{{"a":{{{joined_states}}}{cursor}}}')
     )
 
 
@@ -471,15 +630,16 @@ def handle_integration_setup_info(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle integrations command."""
-    connection.send_result(
-        msg["id"],
-        [
-            {"domain": integration, "seconds": timedelta.total_seconds()}
-            for integration, timedelta in cast(
-                dict[str, dt.timedelta], hass.data[DATA_SETUP_TIME]
-            ).items()
-        ],
-    )
+    import_time: dict[str, dt.timedelta] = hass.data.get(DATA_IMPORT_TIME, {})
+    setup_info: list[dict[str, Any]] = []
+    for integration, timedelta in cast(
+        dict[str, dt.timedelta], hass.data[DATA_SETUP_TIME]
+    ).items():
+        info = {"domain": integration, "seconds": timedelta.total_seconds()}
+        if integration in import_time:
+            info["import_seconds"] = import_time[integration].total_seconds()
+        setup_info.append(info)
+    connection.send_result(msg["id"], setup_info)
 
 
 @callback
@@ -491,6 +651,25 @@ def handle_ping(
     connection.send_message(pong_message(msg["id"]))
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "connection_stats"})
+def handle_connection_stats(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle connection stats command.
+
+    Returns the number of messages merged into a queued message and the
+    number of messages dropped on this connection so far.
+    """
+    connection.send_result(
+        msg["id"],
+        {
+            "coalesced_messages": connection.coalesced_messages,
+            "dropped_messages": connection.dropped_messages,
+        },
+    )
+
+
 @lru_cache
 def _cached_template(template_str: str, hass: HomeAssistant) -> template.Template:
     """Return a cached template."""
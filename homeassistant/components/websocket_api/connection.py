@@ -45,13 +45,15 @@ class ActiveConnection:
         "supported_features",
         "handlers",
         "binary_handlers",
+        "coalesced_messages",
+        "dropped_messages",
     )
 
     def __init__(
         self,
         logger: WebSocketAdapter,
         hass: HomeAssistant,
-        send_message: Callable[[str | dict[str, Any]], None],
+        send_message: Callable[[str | dict[str, Any] | Callable[[], str]], None],
         user: User,
         refresh_token: RefreshToken,
     ) -> None:
@@ -69,6 +71,10 @@ class ActiveConnection:
             const.DOMAIN
         ]
         self.binary_handlers: list[BinaryHandler | None] = []
+        # Messages merged into a queued message and messages discarded
+        # because the client could not keep up or the connection closed
+        self.coalesced_messages = 0
+        self.dropped_messages = 0
         current_connection.set(self)
 
     def __repr__(self) -> str:
@@ -230,6 +236,7 @@ class ActiveConnection:
         self, msg: str | dict[str, Any] | Callable[[], str]
     ) -> None:
         """Send a message when the connection is closed."""
+        self.dropped_messages += 1
         self.logger.debug("Tried to send message %s on closed connection", msg)
 
     @callback
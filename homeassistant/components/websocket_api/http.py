@@ -15,7 +15,7 @@ from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.event import async_call_later
-from homeassistant.util.json import json_loads
+from homeassistant.util.json import SerializationError, json_loads
 
 from .auth import AuthPhase, auth_required_message
 from .const import (
@@ -94,7 +94,7 @@ class WebSocketHandler:
         # to where messages are queued. This allows the implementation
         # to use a deque and an asyncio.Future to avoid the overhead of
         # an asyncio.Queue.
-        self._message_queue: deque[str | None] = deque()
+        self._message_queue: deque[str | Callable[[], str] | None] = deque()
         self._ready_future: asyncio.Future[None] | None = None
 
     def __repr__(self) -> str:
@@ -137,9 +137,13 @@ class WebSocketHandler:
                 # A None message is used to signal the end of the connection
                 if (message := message_queue.popleft()) is None:
                     return
+                messages_remaining -= 1
+                if not isinstance(message, str):
+                    # Deferred messages are serialized when they are sent
+                    if (message := self._serialize_deferred(message)) is None:
+                        continue
 
                 debug_enabled = is_enabled_for(logging_debug)
-                messages_remaining -= 1
 
                 if (
                     not messages_remaining
@@ -156,8 +160,11 @@ class WebSocketHandler:
                     # A None message is used to signal the end of the connection
                     if (message := message_queue.popleft()) is None:
                         return
-                    messages.append(message)
                     messages_remaining -= 1
+                    if isinstance(message, str):
+                        messages.append(message)
+                    elif (message := self._serialize_deferred(message)) is not None:
+                        messages.append(message)
 
                 joined_messages = ",".join(messages)
                 coalesced_messages = f"[{joined_messages}]"
@@ -174,6 +181,16 @@ class WebSocketHandler:
             # Clean up the peak checker when we shut down the writer
             self._cancel_peak_checker()
 
+    def _serialize_deferred(self, message: Callable[[], str]) -> str | None:
+        """Serialize a deferred message, return None if it can not be serialized."""
+        try:
+            return message()
+        except (SerializationError, TypeError, ValueError):
+            self._logger.exception("%s: Unable to serialize message", self.description)
+            if connection := self._connection:
+                connection.dropped_messages += 1
+            return None
+
     @callback
     def _cancel_peak_checker(self) -> None:
         """Cancel the peak checker."""
@@ -182,7 +199,7 @@ class WebSocketHandler:
             self._peak_checker_unsub = None
 
     @callback
-    def _send_message(self, message: str | dict[str, Any]) -> None:
+    def _send_message(self, message: str | dict[str, Any] | Callable[[], str]) -> None:
         """Send a message to the client.
 
         Closes connection if the client is not reading the messages.
@@ -192,6 +209,8 @@ class WebSocketHandler:
         if self._closing:
             # Connection is cancelled, don't flood logs about exceeding
             # max pending messages.
+            if connection := self._connection:
+                connection.dropped_messages += 1
             return
 
         if isinstance(message, dict):
@@ -210,6 +229,8 @@ class WebSocketHandler:
                 MAX_PENDING_MSG,
                 message,
             )
+            if connection := self._connection:
+                connection.dropped_messages += queue_size_before_add + 1
             self._cancel()
             return
 
@@ -249,6 +270,8 @@ class WebSocketHandler:
             PENDING_MSG_PEAK_TIME,
             self._message_queue[-1],
         )
+        if connection := self._connection:
+            connection.dropped_messages += len(self._message_queue)
         self._cancel()
 
     @callback
@@ -439,6 +462,15 @@ class WebSocketHandler:
                     # Make sure all error messages are written before closing
                     await wsock.close()
                 finally:
+                    if connection is not None and (
+                        connection.coalesced_messages or connection.dropped_messages
+                    ):
+                        debug(
+                            "%s: Coalesced %s and dropped %s messages",
+                            self.description,
+                            connection.coalesced_messages,
+                            connection.dropped_messages,
+                        )
                     if disconnect_warn is None:
                         debug("%s: Disconnected", self.description)
                     else:
@@ -41,6 +41,9 @@ STATE_DIFF_REMOVALS = "-"
 ENTITY_EVENT_ADD = "a"
 ENTITY_EVENT_REMOVE = "r"
 ENTITY_EVENT_CHANGE = "c"
+ENTITY_EVENT_LOG_ID = "log"
+ENTITY_EVENT_SEQUENCE = "seq"
+ENTITY_EVENT_RESUMED = "resumed"
 
 
 def result_message(iden: int, result: Any = None) -> dict[str, Any]:
@@ -121,6 +124,96 @@ def _cached_state_diff_message(event: Event) -> str:
     )
 
 
+def cached_sequenced_state_diff_message(iden: int, seq: int, event: Event) -> str:
+    """Return an event message with the sequence number of the state change.
+
+    Serialize to json once per message.
+    """
+    return _cached_sequenced_state_diff_message(seq, event).replace(
+        IDEN_JSON_TEMPLATE, str(iden), 1
+    )
+
+
+@lru_cache(maxsize=128)
+def _cached_sequenced_state_diff_message(seq: int, event: Event) -> str:
+    """Cache and serialize the event with its sequence number to json.
+
+    The IDEN_TEMPLATE is used which will be replaced
+    with the actual iden in cached_sequenced_state_diff_message
+    """
+    diff_event = _state_diff_event(event)
+    diff_event[ENTITY_EVENT_SEQUENCE] = seq
+    return message_to_json({"id": IDEN_TEMPLATE, "type": "event", "event": diff_event})
+
+
+class CoalescingStateDiffMessage:
+    """A state diff message that absorbs later changes until it is sent.
+
+    The message is queued on the connection once and serialized when the
+    writer gets to it. Changes that arrive while it is still queued are
+    merged in, so a client that falls behind receives the newest state of
+    each entity instead of every intermediate diff.
+    """
+
+    __slots__ = ("iden", "sent", "_changes", "_seq")
+
+    def __init__(self, iden: int) -> None:
+        """Initialize the message."""
+        self.iden = iden
+        self.sent = False
+        # entity_id -> (state the client has, newest state, only event)
+        self._changes: dict[str, tuple[State | None, State | None, Event | None]] = {}
+        self._seq: int | None = None
+
+    def add(self, event: Event, seq: int | None = None) -> bool:
+        """Add a state change, return True if it was merged into another one."""
+        entity_id: str = event.data["entity_id"]
+        if seq is not None:
+            self._seq = seq
+        if (change := self._changes.get(entity_id)) is None:
+            self._changes[entity_id] = (
+                event.data["old_state"],
+                event.data["new_state"],
+                event,
+            )
+            return False
+        self._changes[entity_id] = (change[0], event.data["new_state"], None)
+        return True
+
+    def __call__(self) -> str:
+        """Serialize the message, later changes need a new message."""
+        self.sent = True
+        changes = self._changes
+        seq = self._seq
+        if len(changes) == 1:
+            _, _, event = next(iter(changes.values()))
+            if event is not None:
+                # A single change is serialized once for all connections
+                if seq is None:
+                    return cached_state_diff_message(self.iden, event)
+                return cached_sequenced_state_diff_message(self.iden, seq, event)
+        added: dict[str, dict[str, Any]] = {}
+        changed: dict[str, Any] = {}
+        removed: list[str] = []
+        for entity_id, (old_state, new_state, _) in changes.items():
+            if new_state is None:
+                removed.append(entity_id)
+            elif old_state is None:
+                added[entity_id] = new_state.as_compressed_state()
+            else:
+                changed.update(_state_diff(old_state, new_state)[ENTITY_EVENT_CHANGE])
+        diff_event: dict[str, Any] = {}
+        if added:
+            diff_event[ENTITY_EVENT_ADD] = added
+        if changed:
+            diff_event[ENTITY_EVENT_CHANGE] = changed
+        if removed:
+            diff_event[ENTITY_EVENT_REMOVE] = removed
+        if seq is not None:
+            diff_event[ENTITY_EVENT_SEQUENCE] = seq
+        return message_to_json({"id": self.iden, "type": "event", "event": diff_event})
+
+
 def _state_diff_event(event: Event) -> dict:
     """Convert a state_changed event to the minimal version.
 
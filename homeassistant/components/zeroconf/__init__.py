@@ -293,30 +293,53 @@ async def _async_register_hass_zc_service(
     await aio_zc.async_register_service(info, allow_name_change=True)
 
 
-def _match_against_data(
-    matcher: dict[str, str | dict[str, str]], match_data: dict[str, str]
-) -> bool:
-    """Check a matcher to ensure all values in match_data match."""
-    for key in LOWER_MATCH_ATTRS:
-        if key not in matcher:
-            continue
-        if key not in match_data:
-            return False
-        match_val = matcher[key]
-        assert isinstance(match_val, str)
-
-        if not _memorized_fnmatch(match_data[key], match_val):
-            return False
-    return True
-
-
-def _match_against_props(matcher: dict[str, str], props: dict[str, str]) -> bool:
-    """Check a matcher to ensure all values in props."""
-    return not any(
-        key
-        for key in matcher
-        if key not in props or not _memorized_fnmatch(props[key].lower(), matcher[key])
-    )
+@dataclass(slots=True)
+class _CompiledZeroconfMatcher:
+    """A zeroconf matcher with its patterns compiled."""
+
+    domain: str
+    data: list[tuple[str, re.Pattern]]
+    properties: list[tuple[str, re.Pattern]]
+
+    def matches(self, match_data: dict[str, str], props: dict[str, str]) -> bool:
+        """Check all patterns of the matcher match the data and properties."""
+        for key, pattern in self.data:
+            if key not in match_data or not pattern.match(match_data[key]):
+                return False
+        for key, pattern in self.properties:
+            if key not in props or not pattern.match(props[key].lower()):
+                return False
+        return True
+
+
+def _compile_zeroconf_matchers(
+    zeroconf_types: dict[str, list[dict[str, str | dict[str, str]]]]
+) -> dict[str, list[_CompiledZeroconfMatcher]]:
+    """Compile the patterns of the matchers of each service type."""
+    compiled_matchers: dict[str, list[_CompiledZeroconfMatcher]] = {}
+    for service_type, matchers in zeroconf_types.items():
+        compiled = compiled_matchers[service_type] = []
+        for matcher in matchers:
+            domain = matcher["domain"]
+            assert isinstance(domain, str)
+            data: list[tuple[str, re.Pattern]] = []
+            for key in LOWER_MATCH_ATTRS:
+                if (match_val := matcher.get(key)) is not None:
+                    assert isinstance(match_val, str)
+                    data.append((key, _compile_fnmatch(match_val)))
+            matcher_props = matcher.get(ATTR_PROPERTIES, {})
+            assert isinstance(matcher_props, dict)
+            compiled.append(
+                _CompiledZeroconfMatcher(
+                    domain,
+                    data,
+                    [
+                        (key, _compile_fnmatch(match_val))
+                        for key, match_val in matcher_props.items()
+                    ],
+                )
+            )
+    return compiled_matchers
 
 
 def is_homekit_paired(props: dict[str, Any]) -> bool:
@@ -346,6 +369,7 @@ class ZeroconfDiscovery:
         self.hass = hass
         self.zeroconf = zeroconf
         self.zeroconf_types = zeroconf_types
+        self._zeroconf_matchers = _compile_zeroconf_matchers(zeroconf_types)
         self.homekit_model_lookups = homekit_model_lookups
         self.homekit_model_matchers = homekit_model_matchers
 
@@ -479,18 +503,11 @@ class ZeroconfDiscovery:
 
         # Not all homekit types are currently used for discovery
         # so not all service type exist in zeroconf_types
-        for matcher in self.zeroconf_types.get(service_type, []):
-            if len(matcher) > 1:
-                if not _match_against_data(matcher, match_data):
-                    continue
-                if ATTR_PROPERTIES in matcher:
-                    matcher_props = matcher[ATTR_PROPERTIES]
-                    assert isinstance(matcher_props, dict)
-                    if not _match_against_props(matcher_props, props):
-                        continue
-
-            matcher_domain = matcher["domain"]
-            assert isinstance(matcher_domain, str)
+        for matcher in self._zeroconf_matchers.get(service_type, []):
+            if not matcher.matches(match_data, props):
+                continue
+
+            matcher_domain = matcher.domain
             context = {
                 "source": config_entries.SOURCE_ZEROCONF,
             }
@@ -618,18 +635,3 @@ def _truncate_location_name_to_valid(location_name: str) -> str:
 def _compile_fnmatch(pattern: str) -> re.Pattern:
     """Compile a fnmatch pattern."""
     return re.compile(translate(pattern))
-
-
-@lru_cache(maxsize=1024, typed=True)
-def _memorized_fnmatch(name: str, pattern: str) -> bool:
-    """Memorized version of fnmatch that has a larger lru_cache.
-
-    The default version of fnmatch only has a lru_cache of 256 entries.
-    With many devices we quickly reach that limit and end up compiling
-    the same pattern over and over again.
-
-    Zeroconf has its own memorized fnmatch with its own lru_cache
-    since the data is going to be relatively the same
-    since the devices will not change frequently
-    """
-    return bool(_compile_fnmatch(pattern).match(name))
@@ -314,6 +314,11 @@ class HomeAssistant:
         # Timeout handler for Core/Helper namespace
         self.timeout: TimeoutManager = TimeoutManager()
         self._stop_future: concurrent.futures.Future[None] | None = None
+        # Runs the callback jobs in place of calling them directly when set,
+        # which allows the profiler to time them
+        self.job_runner: Callable[
+            [HassJob[..., Any], tuple[Any, ...]], None
+        ] | None = None
 
     @property
     def is_running(self) -> bool:
@@ -513,6 +518,9 @@ class HomeAssistant:
         elif hassjob.job_type == HassJobType.Callback:
             if TYPE_CHECKING:
                 hassjob.target = cast(Callable[..., _R], hassjob.target)
+            if (job_runner := self.job_runner) is not None:
+                self.loop.call_soon(job_runner, hassjob, args)
+                return None
             self.loop.call_soon(hassjob.target, *args)
             return None
         else:
@@ -612,6 +620,9 @@ class HomeAssistant:
         if hassjob.job_type == HassJobType.Callback:
             if TYPE_CHECKING:
                 hassjob.target = cast(Callable[..., _R], hassjob.target)
+            if (job_runner := self.job_runner) is not None:
+                job_runner(hassjob, args)
+                return None
             hassjob.target(*args)
             return None
 
@@ -966,16 +977,44 @@ _FilterableJobType = tuple[
 ]
 
 
+@callback
+def _async_match_keyed_listeners(
+    keyed: dict[Any, list[_FilterableJobType]], keys: list[Any]
+) -> tuple[_FilterableJobType, ...]:
+    """Return the keyed listeners matching any of a list of values."""
+    matched: dict[_FilterableJobType, None] = {}
+    for key in keys:
+        try:
+            if listeners := keyed.get(key):
+                matched.update(dict.fromkeys(listeners))
+        except TypeError:
+            # Unhashable values can not match any key
+            continue
+    return tuple(matched)
+
+
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_listeners", "_match_all_listeners", "_hass")
+    __slots__ = (
+        "_listeners",
+        "_match_all_listeners",
+        "_keyed_listeners",
+        "_dispatch_cache",
+        "_hass",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: dict[str, list[_FilterableJobType]] = {}
         self._match_all_listeners: list[_FilterableJobType] = []
         self._listeners[MATCH_ALL] = self._match_all_listeners
+        # event_type -> event data key -> data value -> listeners
+        self._keyed_listeners: dict[
+            str, dict[str, dict[Any, list[_FilterableJobType]]]
+        ] = {}
+        # event_type -> listeners to call, rebuilt on subscribe/unsubscribe
+        self._dispatch_cache: dict[str, tuple[_FilterableJobType, ...]] = {}
         self._hass = hass
 
     @callback
@@ -984,7 +1023,14 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        counts = {key: len(listeners) for key, listeners in self._listeners.items()}
+        for event_type, data_keys in self._keyed_listeners.items():
+            counts[event_type] = counts.get(event_type, 0) + sum(
+                len(listeners)
+                for keyed in data_keys.values()
+                for listeners in keyed.values()
+            )
+        return counts
 
     @property
     def listeners(self) -> dict[str, int]:
@@ -1021,21 +1067,34 @@ class EventBus:
                 event_type, "event_type", MAX_LENGTH_EVENT_EVENT_TYPE
             )
 
-        listeners = self._listeners.get(event_type, [])
-        match_all_listeners = self._match_all_listeners
+        if (listeners := self._dispatch_cache.get(event_type)) is None:
+            listeners = self._async_build_dispatch_cache(event_type)
+        keyed_listeners = self._keyed_listeners.get(event_type)
 
         event = Event(event_type, event_data, origin, time_fired, context)
 
         if _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug("Bus:Handling %s", event)
 
-        if not listeners and not match_all_listeners:
-            return
+        if keyed_listeners is not None and event_data is not None:
+            for data_key, keyed in keyed_listeners.items():
+                if (key := event_data.get(data_key)) is None:
+                    continue
+                if isinstance(key, list):
+                    matched = _async_match_keyed_listeners(keyed, key)
+                else:
+                    try:
+                        matched = keyed.get(key)
+                    except TypeError:
+                        # Unhashable values can not match any key
+                        continue
+                if matched:
+                    listeners = (*listeners, *matched)
 
-        # EVENT_HOMEASSISTANT_CLOSE should not be sent to MATCH_ALL listeners
-        if event_type != EVENT_HOMEASSISTANT_CLOSE:
-            listeners = match_all_listeners + listeners
+        if not listeners:
+            return
 
+        job_runner = self._hass.job_runner
         for job, event_filter, run_immediately in listeners:
             if event_filter is not None:
                 try:
@@ -1046,7 +1105,10 @@ class EventBus:
                     continue
             if run_immediately:
                 try:
-                    job.target(event)
+                    if job_runner is not None:
+                        job_runner(job, (event,))
+                    else:
+                        job.target(event)
                 except Exception:  # pylint: disable=broad-except
                     _LOGGER.exception("Error running job: %s", job)
             else:
@@ -1104,11 +1166,41 @@ class EventBus:
             (HassJob(listener, f"listen {event_type}"), event_filter, run_immediately),
         )
 
+    @callback
+    def _async_build_dispatch_cache(
+        self, event_type: str
+    ) -> tuple[_FilterableJobType, ...]:
+        """Build and cache the listeners to call for an event type."""
+        if (listeners := self._listeners.get(event_type)) is None:
+            # Event types without listeners of their own are not cached
+            # so firing many different event types does not grow the cache
+            if event_type == EVENT_HOMEASSISTANT_CLOSE:
+                return ()
+            if (match_all := self._dispatch_cache.get(MATCH_ALL)) is None:
+                match_all = self._async_build_dispatch_cache(MATCH_ALL)
+            return match_all
+        # EVENT_HOMEASSISTANT_CLOSE should not be sent to MATCH_ALL listeners
+        if event_type in (EVENT_HOMEASSISTANT_CLOSE, MATCH_ALL):
+            combined = tuple(listeners)
+        else:
+            combined = (*self._match_all_listeners, *listeners)
+        self._dispatch_cache[event_type] = combined
+        return combined
+
+    @callback
+    def _async_invalidate_dispatch_cache(self, event_type: str) -> None:
+        """Invalidate the cached listeners after a subscription change."""
+        if event_type == MATCH_ALL:
+            self._dispatch_cache.clear()
+        else:
+            self._dispatch_cache.pop(event_type, None)
+
     @callback
     def _async_listen_filterable_job(
         self, event_type: str, filterable_job: _FilterableJobType
     ) -> CALLBACK_TYPE:
         self._listeners.setdefault(event_type, []).append(filterable_job)
+        self._async_invalidate_dispatch_cache(event_type)
 
         def remove_listener() -> None:
             """Remove the listener."""
@@ -1116,6 +1208,89 @@ class EventBus:
 
         return remove_listener
 
+    @callback
+    def async_listen_keyed(
+        self,
+        event_type: str,
+        data_key: str,
+        keys: Iterable[Any],
+        listener: Callable[[Event], Coroutine[Any, Any, None] | None],
+        run_immediately: bool = False,
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type where a data value matches.
+
+        The listener is only called for events whose ``event.data[data_key]``
+        is one of ``keys``. Listeners sharing an event type and data key are
+        indexed together, so the bus routes an event to the interested
+        listeners with a single lookup instead of calling an event filter
+        for every listener.
+
+        MATCH_ALL is not supported as event_type.
+
+        If run_immediately is passed, the callback will be run
+        right away instead of using call_soon. Only use this if
+        the callback results in scheduling another task.
+
+        This method must be run in the event loop.
+        """
+        if event_type == MATCH_ALL:
+            raise HomeAssistantError("Keyed listeners do not support MATCH_ALL")
+        if run_immediately and not is_callback(listener):
+            raise HomeAssistantError(f"Event listener {listener} is not a callback")
+        filterable_job: _FilterableJobType = (
+            HassJob(listener, f"listen {event_type} by {data_key}"),
+            None,
+            run_immediately,
+        )
+        keyed = self._keyed_listeners.setdefault(event_type, {}).setdefault(
+            data_key, {}
+        )
+        subscribed_keys = set(keys)
+        for key in subscribed_keys:
+            keyed.setdefault(key, []).append(filterable_job)
+
+        @callback
+        def remove_listener() -> None:
+            """Remove the listener."""
+            self._async_remove_keyed_listener(
+                event_type, data_key, subscribed_keys, filterable_job
+            )
+
+        return remove_listener
+
+    @callback
+    def _async_remove_keyed_listener(
+        self,
+        event_type: str,
+        data_key: str,
+        keys: set[Any],
+        filterable_job: _FilterableJobType,
+    ) -> None:
+        """Remove a keyed listener of a specific event_type.
+
+        This method must be run in the event loop.
+        """
+        try:
+            data_keys = self._keyed_listeners[event_type]
+            keyed = data_keys[data_key]
+            for key in keys:
+                listeners = keyed[key]
+                listeners.remove(filterable_job)
+                if not listeners:
+                    del keyed[key]
+        except (KeyError, ValueError):
+            # KeyError if the event_type, data_key or key did not exist
+            # ValueError if listener did not exist for a key
+            _LOGGER.exception(
+                "Unable to remove unknown keyed job listener %s", filterable_job
+            )
+            return
+
+        if not keyed:
+            del data_keys[data_key]
+            if not data_keys:
+                del self._keyed_listeners[event_type]
+
     def listen_once(
         self,
         event_type: str,
@@ -1197,6 +1372,7 @@ class EventBus:
             # delete event_type list if empty
             if not self._listeners[event_type] and event_type != MATCH_ALL:
                 self._listeners.pop(event_type)
+            self._async_invalidate_dispatch_cache(event_type)
         except (KeyError, ValueError):
             # KeyError is key event_type listener did not exist
             # ValueError if listener did not exist within event_type
@@ -84,6 +84,7 @@ class AreaRegistry:
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            record_keys={"areas": "id"},
         )
         self._normalized_name_area_idx: dict[str, str] = {}
 
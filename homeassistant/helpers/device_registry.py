@@ -1,7 +1,7 @@
 """Provide a way to connect entities belonging to one device."""
 from __future__ import annotations
 
-from collections import UserDict
+from collections import UserDict, defaultdict
 from collections.abc import Coroutine, ValuesView
 from enum import StrEnum
 import logging
@@ -22,6 +22,7 @@ from . import storage
 from .debounce import Debouncer
 from .frame import report
 from .json import JSON_DUMP, find_paths_unserializable_data
+from .registry import RegistryIndexType, unindex_value
 from .typing import UNDEFINED, UndefinedType
 
 if TYPE_CHECKING:
@@ -432,10 +433,60 @@ class DeviceRegistryItems(UserDict[str, _EntryTypeT]):
         return None
 
 
+class ActiveDeviceRegistryItems(DeviceRegistryItems[DeviceEntry]):
+    """Container for active (non-deleted) device registry entries.
+
+    Adds multi-value indexes from area_id and config_entry_id to the
+    ids of the devices that have them.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the container."""
+        super().__init__()
+        self._area_id_index: RegistryIndexType = defaultdict(dict)
+        self._config_entry_id_index: RegistryIndexType = defaultdict(dict)
+
+    def __setitem__(self, key: str, entry: DeviceEntry) -> None:
+        """Add an item."""
+        if key in self:
+            self._unindex_entry(key, self[key])
+        super().__setitem__(key, entry)
+        if (area_id := entry.area_id) is not None:
+            self._area_id_index[area_id][key] = True
+        for config_entry_id in entry.config_entries:
+            self._config_entry_id_index[config_entry_id][key] = True
+
+    def __delitem__(self, key: str) -> None:
+        """Remove an item."""
+        self._unindex_entry(key, self[key])
+        super().__delitem__(key)
+
+    def _unindex_entry(self, key: str, entry: DeviceEntry) -> None:
+        """Remove an entry from the multi-value indexes."""
+        if (area_id := entry.area_id) is not None:
+            unindex_value(self._area_id_index, area_id, key)
+        for config_entry_id in entry.config_entries:
+            unindex_value(self._config_entry_id_index, config_entry_id, key)
+
+    def get_devices_for_area_id(self, area_id: str) -> list[DeviceEntry]:
+        """Get devices for area."""
+        data = self.data
+        return [data[key] for key in self._area_id_index.get(area_id, ())]
+
+    def get_devices_for_config_entry_id(
+        self, config_entry_id: str
+    ) -> list[DeviceEntry]:
+        """Get devices for config entry."""
+        data = self.data
+        return [
+            data[key] for key in self._config_entry_id_index.get(config_entry_id, ())
+        ]
+
+
 class DeviceRegistry:
     """Class to hold a registry of devices."""
 
-    devices: DeviceRegistryItems[DeviceEntry]
+    devices: ActiveDeviceRegistryItems
     deleted_devices: DeviceRegistryItems[DeletedDeviceEntry]
     _device_data: dict[str, DeviceEntry]
 
@@ -448,6 +499,7 @@ class DeviceRegistry:
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            record_keys={"devices": "id", "deleted_devices": "id"},
         )
 
     @callback
@@ -776,7 +828,7 @@ class DeviceRegistry:
 
         data = await self._store.async_load()
 
-        devices: DeviceRegistryItems[DeviceEntry] = DeviceRegistryItems()
+        devices = ActiveDeviceRegistryItems()
         deleted_devices: DeviceRegistryItems[DeletedDeviceEntry] = DeviceRegistryItems()
 
         if data is not None:
@@ -877,7 +929,7 @@ class DeviceRegistry:
     def async_clear_config_entry(self, config_entry_id: str) -> None:
         """Clear config entry from registry entries."""
         now_time = time.time()
-        for device in list(self.devices.values()):
+        for device in self.devices.get_devices_for_config_entry_id(config_entry_id):
             self.async_update_device(device.id, remove_config_entry_id=config_entry_id)
         for deleted_device in list(self.deleted_devices.values()):
             config_entries = deleted_device.config_entries
@@ -918,9 +970,8 @@ class DeviceRegistry:
     @callback
     def async_clear_area_id(self, area_id: str) -> None:
         """Clear area id from registry entries."""
-        for dev_id, device in self.devices.items():
-            if area_id == device.area_id:
-                self.async_update_device(dev_id, area_id=None)
+        for device in self.devices.get_devices_for_area_id(area_id):
+            self.async_update_device(device.id, area_id=None)
 
 
 @callback
@@ -939,7 +990,7 @@ async def async_load(hass: HomeAssistant) -> None:
 @callback
 def async_entries_for_area(registry: DeviceRegistry, area_id: str) -> list[DeviceEntry]:
     """Return entries that match an area."""
-    return [device for device in registry.devices.values() if device.area_id == area_id]
+    return registry.devices.get_devices_for_area_id(area_id)
 
 
 @callback
@@ -947,11 +998,7 @@ def async_entries_for_config_entry(
     registry: DeviceRegistry, config_entry_id: str
 ) -> list[DeviceEntry]:
     """Return entries that match a config entry."""
-    return [
-        device
-        for device in registry.devices.values()
-        if config_entry_id in device.config_entries
-    ]
+    return registry.devices.get_devices_for_config_entry_id(config_entry_id)
 
 
 @callback
@@ -97,6 +97,18 @@ class EntityPlatformModule(Protocol):
     ) -> None:
         """Set up an integration platform from a config entry."""
 
+    async def async_bulk_entity_service_call(
+        self,
+        hass: HomeAssistant,
+        entities: list[Entity],
+        func: str,
+        data: dict | ServiceCall,
+    ) -> bool:
+        """Call an entity service method on entities of the platform at once.
+
+        Return False to call the method on each entity instead.
+        """
+
 
 class EntityPlatform:
     """Manage the entities for a single platform."""
@@ -142,6 +154,20 @@ class EntityPlatform:
         # which powers entity_component.add_entities
         self.parallel_updates_created = platform is None
 
+        self.parallel_service_calls: asyncio.Semaphore | None = None
+        parallel_service_calls = getattr(platform, "PARALLEL_SERVICE_CALLS", None)
+        if isinstance(parallel_service_calls, int) and parallel_service_calls > 0:
+            self.parallel_service_calls = asyncio.Semaphore(parallel_service_calls)
+        self.async_bulk_entity_service_call: Callable[
+            [HomeAssistant, list[Entity], str, dict | ServiceCall],
+            Coroutine[Any, Any, bool],
+        ] | None = None
+        bulk_call = getattr(platform, "async_bulk_entity_service_call", None)
+        if asyncio.iscoroutinefunction(bulk_call):
+            self.async_bulk_entity_service_call = bulk_call
+        # The number of calls, entities and seconds spent per service
+        self.service_call_stats: dict[str, dict[str, float]] = {}
+
         hass.data.setdefault(DATA_ENTITY_PLATFORM, {}).setdefault(
             self.platform_name, []
         ).append(self)
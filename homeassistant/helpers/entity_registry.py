@@ -9,7 +9,7 @@ timer.
 """
 from __future__ import annotations
 
-from collections import UserDict
+from collections import UserDict, defaultdict
 from collections.abc import Callable, Iterable, Mapping, ValuesView
 from datetime import datetime, timedelta
 from enum import StrEnum
@@ -51,6 +51,7 @@ from homeassistant.util.read_only_dict import ReadOnlyDict
 from . import device_registry as dr, storage
 from .device_registry import EVENT_DEVICE_REGISTRY_UPDATED
 from .json import JSON_DUMP, find_paths_unserializable_data
+from .registry import RegistryIndexType, unindex_value
 from .typing import UNDEFINED, UndefinedType
 
 if TYPE_CHECKING:
@@ -436,6 +437,9 @@ class EntityRegistryItems(UserDict[str, "RegistryEntry"]):
     Maintains two additional indexes:
     - id -> entry
     - (domain, platform, unique_id) -> entity_id
+
+    And multi-value indexes from device_id, area_id and config_entry_id
+    to the entity_ids that have them.
     """
 
     def __init__(self) -> None:
@@ -443,6 +447,9 @@ class EntityRegistryItems(UserDict[str, "RegistryEntry"]):
         super().__init__()
         self._entry_ids: dict[str, RegistryEntry] = {}
         self._index: dict[tuple[str, str, str], str] = {}
+        self._device_id_index: RegistryIndexType = defaultdict(dict)
+        self._area_id_index: RegistryIndexType = defaultdict(dict)
+        self._config_entry_id_index: RegistryIndexType = defaultdict(dict)
 
     def values(self) -> ValuesView[RegistryEntry]:
         """Return the underlying values to avoid __iter__ overhead."""
@@ -454,17 +461,38 @@ class EntityRegistryItems(UserDict[str, "RegistryEntry"]):
             old_entry = self[key]
             del self._entry_ids[old_entry.id]
             del self._index[(old_entry.domain, old_entry.platform, old_entry.unique_id)]
+            self._unindex_entry(key, old_entry)
         super().__setitem__(key, entry)
         self._entry_ids[entry.id] = entry
         self._index[(entry.domain, entry.platform, entry.unique_id)] = entry.entity_id
+        self._index_entry(key, entry)
 
     def __delitem__(self, key: str) -> None:
         """Remove an item."""
         entry = self[key]
         del self._entry_ids[entry.id]
         del self._index[(entry.domain, entry.platform, entry.unique_id)]
+        self._unindex_entry(key, entry)
         super().__delitem__(key)
 
+    def _index_entry(self, key: str, entry: RegistryEntry) -> None:
+        """Add an entry to the multi-value indexes."""
+        if (device_id := entry.device_id) is not None:
+            self._device_id_index[device_id][key] = True
+        if (area_id := entry.area_id) is not None:
+            self._area_id_index[area_id][key] = True
+        if (config_entry_id := entry.config_entry_id) is not None:
+            self._config_entry_id_index[config_entry_id][key] = True
+
+    def _unindex_entry(self, key: str, entry: RegistryEntry) -> None:
+        """Remove an entry from the multi-value indexes."""
+        if (device_id := entry.device_id) is not None:
+            unindex_value(self._device_id_index, device_id, key)
+        if (area_id := entry.area_id) is not None:
+            unindex_value(self._area_id_index, area_id, key)
+        if (config_entry_id := entry.config_entry_id) is not None:
+            unindex_value(self._config_entry_id_index, config_entry_id, key)
+
     def get_entity_id(self, key: tuple[str, str, str]) -> str | None:
         """Get entity_id from (domain, platform, unique_id)."""
         return self._index.get(key)
@@ -473,6 +501,31 @@ class EntityRegistryItems(UserDict[str, "RegistryEntry"]):
         """Get entry from id."""
         return self._entry_ids.get(key)
 
+    def get_entries_for_device_id(
+        self, device_id: str, include_disabled_entities: bool = False
+    ) -> list[RegistryEntry]:
+        """Get entries for device."""
+        data = self.data
+        return [
+            entry
+            for key in self._device_id_index.get(device_id, ())
+            if not (entry := data[key]).disabled_by or include_disabled_entities
+        ]
+
+    def get_entries_for_area_id(self, area_id: str) -> list[RegistryEntry]:
+        """Get entries for area."""
+        data = self.data
+        return [data[key] for key in self._area_id_index.get(area_id, ())]
+
+    def get_entries_for_config_entry_id(
+        self, config_entry_id: str
+    ) -> list[RegistryEntry]:
+        """Get entries for config entry."""
+        data = self.data
+        return [
+            data[key] for key in self._config_entry_id_index.get(config_entry_id, ())
+        ]
+
 
 class EntityRegistry:
     """Class to hold a registry of entities."""
@@ -490,6 +543,7 @@ class EntityRegistry:
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            record_keys={"entities": "id", "deleted_entities": "id"},
         )
         self.hass.bus.async_listen(
             EVENT_DEVICE_REGISTRY_UPDATED, self.async_device_modified
@@ -1151,12 +1205,8 @@ class EntityRegistry:
     def async_clear_config_entry(self, config_entry_id: str) -> None:
         """Clear config entry from registry entries."""
         now_time = time.time()
-        for entity_id in [
-            entity_id
-            for entity_id, entry in self.entities.items()
-            if config_entry_id == entry.config_entry_id
-        ]:
-            self.async_remove(entity_id)
+        for entry in self.entities.get_entries_for_config_entry_id(config_entry_id):
+            self.async_remove(entry.entity_id)
         for key, deleted_entity in list(self.deleted_entities.items()):
             if config_entry_id != deleted_entity.config_entry_id:
                 continue
@@ -1185,9 +1235,8 @@ class EntityRegistry:
     @callback
     def async_clear_area_id(self, area_id: str) -> None:
         """Clear area id from registry entries."""
-        for entity_id, entry in self.entities.items():
-            if area_id == entry.area_id:
-                self.async_update_entity(entity_id, area_id=None)
+        for entry in self.entities.get_entries_for_area_id(area_id):
+            self.async_update_entity(entry.entity_id, area_id=None)
 
 
 @callback
@@ -1208,12 +1257,9 @@ def async_entries_for_device(
     registry: EntityRegistry, device_id: str, include_disabled_entities: bool = False
 ) -> list[RegistryEntry]:
     """Return entries that match a device."""
-    return [
-        entry
-        for entry in registry.entities.values()
-        if entry.device_id == device_id
-        and (not entry.disabled_by or include_disabled_entities)
-    ]
+    return registry.entities.get_entries_for_device_id(
+        device_id, include_disabled_entities
+    )
 
 
 @callback
@@ -1221,7 +1267,7 @@ def async_entries_for_area(
     registry: EntityRegistry, area_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match an area."""
-    return [entry for entry in registry.entities.values() if entry.area_id == area_id]
+    return registry.entities.get_entries_for_area_id(area_id)
 
 
 @callback
@@ -1229,11 +1275,7 @@ def async_entries_for_config_entry(
     registry: EntityRegistry, config_entry_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match a config entry."""
-    return [
-        entry
-        for entry in registry.entities.values()
-        if entry.config_entry_id == config_entry_id
-    ]
+    return registry.entities.get_entries_for_config_entry_id(config_entry_id)
 
 
 @callback
@@ -2,7 +2,14 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Coroutine, Iterable, Mapping, Sequence
+from collections.abc import (
+    Callable,
+    Coroutine,
+    Iterable,
+    Mapping,
+    MutableMapping,
+    Sequence,
+)
 import copy
 from dataclasses import dataclass
 from datetime import datetime, timedelta
@@ -13,6 +20,7 @@ import time
 from typing import Any, Concatenate, ParamSpec, TypedDict, TypeVar
 
 import attr
+from lru import LRU  # pylint: disable=no-name-in-module
 
 from homeassistant.const import (
     EVENT_CORE_CONFIG_UPDATE,
@@ -43,6 +51,7 @@ from .entity_registry import (
     EventEntityRegistryUpdatedData,
 )
 from .ratelimit import KeyedRateLimit
+from .singleton import singleton
 from .sun import get_astral_event_next
 from .template import RenderInfo, Template, result_as_boolean
 from .typing import EventType, TemplateVarsType
@@ -62,6 +71,11 @@ TRACK_ENTITY_REGISTRY_UPDATED_LISTENER = "track_entity_registry_updated_listener
 TRACK_DEVICE_REGISTRY_UPDATED_CALLBACKS = "track_device_registry_updated_callbacks"
 TRACK_DEVICE_REGISTRY_UPDATED_LISTENER = "track_device_registry_updated_listener"
 
+TEMPLATE_RENDER_SCHEDULER = "template_render_scheduler"
+
+# Number of template sources the render statistics are kept for
+TEMPLATE_RENDER_STATS_SIZE = 1024
+
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
 _ENTITIES_LISTENER = "entities"
@@ -885,6 +899,116 @@ def async_track_template(
 track_template = threaded_listener_factory(async_track_template)
 
 
+@callback
+@singleton(TEMPLATE_RENDER_SCHEDULER)
+def _async_get_template_render_scheduler(
+    hass: HomeAssistant,
+) -> TemplateRenderScheduler:
+    """Return the template render scheduler."""
+    return TemplateRenderScheduler(hass)
+
+
+@callback
+def async_get_template_render_stats(hass: HomeAssistant) -> dict[str, Any]:
+    """Return the render counts and time spent per tracked template."""
+    scheduler: TemplateRenderScheduler | None = hass.data.get(TEMPLATE_RENDER_SCHEDULER)
+    if scheduler is None:
+        return {}
+    return {
+        "tick": scheduler.tick,
+        "passes": scheduler.passes,
+        "templates": {source: dict(stats) for source, stats in scheduler.stats.items()},
+    }
+
+
+def _renders_without(template: Template, variables: TemplateVarsType) -> bool:
+    """Return if a template renders the same without its variables.
+
+    Template entities pass themselves as `this`, which only matters
+    if the template refers to it.
+    """
+    if not variables:
+        return True
+    return variables.keys() == {"this"} and "this" not in template.template
+
+
+class TemplateRenderScheduler:
+    """Coalesce the re-renders of tracked templates triggered by state changes.
+
+    A state change only marks the templates it affects. The marked templates
+    of all trackers are rendered together once per event loop iteration, or
+    once per tick if one is set, so a template that references many entities
+    that change at the same time is rendered once instead of once per change.
+    Equal templates that are tracked more than once are only rendered once
+    per pass if they do not depend on their variables.
+    """
+
+    def __init__(self, hass: HomeAssistant, tick: float = 0) -> None:
+        """Initialize the template render scheduler."""
+        self.hass = hass
+        self.tick = tick
+        self.passes = 0
+        self.stats: MutableMapping[str, dict[str, float]] = LRU(
+            TEMPLATE_RENDER_STATS_SIZE
+        )
+        self._dirty: dict[TrackTemplateResultInfo, None] = {}
+        self._rendered: dict[Template, RenderInfo] | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    @callback
+    def async_schedule(self, tracker: TrackTemplateResultInfo) -> None:
+        """Schedule the marked templates of a tracker to be rendered."""
+        self._dirty[tracker] = None
+        if self._task is None:
+            self._task = self.hass.async_create_task(
+                self._async_render(), "template render scheduler"
+            )
+
+    async def _async_render(self) -> None:
+        """Render the marked templates of all trackers."""
+        if self.tick:
+            await asyncio.sleep(self.tick)
+        self._task = None
+        dirty, self._dirty = self._dirty, {}
+        self.passes += 1
+        self._rendered = {}
+        try:
+            for tracker in dirty:
+                try:
+                    # pylint: disable-next=protected-access
+                    tracker._async_render_pending()
+                except Exception:  # pylint: disable=broad-except
+                    _LOGGER.exception("Error while rendering templates of %s", tracker)
+        finally:
+            self._rendered = None
+
+    @callback
+    def async_render_to_info(
+        self, template: Template, variables: TemplateVarsType
+    ) -> RenderInfo:
+        """Render a tracked template and collect its render statistics."""
+        if (stats := self.stats.get(template.template)) is None:
+            stats = self.stats[template.template] = {
+                "renders": 0,
+                "deduplicated": 0,
+                "time": 0.0,
+            }
+        # A template which does not depend on its variables renders the same
+        # for every tracker during a pass, state changes made by the listeners
+        # are picked up by the next pass
+        rendered = self._rendered if _renders_without(template, variables) else None
+        if rendered is not None and (info := rendered.get(template)) is not None:
+            stats["deduplicated"] += 1
+            return info
+        start = time.perf_counter()
+        info = template.async_render_to_info(variables)
+        stats["renders"] += 1
+        stats["time"] += time.perf_counter() - start
+        if rendered is not None:
+            rendered[template] = info
+        return info
+
+
 class TrackTemplateResultInfo:
     """Handle removal / refresh of tracker."""
 
@@ -894,10 +1018,12 @@ class TrackTemplateResultInfo:
         track_templates: Sequence[TrackTemplate],
         action: TrackTemplateResultListener,
         has_super_template: bool = False,
+        coalesce_renders: bool = False,
     ) -> None:
         """Handle removal / refresh of tracker init."""
         self.hass = hass
         self._job = HassJob(action, f"track template result {track_templates}")
+        self._coalesce_renders = coalesce_renders
 
         for track_template_ in track_templates:
             track_template_.template.hass = hass
@@ -907,6 +1033,11 @@ class TrackTemplateResultInfo:
         self._last_result: dict[Template, bool | str | TemplateError] = {}
 
         self._rate_limit = KeyedRateLimit(hass)
+        self._scheduler = _async_get_template_render_scheduler(hass)
+        # The templates waiting to be rendered by the scheduler with
+        # the state change they are rendered for
+        self._pending: dict[Template, EventType[EventStateChangedData]] = {}
+        self._pending_event: EventType[EventStateChangedData] | None = None
         self._info: dict[Template, RenderInfo] = {}
         self._track_state_changes: _TrackStateChangeFiltered | None = None
         self._time_listeners: dict[Template, Callable[[], None]] = {}
@@ -959,7 +1090,9 @@ class TrackTemplateResultInfo:
                 )
 
         self._track_state_changes = async_track_state_change_filtered(
-            self.hass, _render_infos_to_track_states(self._info.values()), self._refresh
+            self.hass,
+            _render_infos_to_track_states(self._info.values()),
+            self._async_state_changed if self._coalesce_renders else self._refresh,
         )
         self._update_time_listeners()
         _LOGGER.debug(
@@ -1017,6 +1150,8 @@ class TrackTemplateResultInfo:
         assert self._track_state_changes
         self._track_state_changes.async_remove()
         self._rate_limit.async_remove()
+        self._pending.clear()
+        self._pending_event = None
         for template in list(self._time_listeners):
             self._time_listeners.pop(template)()
 
@@ -1025,6 +1160,46 @@ class TrackTemplateResultInfo:
         """Force recalculate the template."""
         self._refresh(None)
 
+    @callback
+    def _async_state_changed(self, event: EventType[EventStateChangedData]) -> None:
+        """Mark the templates affected by a state change to be rendered."""
+        pending = self._pending
+        for template, info in self._info.items():
+            if _event_triggers_rerender(event, info) and (
+                template not in pending
+                # A change of a referenced entity is not rate limited
+                or event.data["entity_id"] in info.entities
+            ):
+                pending[template] = event
+        if not pending:
+            return
+        self._pending_event = event
+        self._scheduler.async_schedule(self)
+
+    @callback
+    def _async_render_pending(self) -> None:
+        """Render the templates marked since the last render."""
+        if not (pending := self._pending):
+            return
+        event = self._pending_event
+        self._pending = {}
+        self._pending_event = None
+        # The results are handled in the order the templates were first
+        # affected, which is the order they would have been rendered in
+        order = {template: idx for idx, template in enumerate(pending)}
+        self._refresh(
+            event,
+            sorted(
+                (
+                    track_template_
+                    for track_template_ in self._track_templates
+                    if track_template_.template in order
+                ),
+                key=lambda track_template_: order[track_template_.template],
+            ),
+            events=pending,
+        )
+
     def _render_template_if_ready(
         self,
         track_template_: TrackTemplate,
@@ -1069,8 +1244,8 @@ class TrackTemplateResultInfo:
             )
 
         self._rate_limit.async_triggered(template, now)
-        self._info[template] = info = template.async_render_to_info(
-            track_template_.variables
+        self._info[template] = info = self._scheduler.async_render_to_info(
+            template, track_template_.variables
         )
 
         try:
@@ -1103,6 +1278,7 @@ class TrackTemplateResultInfo:
         event: EventType[EventStateChangedData] | None,
         track_templates: Iterable[TrackTemplate] | None = None,
         replayed: bool | None = False,
+        events: Mapping[Template, EventType[EventStateChangedData]] | None = None,
     ) -> None:
         """Refresh the template.
 
@@ -1115,11 +1291,25 @@ class TrackTemplateResultInfo:
 
         replayed is True if the event is being replayed because the
         rate limit was hit.
+
+        events is set when the refresh was coalesced by the render
+        scheduler and maps the templates to consider to the last
+        state_changed event that affected them.
         """
         updates: list[TrackTemplateResult] = []
         info_changed = False
         now = event.time_fired if not replayed and event else dt_util.utcnow()
 
+        def _render_if_ready(
+            track_template_: TrackTemplate,
+        ) -> bool | TrackTemplateResult:
+            """Re-render a template with the event that affected it."""
+            if events is None:
+                return self._render_template_if_ready(track_template_, now, event)
+            if (template_event := events.get(track_template_.template)) is None:
+                return False
+            return self._render_template_if_ready(track_template_, now, template_event)
+
         def _apply_update(
             update: bool | TrackTemplateResult, template: Template
         ) -> bool:
@@ -1141,7 +1331,7 @@ class TrackTemplateResultInfo:
 
         # Update the super template first
         if super_template is not None:
-            update = self._render_template_if_ready(super_template, now, event)
+            update = _render_if_ready(super_template)
             info_changed |= _apply_update(update, super_template.template)
 
             if isinstance(update, TrackTemplateResult):
@@ -1164,6 +1354,7 @@ class TrackTemplateResultInfo:
                 # Super template changed from not True to True, force re-render
                 # of all templates in the group
                 event = None
+                events = None
                 track_templates = self._track_templates
 
         # Then update the remaining templates unless blocked by the super template
@@ -1172,7 +1363,7 @@ class TrackTemplateResultInfo:
                 if track_template_ == super_template:
                     continue
 
-                update = self._render_template_if_ready(track_template_, now, event)
+                update = _render_if_ready(track_template_)
                 info_changed |= _apply_update(update, track_template_.template)
 
         if info_changed:
@@ -1234,6 +1425,7 @@ def async_track_template_result(
     raise_on_template_error: bool = False,
     strict: bool = False,
     has_super_template: bool = False,
+    coalesce_renders: bool = False,
 ) -> TrackTemplateResultInfo:
     """Add a listener that fires when the result of a template changes.
 
@@ -1267,13 +1459,20 @@ def async_track_template_result(
     has_super_template
         When set to True, the first template will block rendering of other
         templates if it doesn't render as True.
+    coalesce_renders
+        When set to True, the templates are rendered by the template render
+        scheduler once for all state changes in the same event loop iteration.
+        The listener will not see states that only last until the next state
+        change.
 
     Returns
     -------
     Info object used to unregister the listener, and refresh the template.
 
     """
-    tracker = TrackTemplateResultInfo(hass, track_templates, action, has_super_template)
+    tracker = TrackTemplateResultInfo(
+        hass, track_templates, action, has_super_template, coalesce_renders
+    )
     tracker.async_setup(raise_on_template_error, strict=strict)
     return tracker
 
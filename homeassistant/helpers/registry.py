@@ -0,0 +1,17 @@
+"""Shared helpers for the registries."""
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Literal
+
+# Multi-value index of a registry, maps a value to the keys of the entries
+# that have it. The keys are kept in a dict to preserve their order.
+RegistryIndexType = defaultdict[str, dict[str, Literal[True]]]
+
+
+def unindex_value(index: RegistryIndexType, value: str, key: str) -> None:
+    """Remove a key from a multi-value index."""
+    keys = index[value]
+    del keys[key]
+    if not keys:
+        del index[value]
@@ -2,14 +2,16 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Awaitable, Callable, Coroutine, Iterable
+from collections.abc import Awaitable, Callable, Coroutine, Iterable, MutableMapping
 import dataclasses
 from enum import Enum
 from functools import cache, partial, wraps
 import logging
+import time
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, TypedDict, TypeGuard, TypeVar, cast
 
+from lru import LRU  # pylint: disable=no-name-in-module
 import voluptuous as vol
 
 from homeassistant.auth.permissions.const import CAT_ENTITIES, POLICY_CONTROL
@@ -28,6 +30,7 @@ from homeassistant.const import (
 )
 from homeassistant.core import (
     Context,
+    Event,
     HomeAssistant,
     ServiceCall,
     ServiceResponse,
@@ -68,6 +71,12 @@ _LOGGER = logging.getLogger(__name__)
 
 SERVICE_DESCRIPTION_CACHE = "service_description_cache"
 ALL_SERVICE_DESCRIPTIONS_CACHE = "all_service_descriptions_cache"
+SERVICE_TARGET_CACHE = "service_target_cache"
+# Number of device and area targets whose entities are cached
+SERVICE_TARGET_CACHE_SIZE = 256
+
+# The targeted device ids and area ids
+_TargetCacheKey = tuple[frozenset[str], frozenset[str]]
 
 
 @cache
@@ -466,46 +475,107 @@ def async_extract_referenced_entity_ids(
     if not selector.device_ids and not selector.area_ids:
         return selected
 
+    cache = _async_get_target_cache(hass)
+    key = (frozenset(selector.device_ids), frozenset(selector.area_ids))
+    if (resolved := cache.get(key)) is None:
+        resolved = cache[key] = _async_resolve_devices_and_areas(
+            hass, selector.device_ids, selector.area_ids
+        )
+    selected.indirectly_referenced.update(resolved.indirectly_referenced)
+    selected.missing_devices.update(resolved.missing_devices)
+    selected.missing_areas.update(resolved.missing_areas)
+    selected.referenced_devices.update(resolved.referenced_devices)
+    return selected
+
+
+@callback
+def _async_get_target_cache(
+    hass: HomeAssistant,
+) -> MutableMapping[_TargetCacheKey, SelectedEntities]:
+    """Return the cache of the entities which devices and areas resolve to."""
+    cache: MutableMapping[_TargetCacheKey, SelectedEntities] | None
+    if (cache := hass.data.get(SERVICE_TARGET_CACHE)) is not None:
+        return cache
+    target_cache: MutableMapping[_TargetCacheKey, SelectedEntities] = LRU(
+        SERVICE_TARGET_CACHE_SIZE
+    )
+    hass.data[SERVICE_TARGET_CACHE] = target_cache
+
+    @callback
+    def _async_clear_target_cache(event: Event) -> None:
+        """Clear the cache when a registry changes."""
+        target_cache.clear()
+
+    for event_type in (
+        area_registry.EVENT_AREA_REGISTRY_UPDATED,
+        device_registry.EVENT_DEVICE_REGISTRY_UPDATED,
+        entity_registry.EVENT_ENTITY_REGISTRY_UPDATED,
+    ):
+        hass.bus.async_listen(
+            event_type, _async_clear_target_cache, run_immediately=True
+        )
+    return target_cache
+
+
+@callback
+def _async_resolve_devices_and_areas(
+    hass: HomeAssistant, device_ids: set[str], area_ids: set[str]
+) -> SelectedEntities:
+    """Resolve targeted devices and areas to entities."""
+    selected = SelectedEntities()
     ent_reg = entity_registry.async_get(hass)
     dev_reg = device_registry.async_get(hass)
     area_reg = area_registry.async_get(hass)
 
-    for device_id in selector.device_ids:
+    for device_id in device_ids:
         if device_id not in dev_reg.devices:
             selected.missing_devices.add(device_id)
 
-    for area_id in selector.area_ids:
+    for area_id in area_ids:
         if area_id not in area_reg.areas:
             selected.missing_areas.add(area_id)
 
     # Find devices for targeted areas
-    selected.referenced_devices.update(selector.device_ids)
-    for device_entry in dev_reg.devices.values():
-        if device_entry.area_id in selector.area_ids:
-            selected.referenced_devices.add(device_entry.id)
+    selected.referenced_devices.update(device_ids)
+    for area_id in area_ids:
+        selected.referenced_devices.update(
+            device_entry.id
+            for device_entry in dev_reg.devices.get_devices_for_area_id(area_id)
+        )
 
-    if not selector.area_ids and not selected.referenced_devices:
+    if not area_ids and not selected.referenced_devices:
         return selected
 
-    for ent_entry in ent_reg.entities.values():
-        # Do not add entities which are hidden or which are config
-        # or diagnostic entities.
-        if ent_entry.entity_category is not None or ent_entry.hidden_by is not None:
-            continue
+    entities = ent_reg.entities
+    # Add entities whose area matches a targeted area
+    for area_id in area_ids:
+        selected.indirectly_referenced.update(
+            ent_entry.entity_id
+            for ent_entry in entities.get_entries_for_area_id(area_id)
+            # Do not add entities which are hidden or which are config
+            # or diagnostic entities.
+            if ent_entry.entity_category is None and ent_entry.hidden_by is None
+        )
 
-        if (
-            # The entity's area matches a targeted area
-            ent_entry.area_id in selector.area_ids
-            # The entity's device matches a device referenced by an area and the entity
-            # has no explicitly set area
-            or (
+    # Add entities of referenced devices
+    for device_id in selected.referenced_devices:
+        selected.indirectly_referenced.update(
+            ent_entry.entity_id
+            for ent_entry in entities.get_entries_for_device_id(
+                device_id, include_disabled_entities=True
+            )
+            # Do not add entities which are hidden or which are config
+            # or diagnostic entities.
+            if ent_entry.entity_category is None
+            and ent_entry.hidden_by is None
+            and (
+                # The entity's device matches a device referenced by an area
+                # and the entity has no explicitly set area
                 not ent_entry.area_id
-                and ent_entry.device_id in selected.referenced_devices
+                # The entity's device matches a targeted device
+                or device_id in device_ids
             )
-            # The entity's device matches a targeted device
-            or ent_entry.device_id in selector.device_ids
-        ):
-            selected.indirectly_referenced.add(ent_entry.entity_id)
+        )
 
     return selected
 
@@ -732,6 +802,27 @@ def async_set_service_schema(
     descriptions_cache[(domain, service)] = description
 
 
+def _get_referenced_entities(
+    platforms: Iterable[EntityPlatform], entity_ids: set[str]
+) -> list[Entity]:
+    """Return the entities of the platforms with the referenced entity ids.
+
+    The referenced entity ids are intersected with the entity ids of each
+    platform, the ids which are found are not looked up in the other
+    platforms.
+    """
+    entities: list[Entity] = []
+    remaining = set(entity_ids)
+    for platform in platforms:
+        if not remaining:
+            break
+        platform_entities = platform.entities
+        if found := platform_entities.keys() & remaining:
+            remaining -= found
+            entities.extend([platform_entities[entity_id] for entity_id in found])
+    return entities
+
+
 @bind_hass
 async def entity_service_call(  # noqa: C901
     hass: HomeAssistant,
@@ -777,18 +868,12 @@ async def entity_service_call(  # noqa: C901
     entity_candidates: list[Entity] = []
 
     if entity_perms is None:
-        for platform in platforms:
-            platform_entities = platform.entities
-            if target_all_entities:
-                entity_candidates.extend(platform_entities.values())
-            else:
-                assert all_referenced is not None
-                entity_candidates.extend(
-                    [
-                        platform_entities[entity_id]
-                        for entity_id in all_referenced.intersection(platform_entities)
-                    ]
-                )
+        if target_all_entities:
+            for platform in platforms:
+                entity_candidates.extend(platform.entities.values())
+        else:
+            assert all_referenced is not None
+            entity_candidates = _get_referenced_entities(platforms, all_referenced)
 
     elif target_all_entities:
         # If we target all entities, we will select all entities the user
@@ -805,21 +890,14 @@ async def entity_service_call(  # noqa: C901
     else:
         assert all_referenced is not None
 
-        for platform in platforms:
-            platform_entities = platform.entities
-            platform_entity_candidates = []
-            entity_id_matches = all_referenced.intersection(platform_entities)
-            for entity_id in entity_id_matches:
-                if not entity_perms(entity_id, POLICY_CONTROL):
-                    raise Unauthorized(
-                        context=call.context,
-                        entity_id=entity_id,
-                        permission=POLICY_CONTROL,
-                    )
-
-                platform_entity_candidates.append(platform_entities[entity_id])
-
-            entity_candidates.extend(platform_entity_candidates)
+        entity_candidates = _get_referenced_entities(platforms, all_referenced)
+        for entity in entity_candidates:
+            if not entity_perms(entity.entity_id, POLICY_CONTROL):
+                raise Unauthorized(
+                    context=call.context,
+                    entity_id=entity.entity_id,
+                    permission=POLICY_CONTROL,
+                )
 
     if not target_all_entities:
         assert referenced is not None
@@ -882,14 +960,18 @@ async def entity_service_call(  # noqa: C901
             "Service call requested response data but matched more than one entity"
         )
 
+    entities_by_platform: dict[EntityPlatform | None, list[Entity]] = {}
+    for entity in entities:
+        entities_by_platform.setdefault(entity.platform, []).append(entity)
+
     done, pending = await asyncio.wait(
         [
             asyncio.create_task(
-                entity.async_request_call(
-                    _handle_entity_call(hass, entity, func, data, call.context)
+                _handle_platform_call(
+                    hass, call, platform, platform_entities, func, data
                 )
             )
-            for entity in entities
+            for platform, platform_entities in entities_by_platform.items()
         ]
     )
     assert not pending
@@ -897,6 +979,49 @@ async def entity_service_call(  # noqa: C901
     for task in done:
         task.result()  # pop exception if have
 
+    return None
+
+
+async def _handle_platform_call(
+    hass: HomeAssistant,
+    call: ServiceCall,
+    platform: EntityPlatform | None,
+    entities: list[Entity],
+    func: str | Callable[..., Coroutine[Any, Any, ServiceResponse]],
+    data: dict | ServiceCall,
+) -> None:
+    """Call a service on the entities of a platform.
+
+    Platforms which implement async_bulk_entity_service_call are called once
+    with all their entities, otherwise the entities are called in parallel,
+    limited by PARALLEL_SERVICE_CALLS of the platform.
+    """
+    start = time.monotonic()
+
+    if (
+        platform is None
+        or (bulk_call := platform.async_bulk_entity_service_call) is None
+        or not isinstance(func, str)
+        or not await _handle_bulk_entity_call(
+            hass, bulk_call, entities, func, data, call.context
+        )
+    ):
+        semaphore = platform.parallel_service_calls if platform else None
+        done, pending = await asyncio.wait(
+            [
+                asyncio.create_task(
+                    _handle_limited_entity_call(
+                        hass, semaphore, entity, func, data, call.context
+                    )
+                )
+                for entity in entities
+            ]
+        )
+        assert not pending
+
+        for task in done:
+            task.result()  # pop exception if have
+
     tasks: list[asyncio.Task[None]] = []
 
     for entity in entities:
@@ -914,7 +1039,63 @@ async def entity_service_call(  # noqa: C901
         for future in done:
             future.result()  # pop exception if have
 
-    return None
+    if platform is None:
+        return
+    duration = time.monotonic() - start
+    service = f"{call.domain}.{call.service}"
+    if (stats := platform.service_call_stats.get(service)) is None:
+        stats = platform.service_call_stats[service] = {
+            "calls": 0,
+            "entities": 0,
+            "time": 0.0,
+        }
+    stats["calls"] += 1
+    stats["entities"] += len(entities)
+    stats["time"] += duration
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug(
+            "Service %s called for %d entities of platform %s in %.3f seconds",
+            service,
+            len(entities),
+            platform.platform_name,
+            duration,
+        )
+
+
+async def _handle_bulk_entity_call(
+    hass: HomeAssistant,
+    bulk_call: Callable[
+        [HomeAssistant, list[Entity], str, dict | ServiceCall],
+        Coroutine[Any, Any, bool],
+    ],
+    entities: list[Entity],
+    func: str,
+    data: dict | ServiceCall,
+    context: Context,
+) -> bool:
+    """Call a service method on all the entities of a platform at once."""
+    for entity in entities:
+        entity.async_set_context(context)
+    return await bulk_call(hass, entities, func, data)
+
+
+async def _handle_limited_entity_call(
+    hass: HomeAssistant,
+    semaphore: asyncio.Semaphore | None,
+    entity: Entity,
+    func: str | Callable[..., Coroutine[Any, Any, ServiceResponse]],
+    data: dict | ServiceCall,
+    context: Context,
+) -> ServiceResponse:
+    """Handle calling service method, limited by the platform semaphore."""
+    if semaphore is None:
+        return await entity.async_request_call(
+            _handle_entity_call(hass, entity, func, data, context)
+        )
+    async with semaphore:
+        return await entity.async_request_call(
+            _handle_entity_call(hass, entity, func, data, context)
+        )
 
 
 async def _handle_entity_call(
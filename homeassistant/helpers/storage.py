@@ -25,8 +25,10 @@ from homeassistant.loader import MAX_LOAD_CONCURRENTLY, bind_hass
 from homeassistant.util import json as json_util
 import homeassistant.util.dt as dt_util
 from homeassistant.util.file import WriteError
+from homeassistant.util.ulid import ulid_hex
 
 from . import json as json_helper
+from .json import json_bytes
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-warn-return-any
 # mypy: no-check-untyped-defs
@@ -36,6 +38,13 @@ _LOGGER = logging.getLogger(__name__)
 
 STORAGE_SEMAPHORE = "storage_semaphore"
 
+CHANGE_LOG_SUFFIX = ".changes"
+# Key of the change log id in the stored data and the change log header
+CHANGE_LOG_ID = "change_log"
+# The change log is compacted into the stored data once it grows beyond
+# this fraction of the size of the stored data
+CHANGE_LOG_COMPACT_RATIO = 0.5
+
 _T = TypeVar("_T", bound=Mapping[str, Any] | Sequence[Any])
 
 
@@ -94,8 +103,15 @@ class Store(Generic[_T]):
         encoder: type[JSONEncoder] | None = None,
         minor_version: int = 1,
         read_only: bool = False,
+        record_keys: Mapping[str, str] | None = None,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        record_keys maps the sections of the data which are lists of records
+        to the field identifying a record. Changes to those records are
+        appended to a change log instead of rewriting the whole file, which
+        is written again with all changes when Home Assistant stops.
+        """
         self.version = version
         self.minor_version = minor_version
         self.key = key
@@ -109,12 +125,18 @@ class Store(Generic[_T]):
         self._encoder = encoder
         self._atomic_writes = atomic_writes
         self._read_only = read_only
+        self._change_log = StoreChangeLog(record_keys) if record_keys else None
 
     @property
     def path(self):
         """Return the config path."""
         return self.hass.config.path(STORAGE_DIR, self.key)
 
+    @property
+    def change_log_path(self) -> str:
+        """Return the path of the change log."""
+        return f"{self.path}{CHANGE_LOG_SUFFIX}"
+
     async def async_load(self) -> _T | None:
         """Load data.
 
@@ -158,9 +180,7 @@ class Store(Generic[_T]):
             data = deepcopy(data)
         else:
             try:
-                data = await self.hass.async_add_executor_job(
-                    json_util.load_json, self.path
-                )
+                data = await self.hass.async_add_executor_job(self._load_file)
             except HomeAssistantError as err:
                 if isinstance(err.__cause__, JSONDecodeError):
                     # If we have a JSONDecodeError, it means the file is corrupt.
@@ -215,6 +235,10 @@ class Store(Generic[_T]):
                     return None
                 raise
 
+            if self._change_log is not None and self._change_log.has_changes:
+                # Write the changes of an unclean shutdown into the file
+                self._async_ensure_final_write_listener()
+
             if data == {}:
                 return None
 
@@ -326,14 +350,26 @@ class Store(Generic[_T]):
     async def _async_callback_final_write(self, _event: Event) -> None:
         """Handle a write because Home Assistant is in final write state."""
         self._unsub_final_write_listener = None
-        await self._async_handle_write_data()
+        await self._async_handle_write_data(snapshot=True)
+
+    async def _async_handle_write_data(self, *_args, snapshot: bool = False):
+        """Handle writing the config.
 
-    async def _async_handle_write_data(self, *_args):
-        """Handle writing the config."""
+        A snapshot writes the whole file even if changes could be appended
+        to the change log, so the file is complete after a clean shutdown.
+        """
         async with self._write_lock:
             self._async_cleanup_delay_listener()
             self._async_cleanup_final_write_listener()
 
+            change_log = self._change_log
+            if snapshot and change_log is not None and not self._read_only:
+                if self._data is None:
+                    if change_log.has_changes:
+                        await self._async_write_snapshot()
+                    return
+                change_log.reset()
+
             if self._data is None:
                 # Another write already consumed the data
                 return
@@ -353,6 +389,32 @@ class Store(Generic[_T]):
             except (json_util.SerializationError, WriteError) as err:
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
 
+            if change_log is not None and change_log.has_changes:
+                self._async_ensure_final_write_listener()
+
+    async def _async_write_snapshot(self) -> None:
+        """Write the stored data with the change log applied to it."""
+        try:
+            await self.hass.async_add_executor_job(self._write_snapshot)
+        except HomeAssistantError as err:
+            _LOGGER.error("Error writing config for %s: %s", self.key, err)
+
+    def _write_snapshot(self) -> None:
+        """Write the stored data with the change log applied to it."""
+        assert self._change_log is not None
+        data = self._load_file()
+        if not isinstance(data, dict) or "data" not in data:
+            return
+        self._change_log.reset()
+        self._write_data(self.path, data)
+
+    def _load_file(self) -> json_util.JsonValueType:
+        """Load the data from disk and apply the change log."""
+        data = json_util.load_json(self.path)
+        if self._change_log is not None and isinstance(data, dict):
+            self._change_log.load(self.change_log_path, data)
+        return data
+
     async def _async_write_data(self, path: str, data: dict) -> None:
         await self.hass.async_add_executor_job(self._write_data, self.path, data)
 
@@ -360,7 +422,15 @@ class Store(Generic[_T]):
         """Write the data."""
         os.makedirs(os.path.dirname(path), exist_ok=True)
 
+        if (change_log := self._change_log) is not None and change_log.append(
+            self.change_log_path, data, self._atomic_writes
+        ):
+            _LOGGER.debug("Appended changes for %s to %s", self.key, path)
+            return
+
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
+        if change_log is not None:
+            data = change_log.start_snapshot(data)
         json_helper.save_json(
             path,
             data,
@@ -368,6 +438,8 @@ class Store(Generic[_T]):
             encoder=self._encoder,
             atomic_writes=self._atomic_writes,
         )
+        if change_log is not None:
+            change_log.start_log(self.change_log_path, self._private)
 
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
         """Migrate to the new version."""
@@ -380,3 +452,203 @@ class Store(Generic[_T]):
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+        if self._change_log is not None:
+            self._change_log.reset()
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(os.unlink, self.change_log_path)
+
+
+class StoreChangeLog:
+    """Append the changed records of a store to a log.
+
+    The sections of the stored data listed in record_keys are lists of
+    records. When saving, each record is compared with what was last
+    written and only the changed and removed records are appended to the
+    change log, which is applied on top of the stored data when loading.
+
+    The whole file is written again and the change log is started over
+    when anything outside of the records changed or the log grew too
+    large compared to the stored data. The stored data and the header of
+    the change log carry the same id, so a change log which does not
+    belong to the stored data is ignored.
+
+    All methods do I/O and run in the executor.
+    """
+
+    def __init__(self, record_keys: Mapping[str, str]) -> None:
+        """Initialize the change log."""
+        self.record_keys = record_keys
+        self._log_id: str | None = None
+        self._header: tuple[Any, ...] | None = None
+        # The serialized records as last written, by section and record key
+        self._records: dict[str, dict[Any, bytes]] = {}
+        self._data_size = 0
+        self._log_size = 0
+        self.has_changes = False
+
+    def reset(self) -> None:
+        """Forget what was written, the next save writes the whole file."""
+        self._log_id = None
+        self._header = None
+        self._records = {}
+        self.has_changes = False
+
+    def load(self, path: str, data: dict[str, Any]) -> None:
+        """Apply the change log at path to the loaded data."""
+        self.reset()
+        log_id = data.pop(CHANGE_LOG_ID, None)
+        if not isinstance(stored := data.get("data"), dict):
+            return
+        records = {
+            section: {record[key]: record for record in stored.get(section, ())}
+            for section, key in self.record_keys.items()
+        }
+        lines: list[bytes] = []
+        if log_id is not None:
+            try:
+                with open(path, "rb") as log_file:
+                    content = log_file.read()
+            except FileNotFoundError:
+                log_id = None
+            else:
+                lines = content.splitlines()
+                if not lines or lines[0] != json_bytes({CHANGE_LOG_ID: log_id}):
+                    _LOGGER.warning(
+                        "Ignoring change log %s which does not belong to the"
+                        " stored data",
+                        path,
+                    )
+                    lines = []
+                    log_id = None
+        for line in lines[1:]:
+            try:
+                change = json_util.json_loads_object(line)
+            except json_util.JSON_DECODE_EXCEPTIONS:
+                # An unclean shutdown can leave the last change incomplete
+                _LOGGER.warning("Ignoring incomplete change in change log %s", path)
+                log_id = None
+                break
+            if (section := records.get(change["s"])) is None:  # type: ignore[arg-type]
+                continue
+            if "r" in change:
+                section[change["k"]] = change["r"]
+            else:
+                section.pop(change["k"], None)
+        for section, section_records in records.items():
+            if section in stored or section_records:
+                stored[section] = list(section_records.values())
+        # Changes are only appended to a log which ends with a complete change
+        if log_id is not None and (not lines or content.endswith(b"\n")):
+            self._remember(data, log_id)
+            self._log_size = sum(len(line) + 1 for line in lines)
+            self.has_changes = len(lines) > 1
+
+    def append(self, path: str, data: dict[str, Any], fsync: bool) -> bool:
+        """Append the changes to the log, return False if a snapshot is needed."""
+        if (
+            self._log_id is None
+            or not isinstance(stored := data.get("data"), dict)
+            or self._header != self._serialize_header(data)
+        ):
+            return False
+        lines: list[bytes] = []
+        records: dict[str, dict[Any, bytes]] = {}
+        for section, key in self.record_keys.items():
+            written = self._records[section]
+            serialized = records[section] = {}
+            for record in stored.get(section, ()):
+                record_key = record[key]
+                raw = serialized[record_key] = json_bytes(record)
+                if written.get(record_key) != raw:
+                    lines.append(
+                        b'{"s":%b,"k":%b,"r":%b}\n'
+                        % (json_bytes(section), json_bytes(record_key), raw)
+                    )
+            lines.extend(
+                b'{"s":%b,"k":%b}\n' % (json_bytes(section), json_bytes(record_key))
+                for record_key in written
+                if record_key not in serialized
+            )
+        if not lines:
+            return True
+        size = sum(len(line) for line in lines)
+        if self._log_size + size > self._data_size * CHANGE_LOG_COMPACT_RATIO:
+            return False
+        if not os.path.exists(path):
+            # The log must start with its header
+            self.reset()
+            return False
+        try:
+            with open(path, "ab") as log_file:
+                log_file.write(b"".join(lines))
+                if fsync:
+                    log_file.flush()
+                    os.fsync(log_file.fileno())
+        except OSError as err:
+            # A partially written change would hide all changes after it
+            self.reset()
+            raise WriteError(err) from err
+        self._records = records
+        self._log_size += size
+        self.has_changes = True
+        return True
+
+    def start_snapshot(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Return the data to write to start a new change log."""
+        self.reset()
+        if not isinstance(data.get("data"), dict):
+            return data
+        log_id = ulid_hex()
+        self._remember(data, log_id)
+        return {**data, CHANGE_LOG_ID: log_id}
+
+    def start_log(self, path: str, private: bool) -> None:
+        """Start a new change log after the data has been written."""
+        if (log_id := self._log_id) is None:
+            with suppress(FileNotFoundError):
+                os.unlink(path)
+            return
+        header = json_bytes({CHANGE_LOG_ID: log_id}) + b"\n"
+        try:
+            fd = os.open(
+                path,
+                os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+                0o600 if private else 0o644,
+            )
+            with open(fd, "wb") as log_file:
+                log_file.write(header)
+        except OSError as err:
+            self.reset()
+            raise WriteError(err) from err
+        self._log_size = len(header)
+
+    def _serialize_header(self, data: dict[str, Any]) -> tuple[Any, ...]:
+        """Serialize everything besides the records."""
+        stored = data["data"]
+        return (
+            data.get("version"),
+            data.get("minor_version"),
+            data.get("key"),
+            json_bytes(
+                {
+                    section: value
+                    for section, value in stored.items()
+                    if section not in self.record_keys
+                }
+            ),
+        )
+
+    def _remember(self, data: dict[str, Any], log_id: str) -> None:
+        """Remember the data as written with the change log id."""
+        stored = data["data"]
+        self._log_id = log_id
+        self._header = self._serialize_header(data)
+        self._records = {
+            section: {
+                record[key]: json_bytes(record) for record in stored.get(section, ())
+            }
+            for section, key in self.record_keys.items()
+        }
+        self._data_size = len(self._header[-1]) + sum(
+            len(raw) for records in self._records.values() for raw in records.values()
+        )
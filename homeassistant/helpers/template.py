@@ -10,8 +10,11 @@ from contextlib import contextmanager, suppress
 from contextvars import ContextVar
 from datetime import datetime, timedelta
 from functools import cache, lru_cache, partial, wraps
+import hashlib
+from importlib.util import MAGIC_NUMBER
 import json
 import logging
+import marshal
 import math
 from operator import contains
 import pathlib
@@ -55,6 +58,7 @@ from homeassistant.const import (
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     UnitOfLength,
+    __version__ as HA_VERSION,
 )
 from homeassistant.core import (
     Context,
@@ -80,6 +84,7 @@ from homeassistant.util.thread import ThreadWithException
 
 from . import area_registry, device_registry, entity_registry, location as loc_helper
 from .singleton import singleton
+from .storage import Store
 from .typing import TemplateVarsType
 
 # mypy: allow-untyped-defs, no-check-untyped-defs
@@ -92,6 +97,7 @@ _ENVIRONMENT = "template.environment"
 _ENVIRONMENT_LIMITED = "template.environment_limited"
 _ENVIRONMENT_STRICT = "template.environment_strict"
 _HASS_LOADER = "template.hass_loader"
+_CODE_CACHE = "template.code_cache"
 
 _RE_JINJA_DELIMITERS = re.compile(r"\{%|\{\{|\{#")
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
@@ -147,6 +153,14 @@ EVAL_CACHE_SIZE = 512
 
 MAX_CUSTOM_TEMPLATE_SIZE = 5 * 1024 * 1024
 
+# Compiled code is kept alive for this many recently used sources after
+# the last Template using it is gone so reloads do not recompile them
+COMPILED_CODE_LRU_SIZE = 1024
+
+CODE_CACHE_STORAGE_KEY = "core.template_code_cache"
+CODE_CACHE_STORAGE_VERSION = 1
+CODE_CACHE_SAVE_DELAY = 60
+
 CACHED_TEMPLATE_LRU: MutableMapping[State, TemplateState] = LRU(CACHED_TEMPLATE_STATES)
 CACHED_TEMPLATE_NO_COLLECT_LRU: MutableMapping[State, TemplateState] = LRU(
     CACHED_TEMPLATE_STATES
@@ -2245,6 +2259,124 @@ def _get_hass_loader(hass: HomeAssistant) -> HassLoader:
     return HassLoader({})
 
 
+async def async_load_code_cache(hass: HomeAssistant) -> None:
+    """Load the compiled template code saved by the previous run."""
+    await _get_code_cache(hass).async_load()
+
+
+@singleton(_CODE_CACHE)
+def _get_code_cache(hass: HomeAssistant) -> TemplateCodeCache:
+    return TemplateCodeCache(hass)
+
+
+def _code_cache_fingerprint() -> str:
+    """Return the fingerprint compiled code in the code cache is only valid for.
+
+    Compiled code depends on the Python bytecode format and the jinja2
+    code generator, the Home Assistant version covers changes to the
+    template environment.
+    """
+    return f"{HA_VERSION}-{MAGIC_NUMBER.hex()}-{jinja2.__version__}"
+
+
+class TemplateCodeCache:
+    """Persist compiled template code between restarts.
+
+    Entries are keyed by the environment (limited/strict) and a hash of the
+    template source. Only the most recently used entries of a run are saved,
+    so templates that are removed from the configuration are dropped from
+    the cache and one-off templates do not grow it.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the code cache."""
+        self._hass = hass
+        self._save_scheduled = False
+        self._store: Store[dict[str, Any]] = Store(
+            hass, CODE_CACHE_STORAGE_VERSION, CODE_CACHE_STORAGE_KEY, private=True
+        )
+        self._loaded: dict[str, str] = {}
+        self._used: MutableMapping[str, str] = LRU(COMPILED_CODE_LRU_SIZE)
+        self.hits = 0
+        self.misses = 0
+
+    async def async_load(self) -> None:
+        """Load the code cache."""
+        data = await self._store.async_load()
+        if data and data.get("fingerprint") == _code_cache_fingerprint():
+            self._loaded = data["code"]
+
+    def get(self, environment: str, source: str) -> CodeType | None:
+        """Return compiled code for a source if it was saved by the previous run.
+
+        Templates may be compiled outside the event loop, this is thread-safe.
+        """
+        key = self._key(environment, source)
+        if (encoded := self._used.get(key) or self._loaded.get(key)) is None:
+            self.misses += 1
+            return None
+        try:
+            code = marshal.loads(base64.b64decode(encoded))
+        except (ValueError, EOFError, TypeError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._mark_used(key, encoded)
+        return code  # type: ignore[no-any-return]
+
+    def add(self, environment: str, source: str, code: CodeType) -> None:
+        """Add compiled code for a source to the cache."""
+        self._mark_used(
+            self._key(environment, source),
+            base64.b64encode(marshal.dumps(code)).decode(),
+        )
+
+    def _mark_used(self, key: str, encoded: str) -> None:
+        """Mark an entry as used so it is saved."""
+        # Looking the entry up makes it the most recently used
+        if self._used.get(key) is not None:
+            return
+        self._used[key] = encoded
+        loop = self._hass.loop
+        if not self._save_scheduled and not loop.is_closed():
+            self._save_scheduled = True
+            loop.call_soon_threadsafe(self._async_schedule_save)
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Schedule saving the cache."""
+        self._save_scheduled = False
+        self._store.async_delay_save(self._data_to_save, CODE_CACHE_SAVE_DELAY)
+
+    @staticmethod
+    def _key(environment: str, source: str) -> str:
+        """Return the cache key for a source."""
+        return f"{environment}:{hashlib.sha256(source.encode()).hexdigest()}"
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to save."""
+        return {"fingerprint": _code_cache_fingerprint(), "code": dict(self._used)}
+
+
+@callback
+def async_get_compile_stats(hass: HomeAssistant) -> dict[str, Any]:
+    """Return hit and miss counters of the template code caches."""
+    environments: dict[str, Any] = {}
+    for name, key in (
+        ("default", _ENVIRONMENT),
+        ("limited", _ENVIRONMENT_LIMITED),
+        ("strict", _ENVIRONMENT_STRICT),
+    ):
+        if (env := hass.data.get(key)) is not None:
+            environments[name] = dict(env.compile_stats)
+    code_cache = _get_code_cache(hass)
+    return {
+        "environments": environments,
+        "code_cache": {"hits": code_cache.hits, "misses": code_cache.misses},
+    }
+
+
 class HassLoader(jinja2.BaseLoader):
     """An in-memory jinja loader that keeps track of templates that need to be reloaded."""
 
@@ -2288,6 +2420,18 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         self.template_cache: weakref.WeakValueDictionary[
             str | jinja2.nodes.Template, CodeType | str | None
         ] = weakref.WeakValueDictionary()
+        # Keeps compiled code alive across reloads, when the old
+        # Templates are released before the new ones compile
+        self.template_code_lru: MutableMapping[str, CodeType] = LRU(
+            COMPILED_CODE_LRU_SIZE
+        )
+        self.compile_stats = {"hits": 0, "lru_hits": 0, "disk_hits": 0, "misses": 0}
+        if limited:
+            self._code_cache_environment = "limited"
+        elif strict:
+            self._code_cache_environment = "strict"
+        else:
+            self._code_cache_environment = "default"
         self.add_extension("jinja2.ext.loopcontrols")
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
@@ -2569,9 +2713,32 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 defer_init,
             )
 
-        if (cached := self.template_cache.get(source)) is None:
+        stats = self.compile_stats
+        if (cached := self.template_cache.get(source)) is not None:
+            stats["hits"] += 1
+        elif not isinstance(source, str):
+            stats["misses"] += 1
             cached = self.template_cache[source] = super().compile(source)
+        elif (cached := self.template_code_lru.get(source)) is not None:
+            stats["lru_hits"] += 1
+            self.template_cache[source] = cached
+        elif self.hass is not None and (
+            cached := _get_code_cache(self.hass).get(
+                self._code_cache_environment, source
+            )
+        ):
+            stats["disk_hits"] += 1
+            self.template_cache[source] = cached
+        else:
+            stats["misses"] += 1
+            cached = self.template_cache[source] = super().compile(source)
+            if self.hass is not None:
+                _get_code_cache(self.hass).add(
+                    self._code_cache_environment, source, cached
+                )
 
+        if isinstance(source, str):
+            self.template_code_lru[source] = cached
         return cached
 
 
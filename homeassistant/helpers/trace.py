@@ -25,6 +25,7 @@ class TraceElement:
         "_result",
         "reuse_by_child",
         "_timestamp",
+        "_last_variables",
         "_variables",
     )
 
@@ -37,17 +38,25 @@ class TraceElement:
         self._result: dict[str, Any] | None = None
         self.reuse_by_child = False
         self._timestamp = dt_util.utcnow()
+        self._last_variables: dict[str, Any] | None = None
+        self._variables: dict[str, Any] = {}
 
-        if variables is None:
-            variables = {}
+        if variables is None or not trace_enabled_cv.get():
+            if variables is None:
+                variables_cv.set({})
+            return
         last_variables = variables_cv.get() or {}
         variables_cv.set(dict(variables))
-        changed_variables = {
+        # Keep references to the values which are not the same objects as in
+        # the previous step, comparing them is deferred until rendering
+        self._variables = {
             key: value
             for key, value in variables.items()
-            if key not in last_variables or last_variables[key] != value
+            if key not in last_variables or last_variables[key] is not value
+        }
+        self._last_variables = {
+            key: last_variables[key] for key in self._variables if key in last_variables
         }
-        self._variables = changed_variables
 
     def __repr__(self) -> str:
         """Container for trace data."""
@@ -81,6 +90,13 @@ class TraceElement:
                 "item_id": item_id,
                 "run_id": str(self._child_run_id),
             }
+        if (last_variables := self._last_variables) is not None:
+            self._variables = {
+                key: value
+                for key, value in self._variables.items()
+                if key not in last_variables or last_variables[key] != value
+            }
+            self._last_variables = None
         if self._variables:
             result["changed_variables"] = self._variables
         if self._error is not None:
@@ -105,6 +121,8 @@ trace_path_stack_cv: ContextVar[list[str] | None] = ContextVar(
 )
 # Copy of last variables
 variables_cv: ContextVar[Any | None] = ContextVar("variables_cv", default=None)
+# Whether the steps of the current run are traced
+trace_enabled_cv: ContextVar[bool] = ContextVar("trace_enabled_cv", default=True)
 # (domain.item_id, Run ID)
 trace_id_cv: ContextVar[tuple[str, str] | None] = ContextVar(
     "trace_id_cv", default=None
@@ -167,11 +185,18 @@ def trace_path_get() -> str:
     return "/".join(path)
 
 
+def trace_set_enabled(enabled: bool) -> None:
+    """Set if the steps of the current run are traced."""
+    trace_enabled_cv.set(enabled)
+
+
 def trace_append_element(
     trace_element: TraceElement,
     maxlen: int | None = None,
 ) -> None:
     """Append a TraceElement to trace[path]."""
+    if not trace_enabled_cv.get():
+        return
     if (trace := trace_cv.get()) is None:
         trace = {}
         trace_cv.set(trace)
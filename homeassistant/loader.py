@@ -7,13 +7,20 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
 from dataclasses import dataclass
+from datetime import timedelta
 import functools as ft
+from graphlib import CycleError, TopologicalSorter
 import importlib
 import logging
+import os
 import pathlib
+from stat import S_ISREG
 import sys
+import threading
+import time
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, Literal, Protocol, TypedDict, TypeVar, cast
 
@@ -25,6 +32,7 @@ from awesomeversion import (
 import voluptuous as vol
 
 from . import generated
+from .const import Platform, __version__
 from .generated.application_credentials import APPLICATION_CREDENTIALS
 from .generated.bluetooth import BLUETOOTH
 from .generated.dhcp import DHCP
@@ -48,6 +56,11 @@ _LOGGER = logging.getLogger(__name__)
 DATA_COMPONENTS = "components"
 DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
+# DATA_IMPORT_TIME is a dict [str, timedelta], indicating how long it took
+# to import an integration and the platforms imported with it
+DATA_IMPORT_TIME = "import_time"
+DATA_PREIMPORT = "preimport"
+DATA_MANIFEST_CACHE = "manifest_cache"
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -61,8 +74,18 @@ _UNDEF = object()  # Internal; not helpers.typing.UNDEFINED due to circular depe
 
 MAX_LOAD_CONCURRENTLY = 4
 
+# Number of threads used to import integrations ahead of their setup
+MAX_IMPORT_CONCURRENTLY = 4
+
+# Platforms that are imported together with an integration if it has them
+PREIMPORT_PLATFORMS = frozenset(platform.value for platform in Platform)
+
 MOVED_ZEROCONF_PROPS = ("macaddress", "model", "manufacturer")
 
+MANIFEST_CACHE_STORAGE_KEY = "core.manifest_cache"
+MANIFEST_CACHE_STORAGE_VERSION = 1
+MANIFEST_CACHE_SAVE_DELAY = 60
+
 
 class DHCPMatcherRequired(TypedDict, total=True):
     """Matcher for the dhcp integration for required fields."""
@@ -171,6 +194,115 @@ def async_setup(hass: HomeAssistant) -> None:
     _async_mount_config_dir(hass)
     hass.data[DATA_COMPONENTS] = {}
     hass.data[DATA_INTEGRATIONS] = {}
+    hass.data[DATA_MANIFEST_CACHE] = ManifestCache(hass)
+
+
+class ManifestCache:
+    """Parsed manifest.json files that are kept between restarts.
+
+    A manifest is used from the cache as long as the modification time and
+    size of the file are unchanged. The cache is discarded when Home
+    Assistant is updated, and manifests that no longer exist are dropped
+    when it is loaded.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the manifest cache."""
+        # pylint: disable-next=import-outside-toplevel
+        from .helpers.storage import Store
+
+        self._hass = hass
+        self._store: Store[dict[str, Any]] = Store(
+            hass, MANIFEST_CACHE_STORAGE_VERSION, MANIFEST_CACHE_STORAGE_KEY
+        )
+        self._manifests: dict[str, tuple[int, int, Manifest]] = {}
+        # Manifests are added from the executor while the event loop saves them
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._dirty = False
+
+    async def async_load(self) -> None:
+        """Load the cache from disk if it is not loaded yet."""
+        if self._loaded:
+            return
+        data = await self._store.async_load()
+        if self._loaded:
+            return
+        self._loaded = True
+        if data is None or data["ha_version"] != __version__:
+            return
+        manifests = await self._hass.async_add_executor_job(
+            _existing_manifests, data["manifests"]
+        )
+        with self._lock:
+            self._manifests = manifests | self._manifests
+            if len(manifests) != len(data["manifests"]):
+                # Integrations were removed or moved
+                self._dirty = True
+
+    def get(
+        self, manifest_path: pathlib.Path, manifest_stat: os.stat_result
+    ) -> Manifest | None:
+        """Return the cached manifest if the file did not change.
+
+        Called from the executor.
+        """
+        if (cached := self._manifests.get(str(manifest_path))) is None:
+            return None
+        mtime_ns, size, manifest = cached
+        if mtime_ns != manifest_stat.st_mtime_ns or size != manifest_stat.st_size:
+            return None
+        return cast(Manifest, dict(manifest))
+
+    def set(
+        self,
+        manifest_path: pathlib.Path,
+        manifest_stat: os.stat_result,
+        manifest: Manifest,
+    ) -> None:
+        """Add a parsed manifest to the cache.
+
+        Called from the executor.
+        """
+        with self._lock:
+            self._manifests[str(manifest_path)] = (
+                manifest_stat.st_mtime_ns,
+                manifest_stat.st_size,
+                cast(Manifest, dict(manifest)),
+            )
+            self._dirty = True
+
+    def async_schedule_save(self) -> None:
+        """Save the cache if manifests were added or removed."""
+        with self._lock:
+            if not self._dirty:
+                return
+            self._dirty = False
+        self._store.async_delay_save(self._data_to_save, MANIFEST_CACHE_SAVE_DELAY)
+
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to store."""
+        with self._lock:
+            manifests = {path: list(cached) for path, cached in self._manifests.items()}
+        return {"ha_version": __version__, "manifests": manifests}
+
+
+def _existing_manifests(
+    manifests: dict[str, list[Any]]
+) -> dict[str, tuple[int, int, Manifest]]:
+    """Return the cached manifests of which the file still exists."""
+    return {
+        path: (mtime_ns, size, manifest)
+        for path, (mtime_ns, size, manifest) in manifests.items()
+        if os.path.isfile(path)
+    }
+
+
+async def _async_get_manifest_cache(hass: HomeAssistant) -> ManifestCache | None:
+    """Return the loaded manifest cache."""
+    if (manifest_cache := hass.data.get(DATA_MANIFEST_CACHE)) is not None:
+        await manifest_cache.async_load()
+    return cast(ManifestCache | None, manifest_cache)
 
 
 def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
@@ -209,12 +341,15 @@ async def _async_get_custom_components(
         get_sub_directories, custom_components.__path__
     )
 
+    manifest_cache = await _async_get_manifest_cache(hass)
     integrations = await hass.async_add_executor_job(
         _resolve_integrations_from_root,
         hass,
         custom_components,
         [comp.name for comp in dirs],
     )
+    if manifest_cache is not None:
+        manifest_cache.async_schedule_save()
     return {
         integration.domain: integration
         for integration in integrations.values()
@@ -317,15 +452,29 @@ class ComponentProtocol(Protocol):
         """Set up integration."""
 
 
+@ft.cache
+def _load_core_integration_descriptions() -> dict[str, Any]:
+    """Load the descriptions of the core integrations.
+
+    They are generated and do not change while Home Assistant runs.
+    """
+    config_flow_path = pathlib.Path(generated.__path__[0]) / "integrations.json"
+    return cast(dict[str, Any], json_loads(config_flow_path.read_text()))
+
+
 async def async_get_integration_descriptions(
     hass: HomeAssistant,
 ) -> dict[str, Any]:
     """Return cached list of integrations."""
-    base = generated.__path__[0]
-    config_flow_path = pathlib.Path(base) / "integrations.json"
-
-    flow = await hass.async_add_executor_job(config_flow_path.read_text)
-    core_flows = cast(dict[str, Any], json_loads(flow))
+    core_descriptions = await hass.async_add_executor_job(
+        _load_core_integration_descriptions
+    )
+    # The parsed descriptions are shared, copy what is changed below
+    core_flows: dict[str, Any] = {
+        "integration": dict(core_descriptions["integration"]),
+        "helper": dict(core_descriptions["helper"]),
+        "translated_name": list(core_descriptions["translated_name"]),
+    }
     custom_integrations = await async_get_custom_components(hass)
     custom_flows: dict[str, Any] = {
         "integration": {},
@@ -559,16 +708,26 @@ class Integration:
         for base in root_module.__path__:
             manifest_path = pathlib.Path(base) / domain / "manifest.json"
 
-            if not manifest_path.is_file():
-                continue
-
             try:
-                manifest = cast(Manifest, json_loads(manifest_path.read_text()))
-            except JSON_DECODE_EXCEPTIONS as err:
-                _LOGGER.error(
-                    "Error parsing manifest.json file at %s: %s", manifest_path, err
-                )
+                manifest_stat = manifest_path.stat()
+            except OSError:
                 continue
+            if not S_ISREG(manifest_stat.st_mode):
+                continue
+
+            manifest_cache: ManifestCache | None = hass.data.get(DATA_MANIFEST_CACHE)
+            if manifest_cache is None or (
+                (manifest := manifest_cache.get(manifest_path, manifest_stat)) is None
+            ):
+                try:
+                    manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+                except JSON_DECODE_EXCEPTIONS as err:
+                    _LOGGER.error(
+                        "Error parsing manifest.json file at %s: %s", manifest_path, err
+                    )
+                    continue
+                if manifest_cache is not None:
+                    manifest_cache.set(manifest_path, manifest_stat, manifest)
 
             integration = cls(
                 hass,
@@ -813,6 +972,7 @@ class Integration:
         if self.domain in cache:
             return cache[self.domain]
 
+        start = time.perf_counter()
         try:
             cache[self.domain] = cast(
                 ComponentProtocol, importlib.import_module(self.pkg_path)
@@ -825,6 +985,10 @@ class Integration:
             )
             raise ImportError(f"Exception importing {self.pkg_path}") from err
 
+        # Integrations imported ahead of time already have their import time
+        self.hass.data.setdefault(DATA_IMPORT_TIME, {}).setdefault(
+            self.domain, timedelta(seconds=time.perf_counter() - start)
+        )
         return cache[self.domain]
 
     def get_platform(self, platform_name: str) -> ModuleType:
@@ -854,6 +1018,32 @@ class Integration:
         """Import the platform."""
         return importlib.import_module(f"{self.pkg_path}.{platform_name}")
 
+    def preimport(self) -> timedelta | None:
+        """Import the component and its entity platforms.
+
+        Runs in an import thread, failures are left for the setup of the
+        integration to report. Returns the time the imports took, or None
+        if they failed.
+        """
+        start = time.perf_counter()
+        try:
+            importlib.import_module(self.pkg_path)
+            platforms = (
+                {
+                    name.removesuffix(".py")
+                    for name in os.listdir(self.file_path)
+                    if name.removesuffix(".py") in PREIMPORT_PLATFORMS
+                }
+                if self.file_path
+                else ()
+            )
+            for platform_name in platforms:
+                importlib.import_module(f"{self.pkg_path}.{platform_name}")
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.debug("Unable to import %s ahead of setup: %s", self.domain, err)
+            return None
+        return timedelta(seconds=time.perf_counter() - start)
+
     def __repr__(self) -> str:
         """Text representation of class."""
         return f"<Integration {self.domain}: {self.pkg_path}>"
@@ -937,9 +1127,12 @@ async def async_get_integrations(
     if needed:
         from . import components  # pylint: disable=import-outside-toplevel
 
+        manifest_cache = await _async_get_manifest_cache(hass)
         integrations = await hass.async_add_executor_job(
             _resolve_integrations_from_root, hass, components, list(needed)
         )
+        if manifest_cache is not None:
+            manifest_cache.async_schedule_save()
         for domain, future in needed.items():
             int_or_exc = integrations.get(domain)
             if not int_or_exc:
@@ -957,6 +1150,101 @@ async def async_get_integrations(
     return results
 
 
+async def async_preimport_integrations(
+    hass: HomeAssistant, integrations: dict[str, Integration]
+) -> None:
+    """Import integrations in import threads ahead of setting them up.
+
+    An integration is imported once the integrations it depends on are
+    imported, so threads do not import the same modules concurrently.
+    Integrations waiting to be set up wait in async_wait_preimport for an
+    import that is running, and are imported by their setup if their
+    import has not started yet.
+    """
+    components: dict[str, ComponentProtocol] = hass.data[DATA_COMPONENTS]
+    # domain -> future of the running import, or None if it has not started
+    preimports: dict[str, asyncio.Future[None] | None] = hass.data.setdefault(
+        DATA_PREIMPORT, {}
+    )
+    to_import = {
+        domain: integration
+        for domain, integration in integrations.items()
+        if domain not in components and domain not in preimports
+    }
+    if not to_import:
+        return
+    for domain in to_import:
+        preimports[domain] = None
+
+    graph = {
+        domain: {
+            dep
+            for dep in (*integration.dependencies, *integration.after_dependencies)
+            if dep in to_import and dep != domain
+        }
+        for domain, integration in to_import.items()
+    }
+    sorter: TopologicalSorter[str] = TopologicalSorter(graph)
+    try:
+        sorter.prepare()
+    except CycleError:
+        # After dependencies can be circular, import in any order
+        sorter = TopologicalSorter({domain: set() for domain in to_import})
+        sorter.prepare()
+
+    import_time: dict[str, timedelta] = hass.data.setdefault(DATA_IMPORT_TIME, {})
+    executor = ThreadPoolExecutor(
+        max_workers=MAX_IMPORT_CONCURRENTLY, thread_name_prefix="ImportExecutor"
+    )
+    pending: dict[asyncio.Future[timedelta | None], str] = {}
+    try:
+        while sorter.is_active():
+            for domain in sorter.get_ready():
+                if domain not in preimports:
+                    # The setup of the integration imports it
+                    sorter.done(domain)
+                    continue
+                preimports[domain] = hass.loop.create_future()
+                future = hass.loop.run_in_executor(
+                    executor, to_import[domain].preimport
+                )
+                pending[future] = domain
+            if not pending:
+                continue
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                domain = pending.pop(future)
+                if (elapsed := future.result()) is not None:
+                    import_time[domain] = elapsed
+                if (waiter := preimports.pop(domain)) is not None:
+                    waiter.set_result(None)
+                sorter.done(domain)
+    finally:
+        for domain in to_import:
+            if (waiter := preimports.pop(domain, None)) is not None:
+                waiter.set_result(None)
+        # The threads are idle unless we were cancelled, so only
+        # wait for them to exit when they are done importing.
+        executor.shutdown(wait=not pending)
+
+
+async def async_wait_preimport(hass: HomeAssistant, domain: str) -> None:
+    """Wait for an integration that is imported ahead of time.
+
+    An integration whose import has not started is taken off the queue,
+    so its setup does not wait for a free import thread.
+    """
+    preimports: dict[str, asyncio.Future[None] | None] | None = hass.data.get(
+        DATA_PREIMPORT
+    )
+    if not preimports or domain not in preimports:
+        return
+    if (future := preimports[domain]) is None:
+        del preimports[domain]
+        return
+    await asyncio.shield(future)
+
+
 class LoaderError(Exception):
     """Loader base error."""
 
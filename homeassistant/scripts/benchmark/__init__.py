@@ -120,6 +120,64 @@ async def fire_events_with_filter(hass):
     return timer() - start
 
 
+@benchmark
+async def fire_events_with_keyed_listeners(hass):
+    """Fire 100k events through 1000 filtered and 1000 keyed listeners.
+
+    Compares bus throughput when listeners use per-listener event filters
+    versus the keyed listener index.
+    """
+    count = 0
+    event_name = "benchmark_event"
+    events_to_fire = 10**5
+    entity_ids = [f"light.kitchen{idx}" for idx in range(1000)]
+
+    @core.callback
+    def listener(_):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    for entity_id in entity_ids:
+        hass.bus.async_listen_keyed(event_name, "entity_id", [entity_id], listener)
+
+    event_data = {"entity_id": entity_ids[0]}
+
+    start = timer()
+
+    for _ in range(events_to_fire):
+        hass.bus.async_fire(event_name, event_data)
+
+    await hass.async_block_till_done()
+
+    keyed_runtime = timer() - start
+    assert count == events_to_fire
+    count = 0
+
+    filter_event_name = "benchmark_filter_event"
+    for entity_id in entity_ids:
+
+        @core.callback
+        def event_filter(event, entity_id=entity_id):
+            """Filter event."""
+            return event.data["entity_id"] == entity_id
+
+        hass.bus.async_listen(filter_event_name, listener, event_filter=event_filter)
+
+    start = timer()
+
+    for _ in range(events_to_fire):
+        hass.bus.async_fire(filter_event_name, event_data)
+
+    await hass.async_block_till_done()
+
+    filter_runtime = timer() - start
+    assert count == events_to_fire
+
+    print(f"Filtered listeners: {filter_runtime}s, keyed listeners: {keyed_runtime}s")
+    return keyed_runtime
+
+
 @benchmark
 async def state_changed_helper(hass):
     """Run a million events through state changed helper with 1000 entities."""
@@ -292,6 +350,50 @@ async def filtering_entity_id(hass):
     return timer() - start
 
 
+@benchmark
+async def mqtt_topic_matching(hass):
+    """Replay a burst of 1 million MQTT messages against 20k subscriptions.
+
+    The subscriptions and burst mimic a Zigbee2MQTT and Tasmota install
+    where discovery subscribes wildcard topics per device.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.mqtt.client import Subscription, SubscriptionTrie
+
+    trie = SubscriptionTrie()
+    job = core.HassJob(lambda msg: None)
+    devices = 5000
+    for idx in range(devices):
+        trie.add(Subscription(f"zigbee2mqtt/device_{idx}", job))
+        trie.add(Subscription(f"zigbee2mqtt/device_{idx}/availability", job))
+        trie.add(Subscription(f"tele/tasmota_{idx}/+", job))
+        trie.add(Subscription(f"stat/tasmota_{idx}/#", job))
+    trie.add(Subscription("homeassistant/+/+/config", job))
+    trie.add(Subscription("homeassistant/+/+/+/config", job))
+
+    burst = [
+        topic
+        for idx in range(0, devices, 7)
+        for topic in (
+            f"zigbee2mqtt/device_{idx}",
+            f"tele/tasmota_{idx}/SENSOR",
+            f"stat/tasmota_{idx}/RESULT",
+            f"homeassistant/sensor/device_{idx}/temperature/config",
+            "zigbee2mqtt/bridge/logging",
+        )
+    ]
+    size = len(burst)
+    matched = 0
+
+    start = timer()
+
+    for idx in range(10**6):
+        matched += len(trie.match(burst[idx % size]))
+
+    assert matched
+    return timer() - start
+
+
 @benchmark
 async def valid_entity_id(hass):
     """Run valid entity ID a million times."""
@@ -314,6 +416,95 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+def _hourly_statistics_rows(sensors, hours):
+    """Generate hourly statistics SQL results like an energy install."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.util import dt as dt_util
+
+    row = collections.namedtuple(
+        "Row",
+        ["metadata_id", "start_ts", "mean", "min", "max", "state", "sum"],
+    )
+    first_start = dt_util.utc_to_timestamp(dt_util.utcnow()) // 3600 * 3600 - (
+        hours * 3600
+    )
+    metadata = {
+        f"sensor.energy_{sensor}": (
+            sensor,
+            {
+                "has_mean": True,
+                "has_sum": True,
+                "name": None,
+                "source": "recorder",
+                "statistic_id": f"sensor.energy_{sensor}",
+                "unit_of_measurement": "kWh",
+            },
+        )
+        for sensor in range(sensors)
+    }
+    rows = [
+        row(
+            sensor,
+            first_start + hour * 3600,
+            (value := (sensor * 7 + hour) % 100 / 3),
+            value - 1,
+            value + 1,
+            value,
+            hour * 0.5,
+        )
+        for sensor in range(sensors)
+        for hour in range(hours)
+    ]
+    return metadata, rows
+
+
+async def _reduce_statistics_per_month(hass, columnar):
+    """Reduce three years of hourly statistics of 200 sensors per month."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder import db_schema, statistics
+
+    metadata, rows = _hourly_statistics_rows(200, 3 * 365 * 24)
+    statistic_ids = set(metadata)
+    types = {"mean", "min", "max", "state", "sum"}
+    _, month_start_end_ts = statistics.reduce_month_ts_factory()
+
+    start = timer()
+    # pylint: disable=protected-access
+    if columnar:
+        statistics._reduce_sorted_statistics_columnar(
+            hass, rows, statistic_ids, metadata, None, types, month_start_end_ts
+        )
+    else:
+        statistics._reduce_statistics_per_month(
+            statistics._sorted_statistics_to_dict(
+                hass,
+                None,
+                rows,
+                statistic_ids,
+                metadata,
+                True,
+                db_schema.Statistics,
+                None,
+                None,
+                types,
+            ),
+            types,
+        )
+    return timer() - start
+
+
+@benchmark
+async def reduce_statistics(hass):
+    """Reduce three years of hourly statistics one row at a time."""
+    return await _reduce_statistics_per_month(hass, False)
+
+
+@benchmark
+async def reduce_statistics_columnar(hass):
+    """Reduce three years of hourly statistics in batch."""
+    return await _reduce_statistics_per_month(hass, True)
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
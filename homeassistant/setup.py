@@ -209,6 +209,10 @@ async def _async_setup_component(
         log_error(str(err))
         return False
 
+    # Never import the integration in the event loop while it is
+    # imported ahead of time in an import thread.
+    await loader.async_wait_preimport(hass, domain)
+
     # Some integrations fail on import because they call functions incorrectly.
     # So we do it before validating config to catch these errors.
     try:
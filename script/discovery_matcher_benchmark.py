@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""Benchmark matching discovered DHCP clients and zeroconf services.
+
+Replays discovery records against the matchers of the integrations and
+reports the records matched per second, with the precompiled matcher
+indexes and with checking every matcher of a record like before.
+
+Recorded traffic is read from a file with a JSON object per line, either
+{"macaddress": ..., "hostname": ...} for a DHCP client or
+{"type": ..., "name": ..., "properties": {...}} for a zeroconf service.
+Without a file, records are generated from the matchers.
+"""
+import argparse
+from fnmatch import translate
+from functools import lru_cache
+import json
+import random
+import re
+import string
+from timeit import default_timer as timer
+from typing import Any
+
+from homeassistant import bootstrap  # noqa: F401
+from homeassistant.components.dhcp import DHCPMatchers
+from homeassistant.components.zeroconf import _compile_zeroconf_matchers
+from homeassistant.generated.dhcp import DHCP
+from homeassistant.generated.zeroconf import ZEROCONF
+from homeassistant.loader import DHCPMatcher
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _compile_fnmatch(pattern: str) -> re.Pattern:
+    """Compile a fnmatch pattern."""
+    return re.compile(translate(pattern))
+
+
+@lru_cache(maxsize=1024, typed=True)
+def _memorized_fnmatch(name: str, pattern: str) -> bool:
+    """Match a pattern like the matchers did before they were indexed."""
+    return bool(_compile_fnmatch(pattern).match(name))
+
+
+def _dhcp_matching_domains(
+    matchers: list[DHCPMatcher], uppercase_mac: str, lowercase_hostname: str
+) -> set[str]:
+    """Check every DHCP matcher against a client."""
+    return {
+        matcher["domain"]
+        for matcher in matchers
+        if not matcher.get("registered_devices")
+        and (
+            (mac_address := matcher.get("macaddress")) is None
+            or _memorized_fnmatch(uppercase_mac, mac_address)
+        )
+        and (
+            (hostname := matcher.get("hostname")) is None
+            or _memorized_fnmatch(lowercase_hostname, hostname)
+        )
+    }
+
+
+def _zeroconf_matching_domains(
+    zeroconf_types: dict[str, list[dict[str, Any]]], record: dict[str, Any]
+) -> set[str]:
+    """Check every zeroconf matcher of the type of a service."""
+    name = record["name"].lower()
+    props = record["properties"]
+    return {
+        matcher["domain"]
+        for matcher in zeroconf_types.get(record["type"], [])
+        if ("name" not in matcher or _memorized_fnmatch(name, matcher["name"]))
+        and all(
+            key in props and _memorized_fnmatch(props[key].lower(), pattern)
+            for key, pattern in matcher.get("properties", {}).items()
+        )
+    }
+
+
+def _random_text(pattern: str | None, length: int = 12) -> str:
+    """Return text matching a pattern, or random text without a pattern."""
+    if pattern is None:
+        return "".join(random.choices(string.ascii_lowercase, k=length))
+    return re.sub(
+        r"\[.*?\]|\*|\?",
+        lambda match: "a" if match.group() == "?" else "",
+        pattern,
+    )
+
+
+def _generate_records(count: int) -> list[dict[str, Any]]:
+    """Generate DHCP clients and zeroconf services, some matching."""
+    records: list[dict[str, Any]] = []
+    zeroconf_matchers = [
+        (service_type, matcher)
+        for service_type, matchers in ZEROCONF.items()
+        for matcher in matchers
+    ]
+    for num in range(count):
+        matching = num % 4 == 0
+        if num % 2:
+            mac_address = "".join(random.choices("0123456789ABCDEF", k=12))
+            hostname = _random_text(None)
+            if matching:
+                matcher = random.choice(DHCP)
+                if (mac_pattern := matcher.get("macaddress")) is not None:
+                    prefix = mac_pattern.rstrip("*")
+                    mac_address = prefix + mac_address[len(prefix) :]
+                hostname = _random_text(matcher.get("hostname"))
+            records.append({"macaddress": mac_address, "hostname": hostname})
+            continue
+        service_type, matcher = random.choice(zeroconf_matchers)
+        name = _random_text(None)
+        properties = {"id": _random_text(None)}
+        if matching:
+            if isinstance(matcher, dict):
+                name = _random_text(matcher.get("name"))
+                properties.update(
+                    {
+                        key: _random_text(pattern)
+                        for key, pattern in matcher.get("properties", {}).items()
+                    }
+                )
+        records.append(
+            {
+                "type": service_type,
+                "name": f"{name}.{service_type}",
+                "properties": properties,
+            }
+        )
+    return records
+
+
+def _run(
+    records: list[dict[str, Any]], rounds: int, indexed: bool
+) -> tuple[float, int]:
+    """Match the records and return the runtime and the number of matches."""
+    zeroconf_types = {
+        service_type: [
+            matcher if isinstance(matcher, dict) else {"domain": matcher}
+            for matcher in matchers
+        ]
+        for service_type, matchers in ZEROCONF.items()
+    }
+    dhcp_matchers = DHCPMatchers(DHCP)
+    zeroconf_matchers = _compile_zeroconf_matchers(zeroconf_types)
+    matches = 0
+    start = timer()
+    for _ in range(rounds):
+        for record in records:
+            if "macaddress" in record:
+                uppercase_mac = record["macaddress"].upper()
+                lowercase_hostname = record["hostname"].lower()
+                if indexed:
+                    domains = dhcp_matchers.async_matching_domains(
+                        uppercase_mac, lowercase_hostname, set(), record
+                    )
+                else:
+                    domains = _dhcp_matching_domains(
+                        DHCP, uppercase_mac, lowercase_hostname
+                    )
+            elif indexed:
+                match_data = {"name": record["name"].lower()}
+                domains = {
+                    matcher.domain
+                    for matcher in zeroconf_matchers.get(record["type"], [])
+                    if matcher.matches(match_data, record["properties"])
+                }
+            else:
+                domains = _zeroconf_matching_domains(zeroconf_types, record)
+            matches += len(domains)
+    return timer() - start, matches
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", help="File with recorded discovery records")
+    parser.add_argument("--count", type=int, default=5000, help="Records to generate")
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+
+    if args.records:
+        with open(args.records, encoding="utf-8") as records_file:
+            records = [json.loads(line) for line in records_file if line.strip()]
+    else:
+        records = _generate_records(args.count)
+
+    results = {
+        indexed: _run(records, args.rounds, indexed) for indexed in (False, True)
+    }
+    assert results[False][1] == results[True][1], "The matches differ"
+    total = len(records) * args.rounds
+    print(f"Matches:          {results[True][1]}")
+    print(f"Every matcher:    {total / results[False][0]:.0f} records/s")
+    print(f"Matcher indexes:  {total / results[True][0]:.0f} records/s")
+    print(f"Gain:             {results[False][0] / results[True][0]:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
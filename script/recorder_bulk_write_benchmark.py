@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Benchmark recorder state writes with and without bulk writes.
+
+Records a storm of state changes into a temporary database and reports the
+rows per second the recorder thread writes in each mode.
+"""
+import argparse
+import asyncio
+import logging
+from pathlib import Path
+import tempfile
+from timeit import default_timer as timer
+
+from homeassistant import config_entries, core, loader
+from homeassistant.components import recorder
+from homeassistant.helpers import entity, recorder as recorder_helper
+from homeassistant.setup import async_setup_component
+
+
+async def _async_benchmark(
+    db_url: str | None, bulk_write: bool, entities: int, updates: int
+) -> float:
+    """Record the state changes and return the rows written per second."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = core.HomeAssistant(config_dir)
+        hass.config.skip_pip = True
+        loader.async_setup(hass)
+        entity.async_setup(hass)
+        hass.config_entries = config_entries.ConfigEntries(hass, {})
+        await hass.config_entries.async_initialize()
+        recorder_helper.async_initialize_recorder(hass)
+        config = {
+            recorder.CONF_DB_URL: db_url
+            or f"sqlite:///{Path(config_dir, 'benchmark.db')}",
+            recorder.CONF_BULK_WRITE: bulk_write,
+            recorder.CONF_COMMIT_INTERVAL: 5,
+        }
+        assert await async_setup_component(hass, recorder.DOMAIN, {"recorder": config})
+        await hass.async_start()
+        instance = recorder.get_instance(hass)
+        await instance.async_recorder_ready.wait()
+
+        start = timer()
+        for update in range(updates):
+            for idx in range(entities):
+                hass.states.async_set(
+                    f"sensor.power_{idx}",
+                    str(update),
+                    {"unit_of_measurement": "W", "friendly_name": f"Power {idx}"},
+                )
+        instance.queue_task(recorder.tasks.CommitTask())
+        await hass.async_add_executor_job(instance.block_till_done)
+        runtime = timer() - start
+
+        await hass.async_stop()
+        return entities * updates / runtime
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--db-url", help="Database to benchmark (default: SQLite)")
+    parser.add_argument("--entities", type=int, default=300)
+    parser.add_argument("--updates", type=int, default=100)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    results = {
+        bulk_write: asyncio.run(
+            _async_benchmark(args.db_url, bulk_write, args.entities, args.updates)
+        )
+        for bulk_write in (False, True)
+    }
+    print(f"ORM writes:  {results[False]:.0f} rows/s")
+    print(f"Bulk writes: {results[True]:.0f} rows/s")
+    print(f"Gain:        {results[True] / results[False]:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""Benchmark serving HLS segments and parts to concurrent viewers.
+
+Fills the HLS output of a number of cameras with a synthetic stream and
+reports the requests per second served to the viewers, with the parts of
+complete segments sharing one buffer and with the segment data joined on
+each request.
+"""
+import argparse
+import asyncio
+import logging
+import os
+import tempfile
+from timeit import default_timer as timer
+
+import aiohttp
+
+from homeassistant import auth, config_entries, core, loader
+from homeassistant.components.camera import DynamicStreamSettings
+from homeassistant.components.stream import create_stream
+from homeassistant.components.stream.const import HLS_PROVIDER
+from homeassistant.components.stream.core import Part, Segment
+from homeassistant.helpers import (
+    area_registry as ar,
+    device_registry as dr,
+    entity,
+    entity_registry as er,
+)
+from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
+
+PART_DURATION = 1.0
+
+
+async def _async_no_worker() -> None:
+    """Keep the synthetic streams from starting a worker."""
+
+
+def _add_segments(
+    stream_output: object, segments: int, parts: int, part_size: int, shared: bool
+) -> None:
+    """Put complete segments of random data to a stream output."""
+    for sequence in range(segments):
+        segment = Segment(
+            sequence=sequence,
+            init=os.urandom(1024),
+            stream_id=0,
+            start_time=dt_util.utcnow(),
+            stream_outputs=[stream_output],
+        )
+        part_data = [os.urandom(part_size) for _ in range(parts)]
+        for part_num, data in enumerate(part_data):
+            last_part = part_num == parts - 1
+            segment.async_add_part(
+                Part(duration=PART_DURATION, has_keyframe=not part_num, data=data),
+                PART_DURATION * parts if last_part else 0,
+                b"".join(part_data) if shared and last_part else None,
+            )
+
+
+async def _async_view(
+    session: aiohttp.ClientSession, urls: list[str], rounds: int
+) -> int:
+    """Fetch the urls like a viewer and return the number of requests."""
+    for _ in range(rounds):
+        for url in urls:
+            async with session.get(url) as response:
+                assert response.status == 200
+                await response.read()
+    return len(urls) * rounds
+
+
+async def _async_benchmark(args: argparse.Namespace, shared: bool) -> float:
+    """Serve the viewers and return the requests served per second."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = core.HomeAssistant(config_dir)
+        hass.config.skip_pip = True
+        loader.async_setup(hass)
+        entity.async_setup(hass)
+        hass.config_entries = config_entries.ConfigEntries(hass, {})
+        await hass.config_entries.async_initialize()
+        hass.auth = await auth.auth_manager_from_config(hass, [], [])
+        await ar.async_load(hass)
+        await dr.async_load(hass)
+        await er.async_load(hass)
+        assert await async_setup_component(
+            hass,
+            "http",
+            {"http": {"server_host": "127.0.0.1", "server_port": args.port}},
+        )
+        assert await async_setup_component(hass, "stream", {})
+        await hass.async_start()
+
+        base_url = f"http://127.0.0.1:{args.port}"
+        viewer_urls = []
+        for camera in range(args.cameras):
+            stream = create_stream(
+                hass, f"synthetic://{camera}", {}, DynamicStreamSettings()
+            )
+            stream.start = _async_no_worker  # type: ignore[method-assign]
+            _add_segments(
+                stream.add_provider(HLS_PROVIDER),
+                args.segments,
+                args.parts,
+                args.part_size,
+                shared,
+            )
+            await hass.async_block_till_done()
+            # Creates the access token of the stream
+            stream.endpoint_url(HLS_PROVIDER)
+            segment_url = f"{base_url}/api/hls/{stream.access_token}/segment"
+            viewer_urls.append(
+                [
+                    url
+                    for sequence in range(args.segments)
+                    for url in (
+                        f"{segment_url}/{sequence}.m4s",
+                        *(
+                            f"{segment_url}/{sequence}.{part_num}.m4s"
+                            for part_num in range(args.parts)
+                        ),
+                    )
+                ]
+            )
+
+        async with aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=0)
+        ) as session:
+            start = timer()
+            requests = sum(
+                await asyncio.gather(
+                    *(
+                        _async_view(session, urls, args.rounds)
+                        for urls in viewer_urls
+                        for _ in range(args.viewers)
+                    )
+                )
+            )
+            runtime = timer() - start
+
+        await hass.async_stop()
+        return requests / runtime
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--port", type=int, default=18123)
+    parser.add_argument("--cameras", type=int, default=8)
+    parser.add_argument("--viewers", type=int, default=4, help="Viewers per camera")
+    parser.add_argument("--segments", type=int, default=3)
+    parser.add_argument("--parts", type=int, default=4, help="Parts per segment")
+    parser.add_argument("--part-size", type=int, default=256 * 1024)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    results = {
+        shared: asyncio.run(_async_benchmark(args, shared)) for shared in (False, True)
+    }
+    print(f"Joined segments: {results[False]:.0f} requests/s")
+    print(f"Shared buffer:   {results[True]:.0f} requests/s")
+    print(f"Gain:            {results[True] / results[False]:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
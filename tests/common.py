@@ -13,6 +13,7 @@ import json
 import logging
 import os
 import pathlib
+import tempfile
 import threading
 import time
 from typing import Any, NoReturn
@@ -142,6 +143,20 @@ def get_test_config_dir(*add_path):
     return os.path.join(os.path.dirname(__file__), "testing_config", *add_path)
 
 
+class TemporaryDirStore(storage.Store):
+    """Store which keeps its file in a temporary directory."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the store and its temporary directory."""
+        super().__init__(*args, **kwargs)
+        self._temp_dir = tempfile.TemporaryDirectory(prefix="hass_storage_")
+
+    @property
+    def path(self) -> str:
+        """Return the path in the temporary directory."""
+        return os.path.join(self._temp_dir.name, self.key)
+
+
 def get_test_home_assistant():
     """Return a Home Assistant object pointing at test config directory."""
     loop = asyncio.new_event_loop()
@@ -256,7 +271,9 @@ async def async_test_home_assistant(event_loop, load_registries=True):
 
     # Load the registries
     entity.async_setup(hass)
-    loader.async_setup(hass)
+    # Cache manifests in a temporary directory instead of the test configuration
+    with patch("homeassistant.helpers.storage.Store", TemporaryDirStore):
+        loader.async_setup(hass)
     if load_registries:
         with patch(
             "homeassistant.helpers.storage.Store.async_load", return_value=None
@@ -577,7 +594,7 @@ def mock_device_registry(
     fixture instead.
     """
     registry = dr.DeviceRegistry(hass)
-    registry.devices = dr.DeviceRegistryItems()
+    registry.devices = dr.ActiveDeviceRegistryItems()
     registry._device_data = registry.devices.data
     if mock_entries is None:
         mock_entries = {}
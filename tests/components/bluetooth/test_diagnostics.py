@@ -160,6 +160,7 @@ async def test_diagnostics(
                     "sources": {},
                     "timings": {},
                 },
+                "advertisement_deduplication": {},
                 "connectable_history": [],
                 "all_history": [],
                 "scanners": [
@@ -331,6 +332,9 @@ async def test_diagnostics_macos(
                     "sources": {"44:44:33:11:23:45": "local"},
                     "timings": {"44:44:33:11:23:45": [ANY]},
                 },
+                "advertisement_deduplication": {
+                    "local": {"duplicate": 0, "forwarded": 1},
+                },
                 "connectable_history": [
                     {
                         "address": "44:44:33:11:23:45",
@@ -523,6 +527,9 @@ async def test_diagnostics_remote_adapter(
                     "sources": {"44:44:33:11:23:45": "esp32"},
                     "timings": {"44:44:33:11:23:45": [ANY]},
                 },
+                "advertisement_deduplication": {
+                    "esp32": {"duplicate": 0, "forwarded": 1},
+                },
                 "all_history": [
                     {
                         "address": "44:44:33:11:23:45",
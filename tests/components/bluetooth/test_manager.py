@@ -311,6 +311,76 @@ async def test_switching_adapters_based_on_stale(
     )
 
 
+async def test_duplicate_advertisements_from_rejected_source(
+    hass: HomeAssistant,
+    enable_bluetooth: None,
+    register_hci0_scanner: None,
+    register_hci1_scanner: None,
+) -> None:
+    """Test unchanged advertisements from a rejected source are dropped."""
+
+    address = "44:44:33:11:23:41"
+    start_time_monotonic = 50.0
+    manager = _get_manager()
+
+    switchbot_device_hci0 = generate_ble_device(address, "wohand")
+    switchbot_device_hci1 = generate_ble_device(address, "wohand")
+    switchbot_adv_hci0 = generate_advertisement_data(
+        local_name="wohand", service_uuids=[], rssi=-60
+    )
+    switchbot_adv_poor_signal_hci1 = generate_advertisement_data(
+        local_name="wohand", service_uuids=[], rssi=-90
+    )
+    switchbot_adv_good_signal_hci1 = generate_advertisement_data(
+        local_name="wohand", service_uuids=[], rssi=-40
+    )
+
+    for offset, device, adv, source in (
+        (0, switchbot_device_hci0, switchbot_adv_hci0, "hci0"),
+        (0.5, switchbot_device_hci1, switchbot_adv_poor_signal_hci1, "hci1"),
+        (1, switchbot_device_hci0, switchbot_adv_hci0, "hci0"),
+        (1.5, switchbot_device_hci1, switchbot_adv_good_signal_hci1, "hci1"),
+    ):
+        inject_advertisement_with_time_and_source_connectable(
+            hass, device, adv, start_time_monotonic + offset, source, False
+        )
+
+    # The better signal from hci1 is not compared since the advertisement
+    # is unchanged and hci1 was rejected a moment ago
+    assert (
+        bluetooth.async_ble_device_from_address(hass, address, False)
+        is switchbot_device_hci0
+    )
+
+    # Once the window passed the advertisement from hci1 is compared again
+    inject_advertisement_with_time_and_source_connectable(
+        hass,
+        switchbot_device_hci0,
+        switchbot_adv_hci0,
+        start_time_monotonic + 6,
+        "hci0",
+        False,
+    )
+    inject_advertisement_with_time_and_source_connectable(
+        hass,
+        switchbot_device_hci1,
+        switchbot_adv_good_signal_hci1,
+        start_time_monotonic + 6.5,
+        "hci1",
+        False,
+    )
+    assert (
+        bluetooth.async_ble_device_from_address(hass, address, False)
+        is switchbot_device_hci1
+    )
+
+    diagnostics = await manager.async_diagnostics()
+    assert diagnostics["advertisement_deduplication"] == {
+        "hci0": {"duplicate": 2, "forwarded": 1},
+        "hci1": {"duplicate": 2, "forwarded": 0},
+    }
+
+
 async def test_restore_history_from_dbus(
     hass: HomeAssistant, one_adapter: None, disable_new_discovery_flows
 ) -> None:
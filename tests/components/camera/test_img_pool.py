@@ -0,0 +1,62 @@
+"""Test the camera image pool."""
+from unittest.mock import Mock
+
+import pytest
+
+from homeassistant.components.camera.img_pool import (
+    DATA_IMAGE_POOL,
+    async_run_image_job,
+    async_set_image_pool_workers,
+)
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+
+
+def _reverse(image: memoryview, suffix: bytes) -> bytes:
+    """Reverse an image."""
+    return bytes(image[::-1]) + suffix
+
+
+def _exit(image: memoryview) -> None:
+    """Stop the pool process."""
+    import os  # pylint: disable=import-outside-toplevel
+
+    os._exit(1)
+
+
+async def test_run_image_job(hass: HomeAssistant) -> None:
+    """Test running jobs in the pool processes."""
+    async_set_image_pool_workers(hass, 1)
+    assert await async_run_image_job(hass, _reverse, b"image", b"!") == b"egami!"
+    assert await async_run_image_job(hass, _reverse, b"", b"!") == b"!"
+
+    with pytest.raises(HomeAssistantError):
+        await async_run_image_job(hass, _exit, b"image")
+    # New processes are started after a process stopped
+    assert await async_run_image_job(hass, _reverse, b"image", b"") == b"egami"
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    await hass.async_block_till_done()
+    assert hass.data[DATA_IMAGE_POOL]._executor is None
+
+
+async def test_run_image_job_in_executor(hass: HomeAssistant) -> None:
+    """Test running jobs in the executor without pool processes."""
+    assert await async_run_image_job(hass, _reverse, b"image", b"!") == b"egami!"
+    assert hass.data[DATA_IMAGE_POOL]._executor is None
+
+
+async def test_set_image_pool_workers(hass: HomeAssistant) -> None:
+    """Test the number of pool processes is only raised."""
+    async_set_image_pool_workers(hass, 2)
+    async_set_image_pool_workers(hass, 1)
+    image_pool = hass.data[DATA_IMAGE_POOL]
+    assert image_pool.max_workers == 2
+
+    # More processes start a new pool
+    image_pool._executor = executor = Mock()
+    async_set_image_pool_workers(hass, 3)
+    assert image_pool.max_workers == 3
+    assert image_pool._executor is None
+    executor.shutdown.assert_called_once_with(wait=False)
@@ -307,6 +307,31 @@ async def test_dhcp_match_macaddress(hass: HomeAssistant) -> None:
     )
 
 
+async def test_dhcp_match_macaddress_patterns(hass: HomeAssistant) -> None:
+    """Test matching macaddress patterns with and without a fixed OUI."""
+    integration_matchers = [
+        {"domain": "mock-domain", "macaddress": "B8B7F16*"},
+        {"domain": "mock-domain-2", "macaddress": "B8B7F1A*"},
+        {"domain": "mock-domain-3", "macaddress": "B8B7F?6D*"},
+        {"domain": "mock-domain-4", "macaddress": "*DB533"},
+        {"domain": "mock-domain-5", "macaddress": "B8B7F2*"},
+    ]
+
+    packet = Ether(RAW_DHCP_REQUEST)
+
+    async_handle_dhcp_packet = await _async_get_handle_dhcp_packet(
+        hass, integration_matchers
+    )
+    with patch.object(hass.config_entries.flow, "async_init") as mock_init:
+        await async_handle_dhcp_packet(packet)
+
+    assert sorted(call[1][0] for call in mock_init.mock_calls) == [
+        "mock-domain",
+        "mock-domain-3",
+        "mock-domain-4",
+    ]
+
+
 async def test_dhcp_multiple_match_only_one_flow(hass: HomeAssistant) -> None:
     """Test matching the domain multiple times only generates one flow."""
     integration_matchers = [
@@ -0,0 +1,184 @@
+"""The tests for the history cache."""
+from datetime import timedelta
+from itertools import product
+from unittest.mock import patch
+
+from freezegun.api import FrozenDateTimeFactory
+
+from homeassistant.components import history
+from homeassistant.components.history.cache import async_get_history_cache
+from homeassistant.components.recorder import Recorder, get_instance
+from homeassistant.components.recorder.history import get_significant_states
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
+
+from tests.components.recorder.common import async_wait_recording_done
+from tests.typing import WebSocketGenerator
+
+
+async def test_history_cache_matches_database(
+    recorder_mock: Recorder, hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the cache returns the same history as the database."""
+    assert await async_setup_component(
+        hass, history.DOMAIN, {history.DOMAIN: {"cache": {}}}
+    )
+    start = dt_util.utcnow()
+    changes = [
+        ("sensor.power", "1", {"unit_of_measurement": "W", "supported_features": 1}),
+        ("light.kitchen", "on", {"brightness": 100}),
+        ("climate.living_room", "heat", {"temperature": 20}),
+        ("sensor.power", "1", {"unit_of_measurement": "W", "changed": True}),
+        ("light.kitchen", "on", {"brightness": 50}),
+        ("sensor.power", "2", {"unit_of_measurement": "W"}),
+        ("climate.living_room", "heat", {"temperature": 21}),
+        ("light.kitchen", "off", {}),
+        ("sensor.power", "2", {"unit_of_measurement": "W", "changed": False}),
+        ("sensor.power", "3", {"unit_of_measurement": "W"}),
+        ("light.kitchen", "on", {"brightness": 10}),
+    ]
+    for entity_id, state, attributes in changes:
+        freezer.tick(timedelta(seconds=10))
+        hass.states.async_set(entity_id, state, attributes)
+    await async_wait_recording_done(hass)
+
+    cache = async_get_history_cache(hass)
+    entity_ids = ["sensor.power", "light.kitchen", "climate.living_room"]
+    for (
+        offset,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+    ) in product((35, 55, 75), *([(True, False)] * 4)):
+        start_time = start + timedelta(seconds=offset)
+        for end_time in (None, start_time + timedelta(seconds=40)):
+            cached = cache.async_get_history(
+                start_time, entity_ids, include_start_time_state
+            )
+            assert cached is not None
+            from_db = await get_instance(hass).async_add_executor_job(
+                get_significant_states,
+                hass,
+                start_time,
+                end_time,
+                entity_ids,
+                None,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+                True,
+            )
+            assert (
+                cached.compressed_states(
+                    start_time,
+                    end_time,
+                    include_start_time_state,
+                    significant_changes_only,
+                    minimal_response,
+                    no_attributes,
+                )
+                == from_db
+            )
+
+
+async def test_history_cache_coverage(
+    recorder_mock: Recorder, hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test requests the cache cannot answer are left to the database."""
+    assert await async_setup_component(
+        hass,
+        history.DOMAIN,
+        {
+            history.DOMAIN: {
+                "cache": {"window": {"minutes": 1}, "max_states": 5},
+            }
+        },
+    )
+    start = dt_util.utcnow()
+    cache = async_get_history_cache(hass)
+
+    for idx in range(6):
+        freezer.tick(timedelta(seconds=20))
+        hass.states.async_set("sensor.one", str(idx))
+    # The window keeps the last state before the cutoff
+    cached = cache.async_get_history(
+        start + timedelta(seconds=70), ["sensor.one"], True
+    )
+    assert [state.state for state in cached.states["sensor.one"]] == [
+        "2",
+        "3",
+        "4",
+        "5",
+    ]
+    assert (
+        cache.async_get_history(start + timedelta(seconds=60), ["sensor.one"], True)
+        is None
+    )
+    assert cache.async_get_history(start, ["sensor.unknown"], True) is None
+    assert cache.async_get_history(start, [], True) is None
+
+    freezer.tick(timedelta(seconds=1))
+    hass.states.async_set("sensor.two", "a")
+    freezer.tick(timedelta(seconds=1))
+    hass.states.async_set("sensor.two", "b")
+    # The budget evicts the oldest states first
+    cached = cache.async_get_history(
+        dt_util.utcnow(), ["sensor.one", "sensor.two"], True
+    )
+    assert [state.state for state in cached.states["sensor.one"]] == ["3", "4", "5"]
+    assert [state.state for state in cached.states["sensor.two"]] == ["a", "b"]
+
+    hass.states.async_remove("sensor.two")
+    assert cache.async_get_history(dt_util.utcnow(), ["sensor.two"], True) is None
+    assert cache.hits == 2
+    assert cache.misses == 3
+
+
+async def test_history_stream_served_from_cache(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the history stream does not query the database when cached."""
+    assert await async_setup_component(
+        hass, history.DOMAIN, {history.DOMAIN: {"cache": {}}}
+    )
+    start = dt_util.utcnow()
+    freezer.tick(timedelta(seconds=1))
+    hass.states.async_set("sensor.test", "on")
+    freezer.tick(timedelta(seconds=1))
+    hass.states.async_set("sensor.test", "off")
+    await async_wait_recording_done(hass)
+    freezer.tick(timedelta(seconds=1))
+
+    client = await hass_ws_client()
+    with patch(
+        "homeassistant.components.history.websocket_api.history.get_significant_states",
+        side_effect=AssertionError,
+    ):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/stream",
+                "entity_ids": ["sensor.test"],
+                "start_time": (start + timedelta(seconds=1.5)).isoformat(),
+                "include_start_time_state": True,
+                "significant_changes_only": False,
+                "no_attributes": True,
+                "minimal_response": True,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        response = await client.receive_json()
+
+    assert response["event"]["states"] == {
+        "sensor.test": [
+            {"s": "on", "lu": dt_util.utc_to_timestamp(start) + 1.5},
+            {"s": "off", "lu": dt_util.utc_to_timestamp(start) + 2},
+        ]
+    }
@@ -78,6 +78,24 @@ async def test_setup_component_with_service(hass: HomeAssistant) -> None:
     assert hass.services.has_service(ip.DOMAIN, "scan")
 
 
+async def test_setup_component_with_image_pool_workers(hass: HomeAssistant) -> None:
+    """Set up the image pool processes from the platform configuration."""
+    config = {
+        ip.DOMAIN: [
+            {"platform": "demo", ip.CONF_IMAGE_POOL_WORKERS: 2},
+            {"platform": "demo", ip.CONF_IMAGE_POOL_WORKERS: 1},
+        ]
+    }
+
+    with patch(
+        "homeassistant.components.image_processing.async_set_image_pool_workers"
+    ) as mock_set_workers:
+        assert await async_setup_component(hass, ip.DOMAIN, config)
+        await hass.async_block_till_done()
+
+    mock_set_workers.assert_called_once_with(hass, 2)
+
+
 @patch(
     "homeassistant.components.demo.camera.Path.read_bytes",
     return_value=b"Test",
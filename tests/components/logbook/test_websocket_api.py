@@ -5,12 +5,14 @@ from datetime import timedelta
 from unittest.mock import ANY, patch
 
 from freezegun import freeze_time
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant import core
 from homeassistant.components import logbook, recorder
 from homeassistant.components.automation import ATTR_SOURCE, EVENT_AUTOMATION_TRIGGERED
 from homeassistant.components.logbook import websocket_api
+from homeassistant.components.logbook.processor import EventProcessor
 from homeassistant.components.recorder import Recorder
 from homeassistant.components.recorder.util import get_instance
 from homeassistant.components.script import EVENT_SCRIPT_STARTED
@@ -384,6 +386,96 @@ async def test_get_events_future_start_time(
     assert len(results) == 0
 
 
+async def test_get_events_cached(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test get_events only queries the events after the cached entries."""
+    await async_setup_component(hass, "logbook", {})
+    await async_recorder_block_till_done(hass)
+    cache = hass.data[logbook.DOMAIN].cache
+    hass.states.async_set("light.kitchen", STATE_OFF)
+    hass.states.async_set("light.hallway", STATE_OFF)
+    freezer.tick(timedelta(seconds=1))
+    start = dt_util.utcnow()
+
+    context = core.Context(id="01GTDGKBCH00GW0X276W5TEDDD")
+    freezer.tick(timedelta(seconds=1))
+    hass.states.async_set("light.kitchen", STATE_ON, context=context)
+    hass.states.async_set("light.hallway", STATE_ON, context=context)
+    freezer.tick(timedelta(seconds=1))
+    hass.states.async_set("light.kitchen", STATE_OFF)
+    await async_wait_recording_done(hass)
+    freezer.tick(timedelta(minutes=1))
+
+    client = await hass_ws_client()
+    # Entries are only cached without a recorder backlog
+    await async_wait_recording_done(hass)
+    msg_id = 0
+
+    async def _get_events(end_time=None) -> list[dict]:
+        nonlocal msg_id
+        msg_id += 1
+        msg = {
+            "id": msg_id,
+            "type": "logbook/get_events",
+            "start_time": start.isoformat(),
+        }
+        if end_time:
+            msg["end_time"] = end_time.isoformat()
+        await client.send_json(msg)
+        response = await client.receive_json()
+        assert response["success"]
+        return response["result"]
+
+    results = await _get_events()
+    assert [(entry["entity_id"], entry["state"]) for entry in results] == [
+        ("light.kitchen", STATE_ON),
+        ("light.hallway", STATE_ON),
+        ("light.kitchen", STATE_OFF),
+    ]
+    assert cache.misses == 1
+
+    freezer.tick(timedelta(seconds=1))
+    hass.states.async_set("light.hallway", STATE_OFF, context=context)
+    await async_wait_recording_done(hass)
+    freezer.tick(timedelta(minutes=1))
+
+    # Only the new state change is queried and the context started before it
+    # is known from the previous request
+    with patch.object(
+        EventProcessor,
+        "_get_events",
+        autospec=True,
+        side_effect=EventProcessor._get_events,
+    ) as get_events_mock:
+        results = await _get_events()
+    assert get_events_mock.call_args[0][1] > start + timedelta(seconds=2)
+    assert [(entry["entity_id"], entry["state"]) for entry in results] == [
+        ("light.kitchen", STATE_ON),
+        ("light.hallway", STATE_ON),
+        ("light.kitchen", STATE_OFF),
+        ("light.hallway", STATE_OFF),
+    ]
+    assert results[-1]["context_entity_id"] == "light.kitchen"
+    assert cache.hits == 1
+
+    # Requests ending before the cached entries do not query
+    with patch.object(EventProcessor, "_get_events", side_effect=AssertionError):
+        assert await _get_events(start + timedelta(seconds=2)) == results[:2]
+
+    # Changes to the entity registry clear the cache
+    hass.bus.async_fire(
+        er.EVENT_ENTITY_REGISTRY_UPDATED,
+        {"action": "update", "entity_id": "light.kitchen", "changes": {}},
+    )
+    await hass.async_block_till_done()
+    assert await _get_events() == results
+    assert cache.misses == 2
+
+
 async def test_get_events_bad_start_time(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -13,7 +13,11 @@ import voluptuous as vol
 
 from homeassistant.components import mqtt
 from homeassistant.components.mqtt import debug_info
-from homeassistant.components.mqtt.client import EnsureJobAfterCooldown
+from homeassistant.components.mqtt.client import (
+    EnsureJobAfterCooldown,
+    Subscription,
+    SubscriptionTrie,
+)
 from homeassistant.components.mqtt.mixins import MQTT_ENTITY_DEVICE_INFO_SCHEMA
 from homeassistant.components.mqtt.models import MessageCallbackType, ReceiveMessage
 from homeassistant.config_entries import ConfigEntryDisabler, ConfigEntryState
@@ -782,6 +786,66 @@ def test_validate_publish_topic() -> None:
     mqtt.valid_publish_topic("$SYS/")
 
 
+@pytest.mark.parametrize(
+    ("topic", "expected"),
+    [
+        (
+            "home/kitchen/temp",
+            {"home/+/temp", "home/#", "#", "+/kitchen/+", "home/kitchen/#"},
+        ),
+        ("home/kitchen", {"home/#", "#", "home/kitchen/#"}),
+        ("home", {"home/#", "#"}),
+        ("home/kitchen/temp/raw", {"home/#", "#", "home/kitchen/#"}),
+        ("$SYS/broker", {"$SYS/#"}),
+        ("other", {"#"}),
+    ],
+)
+def test_subscription_trie_match(topic: str, expected: set[str]) -> None:
+    """Test matching topics against wildcard subscriptions."""
+    trie = SubscriptionTrie()
+    for topic_filter in (
+        "home/+/temp",
+        "home/#",
+        "#",
+        "+/kitchen/+",
+        "home/kitchen/#",
+        "$SYS/#",
+    ):
+        trie.add(Subscription(topic_filter, ha.HassJob(lambda msg: None)))
+
+    assert {subscription.topic for subscription in trie.match(topic)} == expected
+
+
+def test_subscription_trie_add_remove() -> None:
+    """Test the subscription trie is updated in place."""
+    trie = SubscriptionTrie()
+    first = Subscription("home/+/temp", ha.HassJob(lambda msg: None))
+    second = Subscription("home/+/temp", ha.HassJob(lambda msg: None))
+    third = Subscription("home/#", ha.HassJob(lambda msg: None))
+    trie.add(first)
+    trie.add(second)
+    trie.add(third)
+
+    assert len(trie) == 3
+    assert set(trie) == {first, second, third}
+    assert trie.has_topic("home/+/temp")
+    assert not trie.has_topic("home/+")
+    assert trie.match("home/kitchen/temp") == [third, first, second]
+
+    trie.remove(first)
+    assert trie.match("home/kitchen/temp") == [third, second]
+    trie.remove(second)
+    assert not trie.has_topic("home/+/temp")
+    assert trie.match("home/kitchen/temp") == [third]
+
+    with pytest.raises(KeyError):
+        trie.remove(second)
+
+    trie.remove(third)
+    assert len(trie) == 0
+    assert trie.match("home/kitchen/temp") == []
+
+
 def test_entity_device_info_schema() -> None:
     """Test MQTT entity device info validation."""
     # just identifier
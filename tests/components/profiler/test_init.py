@@ -3,6 +3,8 @@ from datetime import timedelta
 from functools import lru_cache
 import os
 from pathlib import Path
+import time
+from typing import Any
 from unittest.mock import patch
 
 from lru import LRU  # pylint: disable=no-name-in-module
@@ -18,18 +20,21 @@ from homeassistant.components.profiler import (
     SERVICE_LRU_STATS,
     SERVICE_MEMORY,
     SERVICE_START,
+    SERVICE_START_JOB_TIMING,
     SERVICE_START_LOG_OBJECT_SOURCES,
     SERVICE_START_LOG_OBJECTS,
+    SERVICE_STOP_JOB_TIMING,
     SERVICE_STOP_LOG_OBJECT_SOURCES,
     SERVICE_STOP_LOG_OBJECTS,
 )
 from homeassistant.components.profiler.const import DOMAIN
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HassJob, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.util.dt as dt_util
 
 from tests.common import MockConfigEntry, async_fire_time_changed
+from tests.typing import WebSocketGenerator
 
 
 async def test_basic_usage(hass: HomeAssistant, tmp_path: Path) -> None:
@@ -367,3 +372,84 @@ async def test_log_object_sources(
         await hass.services.async_call(
             DOMAIN, SERVICE_STOP_LOG_OBJECT_SOURCES, {}, blocking=True
         )
+
+
+async def test_job_timing(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test timing the callback jobs."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.profiler_sampled_jobs").state == "unavailable"
+
+    @callback
+    def _fast_job(*_: Any) -> None:
+        """Return right away."""
+
+    @callback
+    def _slow_job(*_: Any) -> None:
+        """Block the event loop."""
+        time.sleep(0.02)
+
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_START_JOB_TIMING,
+        {"sample_interval": 1, "slow_job_time": 0.01},
+        blocking=True,
+    )
+    with pytest.raises(HomeAssistantError, match="Job timing already started"):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_START_JOB_TIMING, {}, blocking=True
+        )
+
+    fast_job = HassJob(_fast_job)
+    for _ in range(3):
+        hass.async_run_hass_job(fast_job)
+    hass.bus.async_listen("test_event", _slow_job, run_immediately=True)
+    hass.bus.async_fire("test_event")
+    await hass.async_block_till_done()
+    assert "test_job_timing.<locals>._slow_job from integration core" in caplog.text
+
+    client = await hass_ws_client()
+    await client.send_json({"id": 1, "type": "profiler/job_timing", "limit": 1})
+    response = await client.receive_json()
+    assert response["success"]
+    result = response["result"]
+    assert result["running"] is True
+    assert result["slow"] == 1
+    # The jobs with the most time come first
+    jobs = result["jobs"]
+    assert list(jobs) == [f"{__name__}.test_job_timing.<locals>._slow_job"]
+    slow_job = jobs[f"{__name__}.test_job_timing.<locals>._slow_job"]
+    assert slow_job["integration"] is None
+    assert slow_job["slow"] == 1
+    assert slow_job["max"] >= 0.02
+
+    await client.send_json({"id": 2, "type": "profiler/job_timing"})
+    response = await client.receive_json()
+    fast_job = response["result"]["jobs"][
+        f"{__name__}.test_job_timing.<locals>._fast_job"
+    ]
+    assert fast_job["count"] == 3
+    assert fast_job["slow"] == 0
+    assert sum(fast_job["histogram"]) == 3
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=31))
+    await hass.async_block_till_done()
+    assert float(hass.states.get("sensor.profiler_slowest_job").state) >= 0.02
+    assert hass.states.get("sensor.profiler_slow_jobs").state == "1"
+
+    await hass.services.async_call(DOMAIN, SERVICE_STOP_JOB_TIMING, {}, blocking=True)
+    assert hass.job_runner is None
+    with pytest.raises(HomeAssistantError, match="Job timing not running"):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_STOP_JOB_TIMING, {}, blocking=True
+        )
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
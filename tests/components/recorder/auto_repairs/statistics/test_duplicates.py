@@ -23,7 +23,7 @@ from homeassistant.helpers import recorder as recorder_helper
 from homeassistant.setup import setup_component
 import homeassistant.util.dt as dt_util
 
-from ...common import wait_recording_done
+from ...common import is_read_only_url, wait_recording_done
 
 from tests.common import get_test_home_assistant
 
@@ -112,6 +112,8 @@ def _create_engine_28(*args, **kwargs):
     importlib.import_module(module)
     old_db_schema = sys.modules[module]
     engine = create_engine(*args, **kwargs)
+    if is_read_only_url(args[0]):
+        return engine
     old_db_schema.Base.metadata.create_all(engine)
     with Session(engine) as session:
         session.add(
@@ -15,6 +15,7 @@ from unittest.mock import patch, sentinel
 
 from freezegun import freeze_time
 from sqlalchemy import create_engine
+from sqlalchemy.engine import URL, make_url
 from sqlalchemy.orm.session import Session
 
 from homeassistant import core as ha
@@ -134,12 +135,19 @@ def corrupt_db_file(test_db_file):
         fhandle.write("I am a corrupt db" * 100)
 
 
+def is_read_only_url(url: str | URL) -> bool:
+    """Return if the url is for the read pool, which must not create tables."""
+    return make_url(url).query.get("mode") == "ro"
+
+
 def create_engine_test(*args, **kwargs):
     """Test version of create_engine that initializes with old schema.
 
     This simulates an existing db with the old schema.
     """
     engine = create_engine(*args, **kwargs)
+    if is_read_only_url(args[0]):
+        return engine
     db_schema_0.Base.metadata.create_all(engine)
     return engine
 
@@ -382,6 +390,8 @@ def create_engine_test_for_schema_version_postfix(
     importlib.import_module(schema_module)
     old_db_schema = sys.modules[schema_module]
     engine = create_engine(*args, **kwargs)
+    if is_read_only_url(args[0]):
+        return engine
     old_db_schema.Base.metadata.create_all(engine)
     with Session(engine) as session:
         session.add(
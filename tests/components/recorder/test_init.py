@@ -37,6 +37,11 @@ from homeassistant.components.recorder.const import (
     KEEPALIVE_TIME,
     SupportedDialect,
 )
+from homeassistant.components.recorder.core import (
+    MAX_DB_EXECUTOR_WORKERS,
+    MAX_READ_POOL_WORKERS,
+    MIN_READ_POOL_WORKERS,
+)
 from homeassistant.components.recorder.db_schema import (
     SCHEMA_VERSION,
     EventData,
@@ -123,6 +128,80 @@ def _default_recorder(hass):
     )
 
 
+async def test_read_pool(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    tmp_path: Path,
+) -> None:
+    """Test read only sessions in the database executor use the read pool."""
+    db_url = "sqlite:///" + str(tmp_path / "pytest.db")
+    instance = await async_setup_recorder_instance(
+        hass,
+        {
+            recorder.CONF_DB_URL: db_url,
+            recorder.CONF_DB_READ_URL: db_url,
+            recorder.CONF_COMMIT_INTERVAL: 0,
+        },
+    )
+    hass.states.async_set("sensor.test", "on")
+    await async_wait_recording_done(hass)
+
+    # The recorder database file is opened read-only
+    assert instance.read_engine is not None
+    assert instance.read_engine.url.database == f"file:{tmp_path}/pytest.db"
+    assert instance.read_engine.url.query == {"mode": "ro", "uri": "true"}
+
+    def _query_states() -> tuple[bool, bool, list[str]]:
+        with session_scope(hass=hass, read_only=True) as session:
+            read_bind = session.get_bind() is instance.read_engine
+            states = [state.state for state in session.query(States)]
+        with session_scope(hass=hass) as session:
+            write_bind = session.get_bind() is instance.engine
+        return read_bind, write_bind, states
+
+    assert await instance.async_add_executor_job(_query_states) == (
+        True,
+        True,
+        ["on"],
+    )
+    # Outside of the database executor the write pool is used
+    with session_scope(hass=hass, read_only=True) as session:
+        assert session.get_bind() is instance.engine
+
+    # One database executor per CPU core reads from the read pool
+    with patch("homeassistant.components.recorder.core.os.cpu_count", return_value=1):
+        assert instance.db_executor_workers == MIN_READ_POOL_WORKERS
+    with patch("homeassistant.components.recorder.core.os.cpu_count", return_value=4):
+        assert instance.db_executor_workers == 4
+    with patch("homeassistant.components.recorder.core.os.cpu_count", return_value=64):
+        assert instance.db_executor_workers == MAX_READ_POOL_WORKERS
+
+    await hass.async_stop()
+    assert instance.read_engine is None
+
+
+async def test_no_read_pool_without_read_url(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    tmp_path: Path,
+) -> None:
+    """Test there is no read pool unless a read database is configured."""
+    db_url = "sqlite:///" + str(tmp_path / "pytest.db")
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_DB_URL: db_url, recorder.CONF_COMMIT_INTERVAL: 0}
+    )
+    await async_wait_recording_done(hass)
+
+    assert instance.read_engine is None
+    assert instance.db_executor_workers == MAX_DB_EXECUTOR_WORKERS
+
+    def _read_bind() -> bool:
+        with session_scope(hass=hass, read_only=True) as session:
+            return session.get_bind() is instance.engine
+
+    assert await instance.async_add_executor_job(_read_bind)
+
+
 async def test_shutdown_before_startup_finishes(
     async_setup_recorder_instance: RecorderInstanceGenerator,
     hass: HomeAssistant,
@@ -342,6 +421,69 @@ async def test_saving_many_states(
         assert db_states[0].event_id is None
 
 
+async def test_saving_states_with_bulk_write(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test states are linked correctly when written with multi-row inserts."""
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_BULK_WRITE: True}
+    )
+    assert instance._bulk_write_active is True
+
+    attributes = {"test_attr": 5, "test_attr_10": "nice"}
+    attributes2 = {"test_attr": 10, "test_attr_10": "mean"}
+
+    # All in one commit, so each old state is in the same batch
+    for state in ("1", "2", "3"):
+        hass.states.async_set("sensor.power", state, attributes)
+        hass.states.async_set("sensor.energy", state, attributes2)
+    hass.states.async_remove("sensor.energy")
+    await async_wait_recording_done(hass)
+
+    # The old state was written by the previous commit
+    hass.states.async_set("sensor.power", "4", attributes2)
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        db_states = list(
+            session.query(States, StateAttributes, StatesMeta)
+            .outerjoin(
+                StateAttributes, States.attributes_id == StateAttributes.attributes_id
+            )
+            .outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .order_by(States.state_id)
+        )
+
+    by_entity: dict[str, list[tuple[States, StateAttributes]]] = {}
+    for db_state, db_state_attributes, states_meta in db_states:
+        by_entity.setdefault(states_meta.entity_id, []).append(
+            (db_state, db_state_attributes)
+        )
+
+    power = by_entity["sensor.power"]
+    assert [db_state.state for db_state, _ in power] == ["1", "2", "3", "4"]
+    assert [db_state.old_state_id for db_state, _ in power] == [
+        None,
+        *(db_state.state_id for db_state, _ in power[:-1]),
+    ]
+    assert [json_loads(attrs.shared_attrs) for _, attrs in power] == [
+        attributes,
+        attributes,
+        attributes,
+        attributes2,
+    ]
+
+    energy = by_entity["sensor.energy"]
+    assert [db_state.state for db_state, _ in energy] == ["1", "2", "3", None]
+    assert [db_state.old_state_id for db_state, _ in energy] == [
+        None,
+        *(db_state.state_id for db_state, _ in energy[:-1]),
+    ]
+    assert {attrs.attributes_id for _, attrs in energy[:-1]} == {
+        power[-1][1].attributes_id
+    }
+
+
 async def test_saving_state_with_intermixed_time_changes(
     recorder_mock: Recorder, hass: HomeAssistant
 ) -> None:
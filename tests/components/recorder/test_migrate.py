@@ -32,7 +32,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers import recorder as recorder_helper
 import homeassistant.util.dt as dt_util
 
-from .common import async_wait_recording_done, create_engine_test
+from .common import async_wait_recording_done, create_engine_test, is_read_only_url
 
 from tests.common import async_fire_time_changed
 
@@ -322,6 +322,8 @@ async def test_schema_migrate(
         importlib.import_module(module)
         old_models = sys.modules[module]
         engine = create_engine(*args, **kwargs)
+        if is_read_only_url(args[0]):
+            return engine
         old_models.Base.metadata.create_all(engine)
         if start_version > 0:
             with Session(engine) as session:
@@ -30,7 +30,11 @@ from homeassistant.core import HomeAssistant
 import homeassistant.util.dt as dt_util
 from homeassistant.util.ulid import bytes_to_ulid, ulid_at_time, ulid_to_bytes
 
-from .common import async_recorder_block_till_done, async_wait_recording_done
+from .common import (
+    async_recorder_block_till_done,
+    async_wait_recording_done,
+    is_read_only_url,
+)
 
 from tests.typing import RecorderInstanceGenerator
 
@@ -47,6 +51,8 @@ def _create_engine_test(*args, **kwargs):
     importlib.import_module(SCHEMA_MODULE)
     old_db_schema = sys.modules[SCHEMA_MODULE]
     engine = create_engine(*args, **kwargs)
+    if is_read_only_url(args[0]):
+        return engine
     old_db_schema.Base.metadata.create_all(engine)
     with Session(engine) as session:
         session.add(
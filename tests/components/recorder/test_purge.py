@@ -2,6 +2,7 @@
 from datetime import datetime, timedelta
 import json
 import sqlite3
+from typing import Any
 from unittest.mock import patch
 
 from freezegun import freeze_time
@@ -26,7 +27,14 @@ from homeassistant.components.recorder.db_schema import (
     StatisticsShortTerm,
 )
 from homeassistant.components.recorder.history import get_significant_states
-from homeassistant.components.recorder.purge import purge_old_data
+from homeassistant.components.recorder.purge import (
+    DEFAULT_EVENTS_BATCHES_PER_PURGE,
+    purge_old_data,
+)
+from homeassistant.components.recorder.purge_scheduler import (
+    MAX_BATCHES_PER_PURGE,
+    STORAGE_KEY,
+)
 from homeassistant.components.recorder.queries import select_event_type_ids
 from homeassistant.components.recorder.services import (
     SERVICE_PURGE,
@@ -196,6 +204,72 @@ async def test_purge_old_states_encouters_database_corruption(
         assert states_after_purge.count() == 0
 
 
+async def test_purge_scheduler_progress(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+) -> None:
+    """Test the purge batches are sized to the time slice and progress is reported."""
+    instance = await async_setup_recorder_instance(hass)
+    await _add_test_states(hass)
+    scheduler = instance.purge_scheduler
+    scheduler.batches["states"] = 1
+    scheduler.time_slice = 1000
+    progress = []
+    unsub = scheduler.async_listen(progress.append)
+
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+    instance.queue_task(PurgeTask(purge_before, False, False))
+    await async_wait_purge_done(hass)
+    unsub()
+
+    assert [
+        (item["passes"], item["states_purged"], item["finished"]) for item in progress
+    ] == [(1, 4, False), (2, 4, True)]
+    assert progress[-1]["purge_before"] == purge_before
+    assert scheduler.async_progress() == progress[-1]
+    # The states batches took much less than the time slice
+    assert scheduler.batches == {
+        "states": MAX_BATCHES_PER_PURGE,
+        "events": DEFAULT_EVENTS_BATCHES_PER_PURGE,
+    }
+    # The purge is no longer saved once it is finished
+    await hass.async_block_till_done()
+    assert STORAGE_KEY not in hass_storage
+
+
+async def test_purge_resumed_after_restart(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+) -> None:
+    """Test a purge in progress is resumed when the recorder starts."""
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": STORAGE_KEY,
+        "data": {
+            "purge_before": purge_before.isoformat(),
+            "repack": False,
+            "apply_filter": True,
+        },
+    }
+    with patch(
+        "homeassistant.components.recorder.purge.purge_old_data", return_value=True
+    ) as purge_old_data, patch(
+        "homeassistant.components.recorder.tasks.periodic_db_cleanups"
+    ):
+        instance = await async_setup_recorder_instance(hass)
+        await async_wait_purge_done(hass)
+
+    assert len(purge_old_data.mock_calls) == 1
+    assert purge_old_data.mock_calls[0].args[1:] == (purge_before, False, True)
+    assert instance.purge_scheduler.resume is None
+    await hass.async_block_till_done()
+    assert STORAGE_KEY not in hass_storage
+
+
 async def test_purge_old_states_encounters_temporary_mysql_error(
     async_setup_recorder_instance: RecorderInstanceGenerator,
     hass: HomeAssistant,
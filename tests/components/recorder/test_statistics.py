@@ -1,6 +1,8 @@
 """The tests for sensor recorder platform."""
+from collections import namedtuple
 from collections.abc import Callable
 from datetime import timedelta
+from typing import Literal
 from unittest.mock import patch
 
 import pytest
@@ -8,8 +10,9 @@ from sqlalchemy import select
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder import Recorder, history, statistics
-from homeassistant.components.recorder.db_schema import StatisticsShortTerm
+from homeassistant.components.recorder.db_schema import Statistics, StatisticsShortTerm
 from homeassistant.components.recorder.models import (
+    StatisticMetaData,
     datetime_to_timestamp_or_none,
     process_timestamp,
 )
@@ -1462,14 +1465,22 @@ def test_weekly_statistics_sum(
 
 
 @pytest.mark.parametrize("timezone", ["America/Regina", "Europe/Vienna", "UTC"])
+@pytest.mark.parametrize(
+    ("columnar_min_rows", "has_numpy"), [(1000, True), (0, True), (0, False)]
+)
 @pytest.mark.freeze_time("2021-08-01 00:00:00+00:00")
 def test_monthly_statistics_sum(
     hass_recorder: Callable[..., HomeAssistant],
     caplog: pytest.LogCaptureFixture,
+    monkeypatch: pytest.MonkeyPatch,
     timezone,
+    columnar_min_rows: int,
+    has_numpy: bool,
 ) -> None:
-    """Test monthly statistics."""
+    """Test monthly statistics, reduced in batch or without numpy."""
     dt_util.set_default_time_zone(dt_util.get_time_zone(timezone))
+    monkeypatch.setattr(statistics, "REDUCE_COLUMNAR_MIN_ROWS", columnar_min_rows)
+    monkeypatch.setattr(statistics, "_has_numpy", lambda: has_numpy)
 
     hass = hass_recorder()
     wait_recording_done(hass)
@@ -1700,6 +1711,121 @@ def test_monthly_statistics_sum(
     dt_util.set_default_time_zone(dt_util.get_time_zone("UTC"))
 
 
+@pytest.mark.parametrize("timezone", ["UTC", "Europe/Amsterdam", "America/Regina"])
+@pytest.mark.parametrize(
+    ("factory", "period"),
+    [
+        (statistics.reduce_day_ts_factory, timedelta(days=1)),
+        (statistics.reduce_week_ts_factory, timedelta(days=7)),
+        (statistics.reduce_month_ts_factory, timedelta(days=31)),
+    ],
+)
+async def test_reduce_sorted_statistics_columnar(
+    hass: HomeAssistant,
+    timezone: str,
+    factory: Callable[
+        [],
+        tuple[Callable[[float, float], bool], Callable[[float], tuple[float, float]]],
+    ],
+    period: timedelta,
+) -> None:
+    """Test the columnar reduction matches reducing the rows one at a time."""
+    dt_util.set_default_time_zone(dt_util.get_time_zone(timezone))
+    hass.states.async_set("sensor.temperature", "10", {"unit_of_measurement": "°F"})
+    metadata: dict[str, tuple[int, StatisticMetaData]] = {
+        statistic_id: (
+            metadata_id,
+            {
+                "has_mean": True,
+                "has_sum": True,
+                "name": None,
+                "source": "recorder",
+                "statistic_id": statistic_id,
+                "unit_of_measurement": unit,
+            },
+        )
+        for metadata_id, statistic_id, unit in (
+            (1, "sensor.energy", "kWh"),
+            (2, "sensor.temperature", "°C"),
+            (3, "sensor.other", None),
+        )
+    }
+    statistic_ids = {
+        "sensor.other",
+        "sensor.energy",
+        "sensor.temperature",
+        "sensor.gone",
+    }
+    units = {"energy": "Wh"}
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]] = {
+        "last_reset",
+        "max",
+        "mean",
+        "min",
+        "state",
+        "sum",
+    }
+    StatisticsResult = namedtuple(  # noqa: PYI024
+        "StatisticsResult",
+        [
+            "metadata_id",
+            "start_ts",
+            "mean",
+            "min",
+            "max",
+            "last_reset_ts",
+            "state",
+            "sum",
+        ],
+    )
+    first_start = 1672531200.0
+    rows = []
+    for metadata_id in (1, 2, 3):
+        # Leave gaps in the hours and None values in the columns
+        for hour in range(0, 24 * 400, metadata_id):
+            value = None if hour % 11 == metadata_id else (hour * 7) % 97 / 3
+            rows.append(
+                StatisticsResult(
+                    metadata_id,
+                    first_start + hour * 3600,
+                    value,
+                    None if value is None else value - 1,
+                    value if hour % 5 else None,
+                    first_start + hour // 1000 * 3600,
+                    value,
+                    hour / 4,
+                )
+            )
+
+    same_period, period_start_end = factory()
+    expected = statistics._reduce_statistics(
+        statistics._sorted_statistics_to_dict(
+            hass,
+            None,
+            rows,
+            statistic_ids,
+            metadata,
+            True,
+            Statistics,
+            None,
+            units,
+            types,
+        ),
+        same_period,
+        period_start_end,
+        period,
+        types,
+    )
+    _, period_start_end = factory()
+    result = statistics._reduce_sorted_statistics_columnar(
+        hass, rows, statistic_ids, metadata, units, types, period_start_end
+    )
+
+    assert list(result) == list(expected)
+    for statistic_id, reduced in expected.items():
+        assert result[statistic_id] == [pytest.approx(row) for row in reduced]
+
+
 def test_cache_key_for_generate_statistics_during_period_stmt() -> None:
     """Test cache key for _generate_statistics_during_period_stmt."""
     stmt = _generate_statistics_during_period_stmt(
@@ -19,7 +19,7 @@ from homeassistant.helpers import recorder as recorder_helper
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
 
-from .common import async_wait_recording_done
+from .common import async_wait_recording_done, is_read_only_url
 
 from tests.common import async_test_home_assistant
 
@@ -37,6 +37,8 @@ def _create_engine_test(*args, **kwargs):
     importlib.import_module(SCHEMA_MODULE)
     old_db_schema = sys.modules[SCHEMA_MODULE]
     engine = create_engine(*args, **kwargs)
+    if is_read_only_url(args[0]):
+        return engine
     old_db_schema.Base.metadata.create_all(engine)
     with Session(engine) as session:
         session.add(
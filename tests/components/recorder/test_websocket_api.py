@@ -17,6 +17,7 @@ from homeassistant.components.recorder.statistics import (
     get_metadata,
     list_statistic_ids,
 )
+from homeassistant.components.recorder.tasks import PurgeTask
 from homeassistant.components.recorder.websocket_api import UNIT_SCHEMA
 from homeassistant.components.sensor import UNIT_CONVERTERS
 from homeassistant.core import HomeAssistant
@@ -27,6 +28,7 @@ from homeassistant.util.unit_system import METRIC_SYSTEM, US_CUSTOMARY_SYSTEM
 
 from .common import (
     async_recorder_block_till_done,
+    async_wait_purge_done,
     async_wait_recording_done,
     create_engine_test,
     do_adhoc_statistics,
@@ -2138,6 +2140,45 @@ async def test_recorder_info(
     }
 
 
+async def test_subscribe_purge_progress(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test subscribing to the purge progress."""
+    client = await hass_ws_client()
+    await async_wait_recording_done(hass)
+
+    await client.send_json({"id": 1, "type": "recorder/subscribe_purge_progress"})
+    response = await client.receive_json()
+    assert response["success"]
+
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+    recorder_mock.queue_task(PurgeTask(purge_before, False, False))
+    await async_wait_purge_done(hass)
+
+    response = await client.receive_json()
+    assert response["id"] == 1
+    assert response["type"] == "event"
+    assert response["event"] == {
+        "purge_before": purge_before.isoformat(),
+        "repack": False,
+        "apply_filter": False,
+        "started": ANY,
+        "passes": 1,
+        "states_purged": 0,
+        "events_purged": 0,
+        "last_pass_seconds": ANY,
+        "finished": True,
+    }
+
+    # The last progress is sent to new subscribers
+    await client.send_json({"id": 2, "type": "recorder/subscribe_purge_progress"})
+    response = await client.receive_json()
+    assert response["success"]
+    response = await client.receive_json()
+    assert response["id"] == 2
+    assert response["event"]["finished"]
+
+
 async def test_recorder_info_no_recorder(
     hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -32,7 +32,11 @@ from homeassistant.components.recorder.statistics import (
     list_statistic_ids,
 )
 from homeassistant.components.recorder.util import get_instance, session_scope
-from homeassistant.components.sensor import ATTR_OPTIONS, SensorDeviceClass
+from homeassistant.components.sensor import (
+    ATTR_OPTIONS,
+    SensorDeviceClass,
+    recorder as sensor_recorder,
+)
 from homeassistant.const import ATTR_FRIENDLY_NAME, STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant, State
 from homeassistant.setup import async_setup_component, setup_component
@@ -5193,3 +5197,89 @@ async def test_exclude_attributes(
     assert len(states) == 1
     assert ATTR_OPTIONS not in states[0].attributes
     assert ATTR_FRIENDLY_NAME in states[0].attributes
+
+
+async def test_compile_statistics_from_accumulator(
+    recorder_mock: Recorder, hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test statistics compiled from the accumulator match the history."""
+    period0 = dt_util.utcnow().replace(minute=0, second=0, microsecond=0) + timedelta(
+        hours=1
+    )
+    period1 = period0 + timedelta(minutes=5)
+    period2 = period0 + timedelta(minutes=10)
+    freezer.move_to(period0 - timedelta(minutes=1))
+    await async_setup_component(hass, "sensor", {})
+    # Wait for the sensor recorder platform to be added
+    await async_recorder_block_till_done(hass)
+    power_w = {**POWER_SENSOR_ATTRIBUTES, "unit_of_measurement": "W"}
+    energy = {**ENERGY_SENSOR_ATTRIBUTES, "last_reset": None}
+    hass.states.async_set("sensor.power", "1000", power_w)
+    hass.states.async_set("sensor.energy", "10", energy)
+    hass.states.async_set("sensor.temperature", "20", TEMPERATURE_SENSOR_ATTRIBUTES)
+    await async_wait_recording_done(hass)
+
+    # The first compilation starts the accumulator
+    do_adhoc_statistics(hass, start=period0 - timedelta(minutes=5))
+    await async_wait_recording_done(hass)
+    await hass.async_block_till_done()
+
+    changes = [
+        (period0 + timedelta(minutes=1), "sensor.power", "1500", power_w),
+        (period0 + timedelta(minutes=2), "sensor.energy", "12", energy),
+        (period0 + timedelta(minutes=3), "sensor.temperature", "21", None),
+        (period0 + timedelta(minutes=4), "sensor.power", "2", POWER_SENSOR_ATTRIBUTES),
+        (period1 + timedelta(seconds=30), "sensor.power", "3", None),
+        (
+            period1 + timedelta(seconds=40),
+            "sensor.power",
+            "3",
+            {**POWER_SENSOR_ATTRIBUTES, "changed": True},
+        ),
+        (period1 + timedelta(seconds=50), "sensor.power", STATE_UNAVAILABLE, None),
+        (period1 + timedelta(minutes=2), "sensor.power", "0.5", None),
+        (period1 + timedelta(seconds=10), "sensor.energy", "15", None),
+        (period1 + timedelta(minutes=3), "sensor.energy", "2", None),
+        (period1 + timedelta(minutes=4), "sensor.energy", "4", None),
+    ]
+    for time, entity_id, state, attributes in sorted(changes, key=lambda c: c[0]):
+        freezer.move_to(time)
+        if attributes is None:
+            attributes = hass.states.get(entity_id).attributes
+        hass.states.async_set(entity_id, state, attributes)
+    freezer.move_to(period2 + timedelta(seconds=10))
+    hass.states.async_set("sensor.energy", "5", energy)
+    await async_wait_recording_done(hass)
+
+    # The statistics of period0 are compiled from the history
+    do_adhoc_statistics(hass, start=period0)
+    await async_wait_recording_done(hass)
+    accumulator = hass.data[sensor_recorder.DATA_STATISTICS_ACCUMULATOR]
+    assert accumulator.get_period("sensor.power", False, period0, period1) is None
+    assert accumulator.get_period("sensor.power", False, period1, period2)
+
+    def _compile_period1() -> tuple[list, list]:
+        with patch.object(
+            history,
+            "get_full_significant_states_with_session",
+            side_effect=AssertionError,
+        ):
+            accumulated = sensor_recorder.compile_statistics(hass, period1, period2)
+        with session_scope(hass=hass, read_only=True) as session:
+            from_history = sensor_recorder._compile_statistics(
+                hass, session, period1, period2
+            )
+        return accumulated.platform_stats, from_history.platform_stats
+
+    accumulated, from_history = await hass.async_add_executor_job(_compile_period1)
+    assert [result["meta"] for result in accumulated] == [
+        result["meta"] for result in from_history
+    ]
+    assert [result["stat"] for result in accumulated] == [
+        pytest.approx(result["stat"]) for result in from_history
+    ]
+    assert [result["stat"] for result in accumulated] == [
+        {"start": period1, "mean": pytest.approx(1400.0), "min": 500.0, "max": 3000.0},
+        {"start": period1, "state": 4.0, "sum": -6.0},
+        {"start": period1, "mean": 21.0, "min": 21.0, "max": 21.0},
+    ]
@@ -831,6 +831,11 @@ async def test_durations(hass: HomeAssistant, worker_finished_stream) -> None:
     for segment in complete_segments:
         av_segment = av.open(io.BytesIO(segment.init + segment.get_data()))
         av_segment.close()
+        # The parts are views of the data of the complete segment
+        segment_data = segment.get_data()
+        assert isinstance(segment_data, memoryview)
+        assert all(part.data.obj is segment_data.obj for part in segment.parts)
+        assert b"".join(part.data for part in segment.parts) == segment_data
         for part_num, part in enumerate(segment.parts):
             av_part = av.open(io.BytesIO(segment.init + part.data))
             running_metadata_duration += part.duration
@@ -0,0 +1,45 @@
+"""Tests for the diagnostics data provided by the Template integration."""
+from homeassistant.components.template import DOMAIN
+from homeassistant.core import HomeAssistant
+
+from tests.common import MockConfigEntry
+from tests.components.diagnostics import get_diagnostics_for_config_entry
+from tests.typing import ClientSessionGenerator
+
+
+async def test_diagnostics(
+    hass: HomeAssistant, hass_client: ClientSessionGenerator
+) -> None:
+    """Test diagnostics."""
+    config_entry = MockConfigEntry(
+        data={},
+        domain=DOMAIN,
+        options={
+            "name": "My template",
+            "state": "{{ states('sensor.source') }}",
+            "template_type": "sensor",
+        },
+        title="My template",
+    )
+    config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    hass.states.async_set("sensor.source", "1")
+    await hass.async_block_till_done()
+
+    diagnostics = await get_diagnostics_for_config_entry(
+        hass, hass_client, config_entry
+    )
+
+    assert diagnostics["options"] == {
+        "name": "My template",
+        "state": "{{ states('sensor.source') }}",
+        "template_type": "sensor",
+    }
+    compile_stats = diagnostics["template_compile_stats"]
+    assert compile_stats["environments"]["default"]["misses"] >= 1
+    assert compile_stats["code_cache"]["hits"] == 0
+    assert compile_stats["code_cache"]["misses"] >= 1
+    render_stats = diagnostics["template_render_stats"]
+    assert render_stats["passes"] >= 1
+    assert render_stats["templates"]["{{ states('sensor.source') }}"]["renders"] >= 1
@@ -38,7 +38,7 @@ def _find_traces(traces, trace_type, item_id):
 
 
 async def _setup_automation_or_script(
-    hass, domain, configs, script_config=None, stored_traces=None
+    hass, domain, configs, script_config=None, stored_traces=None, trace_config=None
 ):
     """Set up automations or scripts from automation config."""
     if domain == "script":
@@ -62,6 +62,10 @@ async def _setup_automation_or_script(
                 config["trace"] = {}
                 config["trace"]["stored_traces"] = stored_traces
 
+    if trace_config is not None:
+        for config in configs.values() if domain == "script" else configs:
+            config["trace"] = {**config.get("trace", {}), **trace_config}
+
     assert await async_setup_component(hass, domain, {domain: configs})
 
 
@@ -773,6 +777,87 @@ async def test_trace_no_traces(
     assert len(_find_traces(response["result"], domain, "sun")) == 0
 
 
+@pytest.mark.parametrize("domain", ["automation", "script"])
+@pytest.mark.parametrize(
+    ("trace_config", "runs", "traces"),
+    [
+        ({}, 5, 5),
+        ({"mode": "full"}, 5, 5),
+        ({"mode": "sampled", "sample_interval": 2}, 5, 3),
+        ({"mode": "sampled", "sample_interval": 10}, 5, 1),
+        ({"mode": "errors"}, 5, 0),
+        ({"mode": "off"}, 5, 0),
+    ],
+)
+async def test_trace_modes(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    domain,
+    trace_config,
+    runs,
+    traces,
+) -> None:
+    """Test the trace modes of a script or automation."""
+    id = 1
+
+    def next_id():
+        nonlocal id
+        id += 1
+        return id
+
+    sun_config = {
+        "id": "sun",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": {"event": "some_event"},
+    }
+    moon_config = {
+        "id": "moon",
+        "trigger": {"platform": "event", "event_type": "test_event2"},
+        "action": {"service": "test.automation"},
+    }
+    await _setup_automation_or_script(
+        hass, domain, [sun_config, moon_config], trace_config=trace_config
+    )
+
+    client = await hass_ws_client()
+
+    for _ in range(runs):
+        await _run_automation_or_script(hass, domain, sun_config, "test_event")
+        await hass.async_block_till_done()
+
+    await client.send_json({"id": next_id(), "type": "trace/list", "domain": domain})
+    response = await client.receive_json()
+    assert response["success"]
+    assert len(_find_traces(response["result"], domain, "sun")) == traces
+
+    # Runs which fail are traced in errors mode
+    await _run_automation_or_script(hass, domain, moon_config, "test_event2")
+    await hass.async_block_till_done()
+
+    await client.send_json({"id": next_id(), "type": "trace/list", "domain": domain})
+    response = await client.receive_json()
+    assert response["success"]
+    moon_traces = _find_traces(response["result"], domain, "moon")
+    if trace_config.get("mode") == "off":
+        assert moon_traces == []
+        return
+    assert len(moon_traces) == 1
+    assert moon_traces[0]["error"] == "Unable to find service test.automation"
+
+    await client.send_json(
+        {
+            "id": next_id(),
+            "type": "trace/get",
+            "domain": domain,
+            "item_id": "moon",
+            "run_id": moon_traces[0]["run_id"],
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["trace"]
+
+
 @pytest.mark.parametrize(
     ("domain", "prefix", "trigger", "last_step", "script_execution"),
     [
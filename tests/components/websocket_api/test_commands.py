@@ -21,7 +21,7 @@ from homeassistant.core import Context, HomeAssistant, State, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import device_registry as dr, entity
 from homeassistant.helpers.dispatcher import async_dispatcher_send
-from homeassistant.loader import async_get_integration
+from homeassistant.loader import DATA_IMPORT_TIME, async_get_integration
 from homeassistant.setup import DATA_SETUP_TIME, async_setup_component
 from homeassistant.util.json import json_loads
 
@@ -1093,6 +1093,204 @@ async def test_subscribe_unsubscribe_entities_specific_entities(
     }
 
 
+async def test_subscribe_entities_coalesce(
+    hass: HomeAssistant, websocket_client
+) -> None:
+    """Test changes queued for a coalescing subscription are merged."""
+    hass.states.async_set("light.changed", "off", {"color": "red"})
+    hass.states.async_set("light.removed", "on")
+
+    await websocket_client.send_json(
+        {"id": 7, "type": "subscribe_entities", "coalesce": True, "resumable": True}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"] is None
+    msg = await websocket_client.receive_json()
+    assert set(msg["event"]["a"]) == {"light.changed", "light.removed"}
+    seq = msg["event"]["seq"]
+
+    # A single change is sent as is
+    hass.states.async_set("light.changed", "on", {"color": "red"})
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "c": {"light.changed": {"+": {"c": ANY, "lc": ANY, "s": "on"}}},
+        "seq": seq + 1,
+    }
+
+    # Changes before the writer gets to the message end up in the same message
+    hass.states.async_set("light.changed", "off", {"color": "blue", "size": 1})
+    hass.states.async_set("light.changed", "on", {"color": "green", "size": 1})
+    hass.states.async_set("light.added", "on")
+    hass.states.async_set("light.added", "off")
+    hass.states.async_remove("light.removed")
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["event"] == {
+        "a": {"light.added": {"a": {}, "c": ANY, "lc": ANY, "s": "off"}},
+        "c": {
+            "light.changed": {
+                "+": {"a": {"color": "green", "size": 1}, "c": ANY, "lc": ANY}
+            }
+        },
+        "r": ["light.removed"],
+        "seq": seq + 6,
+    }
+
+    # Later changes need a new message
+    hass.states.async_set("light.added", "on")
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "c": {"light.added": {"+": {"c": ANY, "lc": ANY, "s": "on"}}},
+        "seq": seq + 7,
+    }
+
+    # The counters of the live connection can be queried
+    await websocket_client.send_json({"id": 8, "type": "connection_stats"})
+    msg = await websocket_client.receive_json()
+    assert msg["result"] == {"coalesced_messages": 2, "dropped_messages": 0}
+
+
+async def test_subscribe_entities_resumable(
+    hass: HomeAssistant, websocket_client, hass_admin_user: MockUser
+) -> None:
+    """Test resuming a subscription only sends the entities that changed."""
+    hass.states.async_set("light.permitted", "off", {"color": "red"})
+    hass.states.async_set("light.removed", "on")
+    hass.states.async_set("light.unchanged", "on")
+    hass_admin_user.groups = []
+    hass_admin_user.mock_policy(
+        {
+            "entities": {
+                "entity_ids": {
+                    "light.permitted": True,
+                    "light.removed": True,
+                    "light.unchanged": True,
+                }
+            }
+        }
+    )
+
+    await websocket_client.send_json(
+        {"id": 7, "type": "subscribe_entities", "resumable": True}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert set(msg["event"]["a"]) == {
+        "light.permitted",
+        "light.removed",
+        "light.unchanged",
+    }
+    log_id = msg["event"]["log"]
+    seq = msg["event"]["seq"]
+
+    hass.states.async_set("light.permitted", "on", {"color": "red"})
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "c": {"light.permitted": {"+": {"c": ANY, "lc": ANY, "s": "on"}}},
+        "seq": seq + 1,
+    }
+    seq = msg["event"]["seq"]
+
+    await websocket_client.send_json(
+        {"id": 8, "type": "unsubscribe_events", "subscription": 7}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    # Changes while the client is away
+    hass.states.async_set("light.permitted", "off", {"color": "blue"})
+    hass.states.async_set("light.permitted", "on", {"color": "green"})
+    hass.states.async_set("light.not_permitted", "on")
+    hass.states.async_remove("light.removed")
+
+    await websocket_client.send_json(
+        {"id": 9, "type": "subscribe_entities", "log": log_id, "seq": seq}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 9
+    assert msg["event"] == {
+        "a": {
+            "light.permitted": {
+                "a": {"color": "green"},
+                "c": ANY,
+                "lc": ANY,
+                "s": "on",
+            }
+        },
+        "r": ["light.removed"],
+        "resumed": True,
+        "log": log_id,
+        "seq": seq + 4,
+    }
+
+    # Nothing changed since the last message
+    await websocket_client.send_json(
+        {"id": 10, "type": "subscribe_entities", "log": log_id, "seq": seq + 4}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "a": {},
+        "r": [],
+        "resumed": True,
+        "log": log_id,
+        "seq": seq + 4,
+    }
+
+
+@pytest.mark.parametrize(
+    ("log_id", "seq"),
+    [
+        ("unknown", 5),  # The log was restarted
+        (None, 0),  # The changes are no longer in the log
+        (None, 1000),  # The sequence number is from the future
+    ],
+)
+async def test_subscribe_entities_resume_falls_back_to_snapshot(
+    hass: HomeAssistant, websocket_client, log_id: str | None, seq: int
+) -> None:
+    """Test a full snapshot is sent when the missed changes are not known."""
+    hass.states.async_set("light.kitchen", "on")
+    with patch(
+        "homeassistant.components.websocket_api.change_log.STATE_CHANGE_LOG_SIZE", 2
+    ):
+        await websocket_client.send_json(
+            {"id": 7, "type": "subscribe_entities", "resumable": True}
+        )
+        msg = await websocket_client.receive_json()
+        assert msg["success"]
+        msg = await websocket_client.receive_json()
+    current_log_id = msg["event"]["log"]
+    for idx in range(5):
+        hass.states.async_set("light.kitchen", str(idx))
+    for _ in range(5):
+        msg = await websocket_client.receive_json()
+    assert msg["event"]["seq"] == 5
+
+    await websocket_client.send_json(
+        {
+            "id": 8,
+            "type": "subscribe_entities",
+            "log": log_id or current_log_id,
+            "seq": seq,
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 8
+    assert msg["event"] == {
+        "a": {"light.kitchen": {"a": {}, "c": ANY, "lc": ANY, "s": "4"}},
+        "log": current_log_id,
+        "seq": 5,
+    }
+
+
 async def test_render_template_renders_template(
     hass: HomeAssistant, websocket_client
 ) -> None:
@@ -1876,6 +2074,7 @@ async def test_integration_setup_info(
         "august": datetime.timedelta(seconds=12.5),
         "isy994": datetime.timedelta(seconds=12.8),
     }
+    hass.data[DATA_IMPORT_TIME] = {"august": datetime.timedelta(seconds=1.5)}
     await websocket_client.send_json({"id": 7, "type": "integration/setup_info"})
 
     msg = await websocket_client.receive_json()
@@ -1883,7 +2082,7 @@ async def test_integration_setup_info(
     assert msg["type"] == const.TYPE_RESULT
     assert msg["success"]
     assert msg["result"] == [
-        {"domain": "august", "seconds": 12.5},
+        {"domain": "august", "seconds": 12.5, "import_seconds": 1.5},
         {"domain": "isy994", "seconds": 12.8},
     ]
 
@@ -238,6 +238,7 @@ async def test_pending_msg_peak(
         websocket_client = await hass_ws_client()
 
     instance: http.WebSocketHandler = cast(http.WebSocketHandler, setup_instance)
+    connection = instance._connection
 
     # Fill the queue past the allowed peak
     for _ in range(10):
@@ -252,6 +253,7 @@ async def test_pending_msg_peak(
     assert "Client unable to keep up with pending messages" in caplog.text
     assert "Stayed over 5 for 5 seconds" in caplog.text
     assert "overload" in caplog.text
+    assert connection.dropped_messages == 10
 
 
 async def test_pending_msg_peak_recovery(
@@ -379,6 +381,45 @@ async def test_prepare_fail(
     assert "Timeout preparing request" in caplog.text
 
 
+async def test_deferred_message_serialization_error(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test a deferred message that can not be serialized is dropped."""
+    connection: ActiveConnection | None = None
+
+    @callback
+    @websocket_command({"type": "bad_deferred"})
+    def async_bad_deferred(
+        hass: HomeAssistant, active_connection: ActiveConnection, msg: dict[str, Any]
+    ) -> None:
+        nonlocal connection
+        connection = active_connection
+
+        def _bad_message() -> str:
+            raise TypeError("not serializable")
+
+        active_connection.send_message(_bad_message)
+        active_connection.send_result(msg["id"])
+
+    async_register_command(hass, async_bad_deferred)
+
+    await websocket_client.send_json({"id": 5, "type": "bad_deferred"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["type"] == "result"
+    assert "Unable to serialize message" in caplog.text
+    assert connection is not None
+    assert connection.dropped_messages == 1
+
+    # The connection is still usable
+    await websocket_client.send_json({"id": 6, "type": "ping"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 6
+    assert msg["type"] == "pong"
+
+
 async def test_enable_coalesce(
     hass: HomeAssistant,
     hass_ws_client: WebSocketGenerator,
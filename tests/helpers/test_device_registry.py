@@ -4,6 +4,7 @@ import time
 from typing import Any
 from unittest.mock import patch
 
+import attr
 import pytest
 from yarl import URL
 
@@ -1877,3 +1878,31 @@ async def test_loading_invalid_configuration_url_from_storage(
         identifiers={("serial", "12:34:56:AB:CD:EF")},
     )
     assert entry.configuration_url == "invalid"
+
+
+def test_active_device_registry_items_indexes() -> None:
+    """Test the ActiveDeviceRegistryItems indexes follow the entries."""
+    devices = dr.ActiveDeviceRegistryItems()
+    device1 = dr.DeviceEntry(
+        id="device_1", area_id="kitchen", config_entries={"config_1", "config_2"}
+    )
+    device2 = dr.DeviceEntry(id="device_2", config_entries={"config_1"})
+    devices["device_1"] = device1
+    devices["device_2"] = device2
+
+    assert devices.get_devices_for_area_id("kitchen") == [device1]
+    assert devices.get_devices_for_config_entry_id("config_1") == [device1, device2]
+    assert devices.get_devices_for_config_entry_id("config_2") == [device1]
+
+    device1_moved = attr.evolve(device1, area_id=None, config_entries={"config_1"})
+    devices["device_1"] = device1_moved
+    assert devices.get_devices_for_area_id("kitchen") == []
+    assert devices.get_devices_for_config_entry_id("config_1") == [
+        device2,
+        device1_moved,
+    ]
+    assert devices.get_devices_for_config_entry_id("config_2") == []
+
+    del devices["device_2"]
+    devices.pop("device_1")
+    assert devices.get_devices_for_config_entry_id("config_1") == []
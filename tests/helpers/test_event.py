@@ -25,6 +25,7 @@ from homeassistant.helpers.event import (
     TrackTemplate,
     TrackTemplateResult,
     async_call_later,
+    async_get_template_render_stats,
     async_track_device_registry_updated_event,
     async_track_entity_registry_updated_event,
     async_track_point_in_time,
@@ -2457,6 +2458,113 @@ async def test_track_template_rate_limit(hass: HomeAssistant) -> None:
     info.async_remove()
 
 
+async def test_track_template_result_coalesced_renders(hass: HomeAssistant) -> None:
+    """Test state changes in one loop iteration render each template once."""
+    source = (
+        "{{ ['light.one', 'light.two', 'light.three']"
+        " | select('is_state', 'on') | list | count }}"
+    )
+    runs: dict[str, list[str]] = {"first": [], "second": [], "variables": []}
+
+    def _listener(name: str) -> Callable[..., None]:
+        @ha.callback
+        def refresh_listener(
+            event: EventType[EventStateChangedData] | None,
+            updates: list[TrackTemplateResult],
+        ) -> None:
+            runs[name].append(updates.pop().result)
+
+        return refresh_listener
+
+    this = {"this": "sensor.count"}
+    infos = [
+        async_track_template_result(
+            hass,
+            [TrackTemplate(Template(source, hass), None)],
+            _listener("first"),
+            coalesce_renders=True,
+        ),
+        async_track_template_result(
+            hass,
+            [TrackTemplate(Template(source, hass), this)],
+            _listener("second"),
+            coalesce_renders=True,
+        ),
+        async_track_template_result(
+            hass,
+            [TrackTemplate(Template(source, hass), {"offset": 1})],
+            _listener("variables"),
+            coalesce_renders=True,
+        ),
+    ]
+    for info in infos:
+        info.async_refresh()
+    await hass.async_block_till_done()
+    assert runs == {"first": [0], "second": [0], "variables": [0]}
+    renders = async_get_template_render_stats(hass)["templates"][source]["renders"]
+
+    for entity_id in ("light.one", "light.two", "light.three"):
+        hass.states.async_set(entity_id, "on")
+    await hass.async_block_till_done()
+    assert runs == {"first": [0, 3], "second": [0, 3], "variables": [0, 3]}
+
+    stats = async_get_template_render_stats(hass)
+    assert stats["passes"] == 1
+    # The templates which do not use their variables share their render
+    assert stats["templates"][source]["renders"] == renders + 2
+    assert stats["templates"][source]["deduplicated"] == 1
+
+    # Removed trackers are not rendered anymore
+    infos[1].async_remove()
+    hass.states.async_set("light.three", "off")
+    infos[0].async_remove()
+    await hass.async_block_till_done()
+    assert runs == {"first": [0, 3], "second": [0, 3], "variables": [0, 3, 2]}
+
+    infos[2].async_remove()
+
+
+async def test_track_template_result_coalesced_renders_this(
+    hass: HomeAssistant,
+) -> None:
+    """Test templates referring to this are rendered for every tracker."""
+    source = "{{ this }} {{ states('light.one') }}"
+    runs: dict[str, list[str]] = {"one": [], "two": []}
+
+    def _listener(name: str) -> Callable[..., None]:
+        @ha.callback
+        def refresh_listener(
+            event: EventType[EventStateChangedData] | None,
+            updates: list[TrackTemplateResult],
+        ) -> None:
+            runs[name].append(updates.pop().result)
+
+        return refresh_listener
+
+    infos = [
+        async_track_template_result(
+            hass,
+            [TrackTemplate(Template(source, hass), {"this": name})],
+            _listener(name),
+            coalesce_renders=True,
+        )
+        for name in runs
+    ]
+    for info in infos:
+        info.async_refresh()
+    await hass.async_block_till_done()
+
+    hass.states.async_set("light.one", "on")
+    await hass.async_block_till_done()
+    assert runs == {"one": ["one unknown", "one on"], "two": ["two unknown", "two on"]}
+    assert (
+        async_get_template_render_stats(hass)["templates"][source]["deduplicated"] == 0
+    )
+
+    for info in infos:
+        info.async_remove()
+
+
 async def test_track_template_rate_limit_super(hass: HomeAssistant) -> None:
     """Test template rate limit with super template."""
     template_availability = Template(
@@ -102,10 +102,11 @@ def assert_element(trace_element, expected_element, path):
     if trace_element.path == "0":
         return
 
+    changed_variables = trace_element.as_dict().get("changed_variables", {})
     if "variables" in expected_element:
-        assert expected_element["variables"] == trace_element._variables
+        assert expected_element["variables"] == changed_variables
     else:
-        assert not trace_element._variables
+        assert not changed_variables
 
 
 def assert_action_trace(expected, expected_script_execution="finished"):
@@ -1,4 +1,5 @@
 """Test service helpers."""
+import asyncio
 from collections import OrderedDict
 from collections.abc import Iterable
 from copy import deepcopy
@@ -32,6 +33,8 @@ from homeassistant.setup import async_setup_component
 
 from tests.common import (
     MockEntity,
+    MockEntityPlatform,
+    MockPlatform,
     MockUser,
     async_mock_service,
     mock_device_registry,
@@ -521,6 +524,39 @@ async def test_extract_entity_ids_from_area(hass: HomeAssistant, area_mock) -> N
     )
 
 
+async def test_extract_entity_ids_from_area_cached(
+    hass: HomeAssistant, area_mock
+) -> None:
+    """Test the entities of areas are cached until a registry changes."""
+    call = ServiceCall("light", "turn_on", {"area_id": "own-area"})
+
+    with patch(
+        "homeassistant.helpers.service._async_resolve_devices_and_areas",
+        wraps=service._async_resolve_devices_and_areas,
+    ) as mock_resolve:
+        assert await service.async_extract_entity_ids(hass, call) == {
+            "light.in_own_area"
+        }
+        assert await service.async_extract_entity_ids(hass, call) == {
+            "light.in_own_area"
+        }
+        assert len(mock_resolve.mock_calls) == 1
+
+        er.async_get(hass).async_update_entity("light.no_area", area_id="own-area")
+        assert await service.async_extract_entity_ids(hass, call) == {
+            "light.in_own_area",
+            "light.no_area",
+        }
+        assert len(mock_resolve.mock_calls) == 2
+
+        dr.async_get(hass).async_update_device("device-no-area-id", area_id="own-area")
+        assert await service.async_extract_entity_ids(hass, call) == {
+            "light.in_own_area",
+            "light.no_area",
+        }
+        assert len(mock_resolve.mock_calls) == 3
+
+
 async def test_extract_entity_ids_from_devices(hass: HomeAssistant, area_mock) -> None:
     """Test extract_entity_ids method with devices."""
     assert await service.async_extract_entity_ids(
@@ -1065,6 +1101,83 @@ async def test_call_with_omit_entity_id(
     assert len(mock_handle_entity_call.mock_calls) == 0
 
 
+async def test_call_with_parallel_service_calls(hass: HomeAssistant) -> None:
+    """Check the entities of a platform are called with limited parallelism."""
+    platform_module = MockPlatform()
+    platform_module.PARALLEL_SERVICE_CALLS = 2
+    platform = MockEntityPlatform(hass, platform=platform_module)
+    entities = [MockEntity(name=f"test_{num}") for num in range(5)]
+    await platform.async_add_entities(entities)
+    running = 0
+    max_running = 0
+
+    async def _async_service(entity: MockEntity, call: ServiceCall) -> None:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0)
+        running -= 1
+
+    await service.entity_service_call(
+        hass,
+        [platform],
+        _async_service,
+        ServiceCall("test_domain", "test_service", {"entity_id": "all"}),
+    )
+
+    assert max_running == 2
+
+
+async def test_call_with_bulk_entity_service_call(hass: HomeAssistant) -> None:
+    """Check platforms with a bulk method are called once with their entities."""
+    platform_module = MockPlatform()
+    platform_module.async_bulk_entity_service_call = AsyncMock(return_value=True)
+    platform = MockEntityPlatform(hass, platform=platform_module)
+    entities = [MockEntity(name=f"test_{num}") for num in range(3)]
+    await platform.async_add_entities(entities)
+    other_platform = MockEntityPlatform(hass, platform_name="other_platform")
+    other_entities = [MockEntity(name=f"other_{num}") for num in range(2)]
+    for entity in other_entities:
+        entity.async_turn_on = AsyncMock()
+    await other_platform.async_add_entities(other_entities)
+    call = ServiceCall(
+        "test_domain",
+        "test_service",
+        {"entity_id": "all"},
+        Context(),
+    )
+
+    await service.entity_service_call(
+        hass, [platform, other_platform], "async_turn_on", call
+    )
+
+    platform_module.async_bulk_entity_service_call.assert_awaited_once_with(
+        hass, entities, "async_turn_on", {}
+    )
+    assert all(entity._context is call.context for entity in entities)
+    for entity in other_entities:
+        entity.async_turn_on.assert_awaited_once_with()
+    stats = platform.service_call_stats["test_domain.test_service"]
+    assert stats["calls"] == 1
+    assert stats["entities"] == 3
+    assert stats["time"] >= 0
+    stats = other_platform.service_call_stats["test_domain.test_service"]
+    assert stats["calls"] == 1
+    assert stats["entities"] == 2
+
+    # The entities are called one by one if the bulk method does not handle them
+    platform_module.async_bulk_entity_service_call.return_value = False
+    for entity in entities:
+        entity.async_turn_on = AsyncMock()
+    await service.entity_service_call(hass, [platform], "async_turn_on", call)
+
+    assert len(platform_module.async_bulk_entity_service_call.mock_calls) == 2
+    for entity in entities:
+        entity.async_turn_on.assert_awaited_once_with()
+    assert platform.service_call_stats["test_domain.test_service"]["calls"] == 2
+    assert platform.service_call_stats["test_domain.test_service"]["entities"] == 6
+
+
 async def test_register_admin_service(
     hass: HomeAssistant, hass_read_only_user: MockUser, hass_admin_user: MockUser
 ) -> None:
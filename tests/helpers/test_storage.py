@@ -733,3 +733,177 @@ async def test_read_only_store(
     hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
     await hass.async_block_till_done()
     assert read_only_store.key not in hass_storage
+
+
+async def test_change_log(tmpdir: py.path.local) -> None:
+    """Test record changes are appended to the change log."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+
+    tmp_storage = await hass.async_add_executor_job(tmpdir.mkdir, "temp_storage")
+    hass.config.config_dir = tmp_storage
+
+    def _create_store() -> storage.Store:
+        return storage.Store(hass, MOCK_VERSION, MOCK_KEY, record_keys={"items": "id"})
+
+    def _read_files() -> tuple[dict[str, Any], list[str]]:
+        with open(store.path, encoding="utf8") as data_file:
+            stored = json.load(data_file)
+        with open(store.change_log_path, encoding="utf8") as log_file:
+            return stored, log_file.read().splitlines()
+
+    items = [{"id": str(idx), "value": idx, "name": f"item {idx}"} for idx in range(20)]
+    store = _create_store()
+    await store.async_save({"items": items, "other": 1})
+    stored, log = await hass.async_add_executor_job(_read_files)
+    assert stored["data"] == {"items": items, "other": 1}
+    assert log == [
+        json.dumps({"change_log": stored["change_log"]}, separators=(",", ":"))
+    ]
+
+    # Changed, removed and added records are appended
+    items = [{**items[0], "value": 100}, *items[2:], {"id": "new", "value": 0}]
+    await store.async_save({"items": items, "other": 1})
+    snapshot, log = await hass.async_add_executor_job(_read_files)
+    assert snapshot == stored
+    assert [json.loads(line) for line in log[1:]] == [
+        {"s": "items", "k": "0", "r": {**items[0]}},
+        {"s": "items", "k": "new", "r": {"id": "new", "value": 0}},
+        {"s": "items", "k": "1"},
+    ]
+
+    # Saving the same data appends nothing
+    await store.async_save({"items": items, "other": 1})
+    assert (await hass.async_add_executor_job(_read_files))[1] == log
+
+    store = _create_store()
+    assert await store.async_load() == {"items": items, "other": 1}
+
+    # The loaded store keeps appending to the change log
+    items[1] = {**items[1], "value": 200}
+    await store.async_save({"items": items, "other": 1})
+    snapshot, log = await hass.async_add_executor_job(_read_files)
+    assert snapshot == stored
+    assert len(log) == 5
+
+    # Other data changes write the whole file and start a new change log
+    await store.async_save({"items": items, "other": 2})
+    snapshot, log = await hass.async_add_executor_job(_read_files)
+    assert snapshot["data"] == {"items": items, "other": 2}
+    assert snapshot["change_log"] != stored["change_log"]
+    assert len(log) == 1
+
+    # A change log larger than half of the data is compacted
+    items = [{**item, "value": -1} for item in items]
+    await store.async_save({"items": items, "other": 2})
+    snapshot, log = await hass.async_add_executor_job(_read_files)
+    assert snapshot["data"] == {"items": items, "other": 2}
+    assert len(log) == 1
+
+    store = _create_store()
+    assert await store.async_load() == {"items": items, "other": 2}
+
+    await store.async_remove()
+    assert not await hass.async_add_executor_job(os.path.exists, store.path)
+    assert not await hass.async_add_executor_job(os.path.exists, store.change_log_path)
+
+    await hass.async_stop(force=True)
+
+
+async def test_change_log_incomplete(
+    tmpdir: py.path.local, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test incomplete changes and foreign change logs are ignored."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+
+    tmp_storage = await hass.async_add_executor_job(tmpdir.mkdir, "temp_storage")
+    hass.config.config_dir = tmp_storage
+
+    def _create_store() -> storage.Store:
+        return storage.Store(hass, MOCK_VERSION, MOCK_KEY, record_keys={"items": "id"})
+
+    def _append_to_log(content: bytes) -> None:
+        with open(store.change_log_path, "ab") as log_file:
+            log_file.write(content)
+
+    def _read_log() -> list[str]:
+        with open(store.change_log_path, encoding="utf8") as log_file:
+            return log_file.read().splitlines()
+
+    items = [{"id": str(idx), "value": idx, "name": f"item {idx}"} for idx in range(20)]
+    store = _create_store()
+    await store.async_save({"items": items})
+    items[0] = {**items[0], "value": 100}
+    await store.async_save({"items": items})
+    await hass.async_add_executor_job(_append_to_log, b'{"s":"items","k":"1","r":{')
+
+    store = _create_store()
+    assert await store.async_load() == {"items": items}
+    assert "Ignoring incomplete change in change log" in caplog.text
+
+    # Changes are not appended after an incomplete change
+    items[1] = {**items[1], "value": 200}
+    await store.async_save({"items": items})
+    assert len(await hass.async_add_executor_job(_read_log)) == 1
+
+    await hass.async_add_executor_job(_append_to_log, b'{"s":"items","k":"1"}\n')
+    store = _create_store()
+    assert await store.async_load() == {"items": items[:1] + items[2:]}
+
+    # A change log of other stored data is ignored
+    old_store = store
+    store = storage.Store(hass, MOCK_VERSION, "other", record_keys={"items": "id"})
+    await store.async_save({"items": items})
+    await hass.async_add_executor_job(
+        os.replace, old_store.change_log_path, store.change_log_path
+    )
+    store = storage.Store(hass, MOCK_VERSION, "other", record_keys={"items": "id"})
+    assert await store.async_load() == {"items": items}
+    assert "which does not belong to the stored data" in caplog.text
+
+    await hass.async_stop(force=True)
+
+
+async def test_change_log_written_on_final_write(tmpdir: py.path.local) -> None:
+    """Test the whole file is written when Home Assistant stops."""
+    loop = asyncio.get_running_loop()
+    hass = await async_test_home_assistant(loop)
+
+    tmp_storage = await hass.async_add_executor_job(tmpdir.mkdir, "temp_storage")
+    hass.config.config_dir = tmp_storage
+
+    def _read_files() -> tuple[dict[str, Any], list[str]]:
+        with open(store.path, encoding="utf8") as data_file:
+            stored = json.load(data_file)
+        with open(store.change_log_path, encoding="utf8") as log_file:
+            return stored, log_file.read().splitlines()
+
+    items = [{"id": str(idx), "value": idx, "name": f"item {idx}"} for idx in range(20)]
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, record_keys={"items": "id"})
+    await store.async_save({"items": items})
+    items[0] = {**items[0], "value": 100}
+    await store.async_save({"items": items})
+    stored, log = await hass.async_add_executor_job(_read_files)
+    assert stored["data"] != {"items": items}
+    assert len(log) == 2
+
+    # The changes in the change log are written into the file
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+    await hass.async_block_till_done()
+    stored, log = await hass.async_add_executor_job(_read_files)
+    assert stored["data"] == {"items": items}
+    assert log == [
+        json.dumps({"change_log": stored["change_log"]}, separators=(",", ":"))
+    ]
+
+    # A pending save is written as a whole file
+    items[1] = {**items[1], "value": 200}
+    store.async_delay_save(lambda: {"items": items}, 10)
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+    await hass.async_block_till_done()
+    stored, log = await hass.async_add_executor_job(_read_files)
+    assert stored["data"] == {"items": items}
+    assert len(log) == 1
+
+    await hass.async_stop(force=True)
@@ -11,6 +11,7 @@ from typing import Any
 from unittest.mock import patch
 
 from freezegun import freeze_time
+import jinja2
 import orjson
 import pytest
 import voluptuous as vol
@@ -4093,9 +4094,107 @@ async def test_cache_garbage_collection() -> None:
     del tpl
     assert template._NO_HASS_ENV.template_cache.get(template_string)
     del tpl2
+    # The compiled code is kept alive by the LRU for reloads
+    assert template._NO_HASS_ENV.template_cache.get(template_string)
+    template._NO_HASS_ENV.template_code_lru.clear()
     assert not template._NO_HASS_ENV.template_cache.get(template_string)
 
 
+async def test_compiled_code_survives_reload(hass: HomeAssistant) -> None:
+    """Test compiled code is reused after all templates using it are released."""
+    template_string = "{{ states('sensor.reload') }}"
+    env = template.TemplateEnvironment(hass)
+    code = env.compile(template_string)
+    assert env.compile_stats["misses"] == 1
+
+    assert env.compile(template_string) is code
+    assert env.compile_stats["hits"] == 1
+
+    env.template_cache.clear()
+    assert env.compile(template_string) is code
+    assert env.compile_stats["lru_hits"] == 1
+    assert env.compile_stats["misses"] == 1
+
+
+async def test_code_cache_persisted(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test compiled code is saved and loaded from storage."""
+    template_string = "{{ states('sensor.persisted') | int + 1 }}"
+    hass.states.async_set("sensor.persisted", "41")
+    template.TemplateEnvironment(hass).compile(template_string)
+    await hass.async_block_till_done()
+
+    with patch.object(template, "CODE_CACHE_SAVE_DELAY", 0):
+        template.TemplateEnvironment(hass, strict=True).compile(template_string)
+        await hass.async_block_till_done()
+        async_fire_time_changed(hass, dt_util.utcnow())
+        await hass.async_block_till_done()
+
+    data = hass_storage[template.CODE_CACHE_STORAGE_KEY]["data"]
+    assert data["fingerprint"] == template._code_cache_fingerprint()
+    assert len(data["code"]) == 2
+
+    # Simulate a restart
+    hass.data.pop(template._CODE_CACHE)
+    await template.async_load_code_cache(hass)
+    env = template.TemplateEnvironment(hass)
+    with patch.object(
+        jinja2.sandbox.ImmutableSandboxedEnvironment, "compile"
+    ) as mock_compile:
+        tpl = template.Template(template_string, hass)
+        tpl._compiled_code = env.compile(template_string)
+        assert tpl.async_render() == 42
+    assert not mock_compile.called
+    assert env.compile_stats["disk_hits"] == 1
+    assert template.async_get_compile_stats(hass)["code_cache"] == {
+        "hits": 1,
+        "misses": 0,
+    }
+
+
+async def test_code_cache_keeps_most_recently_used(hass: HomeAssistant) -> None:
+    """Test only the most recently used compiled code is saved."""
+    hass.data.pop(template._CODE_CACHE, None)
+    with patch.object(template, "COMPILED_CODE_LRU_SIZE", 2):
+        code_cache = template._get_code_cache(hass)
+    code = compile("1", "<template>", "eval")
+    code_cache.add("default", "a", code)
+    code_cache.add("default", "b", code)
+    assert code_cache.get("default", "a") == code
+    code_cache.add("default", "c", code)
+
+    data = code_cache._data_to_save()
+    assert set(data["code"]) == {
+        template.TemplateCodeCache._key("default", "a"),
+        template.TemplateCodeCache._key("default", "c"),
+    }
+    # The saved data is a snapshot of the cache
+    code_cache.add("default", "d", code)
+    assert len(data["code"]) == 2
+    assert template.TemplateCodeCache._key("default", "d") not in data["code"]
+    await hass.async_block_till_done()
+
+
+async def test_code_cache_invalidated_by_version(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test the code cache is ignored when saved by another version."""
+    template_string = "{{ 1 + 1 }}"
+    key = template.TemplateCodeCache._key("default", template_string)
+    hass_storage[template.CODE_CACHE_STORAGE_KEY] = {
+        "version": template.CODE_CACHE_STORAGE_VERSION,
+        "key": template.CODE_CACHE_STORAGE_KEY,
+        "data": {"fingerprint": "2000.1.0-0000-0.0", "code": {key: "invalid"}},
+    }
+    await template.async_load_code_cache(hass)
+
+    env = template.TemplateEnvironment(hass)
+    env.compile(template_string)
+    assert env.compile_stats["disk_hits"] == 0
+    assert env.compile_stats["misses"] == 1
+
+
 def test_is_template_string() -> None:
     """Test is template string."""
     assert template.is_template_string("{{ x }}") is True
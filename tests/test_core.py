@@ -180,7 +180,7 @@ def test_async_create_task_schedule_coroutine_with_name(event_loop) -> None:
 
 def test_async_run_hass_job_calls_callback() -> None:
     """Test that the callback annotation is respected."""
-    hass = MagicMock()
+    hass = MagicMock(job_runner=None)
     calls = []
 
     def job():
@@ -796,6 +796,147 @@ async def test_eventbus_filtered_listener(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_keyed_listener(hass: HomeAssistant) -> None:
+    """Test keyed listeners only receive events matching their keys."""
+    calls = []
+    other_calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    @ha.callback
+    def other_listener(event):
+        """Mock listener."""
+        other_calls.append(event)
+
+    unsub = hass.bus.async_listen_keyed(
+        "test", "entity_id", ["light.kitchen", "light.hall"], listener
+    )
+    unsub_other = hass.bus.async_listen_keyed(
+        "test", "entity_id", ["light.hall"], other_listener, run_immediately=True
+    )
+    assert hass.bus.async_listeners()["test"] == 3
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    hass.bus.async_fire("test", {"entity_id": "light.hall"})
+    hass.bus.async_fire("test", {"entity_id": "light.other"})
+    hass.bus.async_fire("test", {"other": "light.kitchen"})
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+
+    assert [event.data["entity_id"] for event in calls] == [
+        "light.kitchen",
+        "light.hall",
+    ]
+    assert [event.data["entity_id"] for event in other_calls] == ["light.hall"]
+
+    unsub()
+    hass.bus.async_fire("test", {"entity_id": "light.hall"})
+    await hass.async_block_till_done()
+
+    assert len(calls) == 2
+    assert len(other_calls) == 2
+
+    unsub_other()
+    assert "test" not in hass.bus.async_listeners()
+
+
+async def test_eventbus_keyed_listener_list_and_unhashable_values(
+    hass: HomeAssistant,
+) -> None:
+    """Test keyed listeners with list and unhashable event data values."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    hass.bus.async_listen_keyed(
+        "test", "entity_id", ["light.kitchen", "light.hall"], listener
+    )
+
+    hass.bus.async_fire("test", {"entity_id": ["light.kitchen", "light.hall"]})
+    hass.bus.async_fire("test", {"entity_id": [{"unhashable": True}, "light.hall"]})
+    hass.bus.async_fire("test", {"entity_id": ["light.other"]})
+    hass.bus.async_fire("test", {"entity_id": {"light.kitchen": True}})
+    await hass.async_block_till_done()
+
+    assert [event.data["entity_id"] for event in calls] == [
+        ["light.kitchen", "light.hall"],
+        [{"unhashable": True}, "light.hall"],
+    ]
+
+
+async def test_eventbus_dispatch_cache_only_has_listened_types(
+    hass: HomeAssistant,
+) -> None:
+    """Test event types without listeners are not cached."""
+    unsub = hass.bus.async_listen("test_listened", Mock())
+    for num in range(10):
+        hass.bus.async_fire(f"test_not_listened_{num}")
+    hass.bus.async_fire("test_listened")
+
+    assert "test_listened" in hass.bus._dispatch_cache
+    assert not any(
+        event_type.startswith("test_not_listened")
+        for event_type in hass.bus._dispatch_cache
+    )
+
+    unsub()
+    assert "test_listened" not in hass.bus._dispatch_cache
+
+
+async def test_eventbus_keyed_listener_match_all(hass: HomeAssistant) -> None:
+    """Test keyed listeners can not listen to all events."""
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen_keyed(MATCH_ALL, "entity_id", ["light.kitchen"], Mock())
+
+
+async def test_eventbus_listeners_change_while_firing(hass: HomeAssistant) -> None:
+    """Test listeners added or removed while dispatching apply to the next event."""
+    calls = []
+    unsub_late = None
+
+    @ha.callback
+    def late_listener(event):
+        """Mock listener added during dispatch."""
+        calls.append(("late", event.data["idx"]))
+
+    @ha.callback
+    def listener(event):
+        """Mock listener that subscribes and unsubscribes others."""
+        nonlocal unsub_late
+        calls.append(("listener", event.data["idx"]))
+        if event.data["idx"] == 1:
+            unsub_late = hass.bus.async_listen("test", late_listener)
+        elif event.data["idx"] == 2:
+            unsub_late()
+
+    @ha.callback
+    def match_all_listener(event):
+        """Mock match all listener."""
+        calls.append(("all", event.data.get("idx")))
+
+    hass.bus.async_listen("test", listener, run_immediately=True)
+    hass.bus.async_fire("test", {"idx": 1})
+    unsub_all = hass.bus.async_listen(MATCH_ALL, match_all_listener)
+    hass.bus.async_fire("test", {"idx": 2})
+    unsub_all()
+    hass.bus.async_fire("test", {"idx": 3})
+    await hass.async_block_till_done()
+
+    assert calls == [
+        ("listener", 1),
+        ("listener", 2),
+        ("listener", 3),
+        ("all", 2),
+        ("late", 2),
+    ]
+
+
 async def test_eventbus_run_immediately(hass: HomeAssistant) -> None:
     """Test we can call events immediately."""
     calls = []
@@ -814,6 +955,40 @@ async def test_eventbus_run_immediately(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_job_runner(hass: HomeAssistant) -> None:
+    """Test callback jobs are run by the job runner when set."""
+    calls = []
+    runs = []
+
+    @ha.callback
+    def listener(*args):
+        """Mock listener."""
+        calls.append(args)
+
+    @ha.callback
+    def job_runner(job, args):
+        """Mock job runner."""
+        runs.append(job.target)
+        job.target(*args)
+
+    hass.job_runner = job_runner
+    hass.bus.async_listen("test_immediately", listener, run_immediately=True)
+    hass.bus.async_listen("test", listener)
+    hass.bus.async_fire("test_immediately")
+    hass.bus.async_fire("test")
+    hass.async_run_hass_job(ha.HassJob(listener), 1)
+    hass.async_add_hass_job(ha.HassJob(listener), 2)
+    await hass.async_block_till_done()
+
+    assert runs == [listener] * 4
+    assert len(calls) == 4
+
+    hass.job_runner = None
+    hass.async_run_hass_job(ha.HassJob(listener), 3)
+    assert len(runs) == 4
+    assert len(calls) == 5
+
+
 async def test_eventbus_unsubscribe_listener(hass: HomeAssistant) -> None:
     """Test unsubscribe listener from returned function."""
     calls = []
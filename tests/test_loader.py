@@ -1,14 +1,26 @@
 """Test to verify that we can load components."""
+import asyncio
+from datetime import timedelta
+import pathlib
+import sys
+from typing import Any
 from unittest.mock import patch
 
 import pytest
 
 from homeassistant import loader
-from homeassistant.components import http, hue
+from homeassistant.components import http, hue, template
 from homeassistant.components.hue import light as hue_light
+from homeassistant.const import __version__
 from homeassistant.core import HomeAssistant, callback
+import homeassistant.util.dt as dt_util
 
-from .common import MockModule, async_get_persistent_notifications, mock_integration
+from .common import (
+    MockModule,
+    async_fire_time_changed,
+    async_get_persistent_notifications,
+    mock_integration,
+)
 
 
 async def test_component_dependencies(hass: HomeAssistant) -> None:
@@ -726,3 +738,236 @@ async def test_loggers(hass: HomeAssistant) -> None:
         },
     )
     assert integration.loggers == ["name1", "name2"]
+
+
+async def test_preimport_integrations_dependency_order(hass: HomeAssistant) -> None:
+    """Test integrations are imported after the integrations they depend on."""
+    integrations = {
+        name: loader.Integration(
+            hass,
+            f"homeassistant.components.{name}",
+            None,
+            {
+                "name": name,
+                "domain": name,
+                "dependencies": dependencies,
+                "after_dependencies": after_dependencies,
+                "requirements": [],
+            },
+        )
+        for name, dependencies, after_dependencies in (
+            ("mod3", ["mod2"], ["mod1", "not_loaded"]),
+            ("mod2", ["mod1"], []),
+            ("mod1", [], []),
+            ("mod4", [], []),
+        )
+    }
+    imported: list[str] = []
+
+    def mock_preimport(self: loader.Integration) -> timedelta:
+        imported.append(self.domain)
+        return timedelta(seconds=len(imported))
+
+    with patch.object(loader.Integration, "preimport", mock_preimport):
+        await loader.async_preimport_integrations(hass, integrations)
+
+    assert imported.index("mod1") < imported.index("mod2") < imported.index("mod3")
+    assert set(imported) == {"mod1", "mod2", "mod3", "mod4"}
+    assert set(hass.data[loader.DATA_IMPORT_TIME]) == {"mod1", "mod2", "mod3", "mod4"}
+    assert not hass.data[loader.DATA_PREIMPORT]
+
+
+async def test_wait_preimport(hass: HomeAssistant) -> None:
+    """Test setup waits for running imports and takes queued ones off the queue."""
+    integrations = {
+        name: loader.Integration(
+            hass,
+            f"homeassistant.components.{name}",
+            None,
+            {
+                "name": name,
+                "domain": name,
+                "dependencies": dependencies,
+                "requirements": [],
+            },
+        )
+        for name, dependencies in (("mod2", ["mod1"]), ("mod1", []))
+    }
+    imported: list[str] = []
+
+    def mock_preimport(self: loader.Integration) -> timedelta | None:
+        imported.append(self.domain)
+        return None
+
+    with patch.object(loader.Integration, "preimport", mock_preimport):
+        task = hass.async_create_task(
+            loader.async_preimport_integrations(hass, integrations)
+        )
+        await asyncio.sleep(0)
+        assert hass.data[loader.DATA_PREIMPORT]["mod2"] is None
+        await loader.async_wait_preimport(hass, "mod2")
+        await loader.async_wait_preimport(hass, "mod1")
+        assert imported == ["mod1"]
+        await task
+
+    # The setup of mod2 imports it
+    assert imported == ["mod1"]
+    # Failed imports are timed by the setup of the integration
+    assert not hass.data[loader.DATA_IMPORT_TIME]
+    assert not hass.data[loader.DATA_PREIMPORT]
+
+
+async def test_preimport_integrations(hass: HomeAssistant) -> None:
+    """Test integrations are imported with their platforms ahead of setup."""
+    integrations = await loader.async_get_integrations(
+        hass, ["template", "not_existing"]
+    )
+    integrations["not_existing"] = loader.Integration(
+        hass,
+        "homeassistant.components.not_existing",
+        None,
+        {"name": "Not existing", "domain": "not_existing", "requirements": []},
+    )
+    sys.modules.pop("homeassistant.components.template.sensor", None)
+
+    await loader.async_preimport_integrations(hass, integrations)
+
+    assert "homeassistant.components.template.sensor" in sys.modules
+    assert set(hass.data[loader.DATA_IMPORT_TIME]) == {"template"}
+    with pytest.raises(ImportError):
+        integrations["not_existing"].get_component()
+    assert "not_existing" not in hass.data[loader.DATA_IMPORT_TIME]
+
+
+async def test_manifest_cache(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test manifests are read from the cache while the file is unchanged."""
+    manifest_path = pathlib.Path(template.__file__).parent / "manifest.json"
+    manifest_stat = manifest_path.stat()
+    cached_manifest = {
+        "domain": "template",
+        "name": "Cached Template",
+        "dependencies": [],
+        "requirements": [],
+    }
+    hass_storage[loader.MANIFEST_CACHE_STORAGE_KEY] = {
+        "version": loader.MANIFEST_CACHE_STORAGE_VERSION,
+        "minor_version": 1,
+        "key": loader.MANIFEST_CACHE_STORAGE_KEY,
+        "data": {
+            "ha_version": __version__,
+            "manifests": {
+                str(manifest_path): [
+                    manifest_stat.st_mtime_ns,
+                    manifest_stat.st_size,
+                    cached_manifest,
+                ]
+            },
+        },
+    }
+    hass.data[loader.DATA_MANIFEST_CACHE] = loader.ManifestCache(hass)
+    integration = await loader.async_get_integration(hass, "template")
+    assert integration.name == "Cached Template"
+    assert integration.is_built_in
+    assert "is_built_in" not in cached_manifest
+
+    # A manifest that changed is read from disk and saved
+    hass.data[loader.DATA_INTEGRATIONS].pop("template")
+    hass.data[loader.DATA_MANIFEST_CACHE] = loader.ManifestCache(hass)
+    hass_storage[loader.MANIFEST_CACHE_STORAGE_KEY]["data"]["manifests"][
+        str(manifest_path)
+    ][1] += 1
+    integration = await loader.async_get_integration(hass, "template")
+    assert integration.name == "Template"
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=loader.MANIFEST_CACHE_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+    cached = hass_storage[loader.MANIFEST_CACHE_STORAGE_KEY]["data"]["manifests"]
+    assert cached[str(manifest_path)][:2] == [
+        manifest_stat.st_mtime_ns,
+        manifest_stat.st_size,
+    ]
+    assert cached[str(manifest_path)][2]["name"] == "Template"
+
+
+async def test_manifest_cache_discarded_on_update(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test the manifest cache of another version is not used."""
+    manifest_path = pathlib.Path(template.__file__).parent / "manifest.json"
+    manifest_stat = manifest_path.stat()
+    hass_storage[loader.MANIFEST_CACHE_STORAGE_KEY] = {
+        "version": loader.MANIFEST_CACHE_STORAGE_VERSION,
+        "minor_version": 1,
+        "key": loader.MANIFEST_CACHE_STORAGE_KEY,
+        "data": {
+            "ha_version": "2023.1.0",
+            "manifests": {
+                str(manifest_path): [
+                    manifest_stat.st_mtime_ns,
+                    manifest_stat.st_size,
+                    {"domain": "template", "name": "Cached Template"},
+                ]
+            },
+        },
+    }
+    hass.data[loader.DATA_MANIFEST_CACHE] = loader.ManifestCache(hass)
+    integration = await loader.async_get_integration(hass, "template")
+    assert integration.name == "Template"
+
+
+async def test_manifest_cache_drops_removed_integrations(
+    hass: HomeAssistant, hass_storage: dict[str, Any], tmp_path: pathlib.Path
+) -> None:
+    """Test manifests of integrations that were removed are dropped."""
+    manifest_path = pathlib.Path(template.__file__).parent / "manifest.json"
+    manifest_stat = manifest_path.stat()
+    removed_path = tmp_path / "removed" / "manifest.json"
+    hass_storage[loader.MANIFEST_CACHE_STORAGE_KEY] = {
+        "version": loader.MANIFEST_CACHE_STORAGE_VERSION,
+        "minor_version": 1,
+        "key": loader.MANIFEST_CACHE_STORAGE_KEY,
+        "data": {
+            "ha_version": __version__,
+            "manifests": {
+                str(manifest_path): [
+                    manifest_stat.st_mtime_ns,
+                    manifest_stat.st_size,
+                    {"domain": "template", "name": "Cached Template"},
+                ],
+                str(removed_path): [1, 1, {"domain": "removed", "name": "Removed"}],
+            },
+        },
+    }
+    hass.data[loader.DATA_MANIFEST_CACHE] = loader.ManifestCache(hass)
+    integration = await loader.async_get_integration(hass, "template")
+    assert integration.name == "Cached Template"
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=loader.MANIFEST_CACHE_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+    cached = hass_storage[loader.MANIFEST_CACHE_STORAGE_KEY]["data"]["manifests"]
+    assert list(cached) == [str(manifest_path)]
+
+
+async def test_manifest_cache_in_temporary_dir(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test test instances cache manifests outside of the config dir."""
+    store = hass.data[loader.DATA_MANIFEST_CACHE]._store
+    assert not store.path.startswith(hass.config.config_dir)
+
+    integration = await loader.async_get_integration(hass, "template")
+    assert integration.name == "Template"
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=loader.MANIFEST_CACHE_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+    manifest_path = pathlib.Path(template.__file__).parent / "manifest.json"
+    cached = hass_storage[loader.MANIFEST_CACHE_STORAGE_KEY]["data"]["manifests"]
+    assert cached[str(manifest_path)][2]["name"] == "Template"